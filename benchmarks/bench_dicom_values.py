@@ -0,0 +1,97 @@
+"""
+Benchmark converting DICOM datasets with `get_dicom_values` against the previous per-element implementation.
+
+Usage:
+    python benchmarks/bench_dicom_values.py [--files 200] [--values 500]
+
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pydicom
+from pydicom.dataset import Dataset
+from pydicom.multival import MultiValue
+from pydicom.uid import UID
+from pydicom.valuerep import PersonName, DSfloat, IS
+
+from dicompare.io import get_dicom_values
+
+def make_dataset(n_values, seed=0):
+    rng = np.random.default_rng(seed)
+    ds = Dataset()
+    ds.PatientName = "Test^Patient"
+    ds.ProtocolName = "T1 MPRAGE"
+    ds.SOPInstanceUID = pydicom.uid.generate_uid()
+    ds.EchoTime = 3.0
+    ds.ImageType = ["ORIGINAL", "PRIMARY", "M", "ND"]
+    ds.PixelSpacing = [0.5, 0.5]
+    ds.ImagePositionPatient = [float(value) for value in rng.normal(0, 100, 3).round(4)]
+    ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    # Long numeric vectors, as found in diffusion and multi-band headers
+    ds.add_new(0x00189089, "FD", [float(value) for value in rng.random(n_values)])
+    ds.add_new(0x00191029, "FD", [float(value) for value in rng.integers(0, 1000, n_values) * 2.5])
+    ds.add_new(0x00280106, "US", 0)
+    # Binary payloads, skipped by default
+    ds.EncapsulatedDocument = rng.bytes(200_000)
+    ds.add_new(0x00291010, "OB", rng.bytes(50_000))
+    return ds
+
+def legacy_get_dicom_values(ds):
+    """The per-element implementation used before VR-driven conversion, kept for comparison."""
+    dicom_dict = {}
+
+    def process_element(element):
+        if element.VR == 'SQ':
+            return [legacy_get_dicom_values(item) for item in element]
+        elif isinstance(element.value, MultiValue):
+            try:
+                return [int(float(item)) if int(float(item)) == float(item) else float(item) for item in element.value]
+            except ValueError:
+                return [item for item in element.value]
+        elif isinstance(element.value, (UID, PersonName)):
+            return str(element.value)
+        elif isinstance(element.value, (DSfloat, float)):
+            return float(element.value)
+        elif isinstance(element.value, (IS, int)):
+            return int(element.value)
+        else:
+            return str(element.value)[:50]
+
+    for element in ds:
+        if element.tag == 0x7fe00010:  # skip pixel data
+            continue
+        dicom_dict[element.keyword] = process_element(element)
+
+    return dicom_dict
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DICOM value conversion.")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--values", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    datasets = [make_dataset(args.values, seed) for seed in range(args.files)]
+
+    for ds in datasets:
+        assert get_dicom_values(ds, include_binary=True) == legacy_get_dicom_values(ds)
+
+    vr_stats = {}
+    for ds in datasets:
+        get_dicom_values(ds, vr_stats=vr_stats)
+    print(f"{args.files} datasets, {args.values} values per vector")
+    for vr, stats in sorted(vr_stats.items(), key=lambda item: -item[1]["seconds"]):
+        print(f"{vr:>8}: {stats['count']:6d} elements {stats['seconds'] * 1000:9.1f} ms")
+
+    for name, func in [
+        ("legacy", legacy_get_dicom_values),
+        ("binary", lambda ds: get_dicom_values(ds, include_binary=True)),
+        ("vr", get_dicom_values),
+    ]:
+        seconds = min(timeit.repeat(lambda: [func(ds) for ds in datasets], number=1, repeat=args.repeat))
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark expanding enhanced multi-frame files into per-frame rows against building one dictionary per frame.
+
+Usage:
+    python benchmarks/bench_frames.py [--frames 2000] [--echoes 4]
+
+"""
+
+import argparse
+import timeit
+
+import pandas as pd
+
+from dicompare.io import get_dicom_values, get_frame_values, load_dicom_session
+
+from synthetic_session import make_enhanced_dataset, to_bytes
+
+def legacy_frame_rows(ds):
+    """One dictionary per frame built from nested `get_dicom_values` output, for comparison."""
+    shared = {}
+    for group in get_dicom_values(ds.SharedFunctionalGroupsSequence[0]).values():
+        shared.update(group[0])
+    rows = []
+    for frame in ds.PerFrameFunctionalGroupsSequence:
+        row = dict(shared)
+        for group in get_dicom_values(frame).values():
+            row.update(group[0])
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def frame_rows(ds):
+    shared_values, frame_values = get_frame_values(ds)
+    frame_df = pd.DataFrame(frame_values)
+    for keyword, value in shared_values.items():
+        frame_df[keyword] = value
+    return frame_df
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-frame expansion.")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--echoes", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ds = make_enhanced_dataset(args.frames, args.echoes)
+    dicom_bytes = to_bytes(ds)
+
+    new = frame_rows(ds)
+    old = legacy_frame_rows(ds)
+    for keyword in ["EffectiveEchoTime", "InStackPositionNumber", "RepetitionTime", "FlipAngle"]:
+        assert new[keyword].tolist() == old[keyword].tolist()
+    assert [tuple(value) for value in new["FrameType"]] == [tuple(value) for value in old["FrameType"]]
+
+    print(f"{args.frames} frames, {args.echoes} echoes")
+    for name, func in [
+        ("legacy", lambda: legacy_frame_rows(ds)),
+        ("columns", lambda: frame_rows(ds)),
+        ("file", lambda: load_dicom_session(dicom_bytes={"enhanced.dcm": dicom_bytes})),
+        ("expand", lambda: load_dicom_session(dicom_bytes={"enhanced.dcm": dicom_bytes}, frames="expand")),
+        ("runs", lambda: load_dicom_session(dicom_bytes={"enhanced.dcm": dicom_bytes}, frames="runs")),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark the import time of the package and of each console entry point, as reported by `python -X importtime`.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 5]
+
+"""
+
+import sys
+import argparse
+import subprocess
+
+ENTRY_POINTS = {
+    "package": "dicompare",
+    "dicompare": "dicompare.cli.start_web",
+    "gen": "dicompare.cli.gen_session",
+    "check": "dicompare.cli.check_session",
+    "batch": "dicompare.cli.check_batch",
+    "serve": "dicompare.cli.serve",
+}
+
+# Modules that must not be loaded by importing the package alone or opening the web interface
+HEAVY_MODULES = ["pandas", "pydicom", "scipy", "tabulate", "curses"]
+
+def import_time(module):
+    """Return the cumulative import time of `module` in seconds and the top-level modules it loaded."""
+    code = f"import sys, {module}; print(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    # Each line is `import time: self [us] | cumulative | name`; the module itself is reported last
+    last = [line for line in result.stderr.splitlines() if line.startswith("import time:")][-1]
+    assert last.split("|")[-1].strip() == module
+    return int(last.split("|")[1]) / 1e6, set(result.stdout.split())
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the import time of each entry point.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, module in ENTRY_POINTS.items():
+        seconds, loaded = zip(*(import_time(module) for _ in range(args.repeat)))
+        if name in ("package", "dicompare"):
+            assert not loaded[0].intersection(HEAVY_MODULES), loaded[0].intersection(HEAVY_MODULES)
+        print(f"{name:>8}: {min(seconds) * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark `check_session_compliance_with_json_reference` against the previous per-series implementation.
+
+Usage:
+    python benchmarks/bench_json_compliance.py [--acquisitions 20] [--series 20] [--slices 50]
+
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from dicompare.compliance import check_session_compliance_with_json_reference
+
+def make_session(n_acquisitions, n_series, n_slices, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for a in range(n_acquisitions):
+        for s in range(n_series):
+            echo_time = round(float(rng.uniform(2, 40)), 2)
+            for i in range(n_slices):
+                rows.append({
+                    "Acquisition": f"acq-{a}",
+                    "Series": f"Series {s + 1}",
+                    "InstanceNumber": i + 1,
+                    "EchoTime": echo_time,
+                    "RepetitionTime": 20.0 + a,
+                    "FlipAngle": 15.0,
+                    "SeriesDescription": f"series-{a}-{s}",
+                    "ImageType": ("ORIGINAL", "PRIMARY", "M" if s % 2 else "P"),
+                })
+    return pd.DataFrame(rows)
+
+def make_reference(in_session, seed=1):
+    rng = np.random.default_rng(seed)
+    acquisitions = {}
+    first_rows = in_session.drop_duplicates(["Acquisition", "Series"])
+    for _, row in first_rows.iterrows():
+        acq = acquisitions.setdefault(row["Acquisition"], {"fields": [], "series": []})
+        flip = rng.random() < 0.1
+        acq["series"].append({
+            "name": row["Series"],
+            "fields": [
+                {"field": "EchoTime", "value": row["EchoTime"] + (0.5 if flip else 0.0), "tolerance": 0.1},
+                {"field": "RepetitionTime", "value": row["RepetitionTime"]},
+                {"field": "FlipAngle", "value": 20.0 if flip else 15.0},
+                {"field": "SeriesDescription", "value": row["SeriesDescription"] + ("x" if flip else "")},
+                {"field": "ImageType", "contains": "M"},
+                {"field": "MissingField", "value": 1.0},
+            ],
+        })
+    return {"acquisitions": acquisitions}
+
+def legacy_check_session_compliance_with_json_reference(in_session, ref_session, session_map):
+    """The per-series implementation used before the grouped engine, kept for comparison."""
+    compliance_summary = []
+
+    for (in_acq_name, in_series_name), (ref_acq_name, ref_series_name) in session_map.items():
+        in_acq_series = in_session[
+            (in_session["Acquisition"] == in_acq_name) & (in_session["Series"] == in_series_name)
+        ]
+        ref_acq = ref_session["acquisitions"].get(ref_acq_name, {})
+        ref_series = next((series for series in ref_acq.get("series", []) if series["name"] == ref_series_name), None)
+
+        for ref_field in ref_series.get("fields", []):
+            field_name = ref_field["field"]
+            expected_value = ref_field.get("value")
+            tolerance = ref_field.get("tolerance")
+            contains = ref_field.get("contains")
+            issue = {
+                "reference acquisition": (ref_acq_name, ref_series_name),
+                "input acquisition": (in_acq_name, in_series_name),
+                "field": field_name,
+                "passed": "❌",
+            }
+
+            if field_name not in in_acq_series.columns:
+                compliance_summary.append({**issue, "value": None, "rule": "Field must be present.", "message": "Field not found in input session."})
+                continue
+
+            actual_value = in_acq_series[field_name].iloc[0]
+            if contains is not None:
+                if not isinstance(actual_value, list) or contains not in actual_value:
+                    compliance_summary.append({**issue, "value": actual_value, "rule": "Field must contain value.", "message": f"Expected to contain {contains}, got {actual_value}."})
+            elif tolerance is not None and isinstance(actual_value, (int, float)):
+                if not (expected_value - tolerance <= actual_value <= expected_value + tolerance):
+                    compliance_summary.append({**issue, "value": actual_value, "rule": "Field must be within tolerance.", "message": f"Expected {expected_value} ± {tolerance}, got {actual_value}."})
+            elif expected_value is not None and actual_value != expected_value:
+                compliance_summary.append({**issue, "value": actual_value, "rule": "Field must match expected value.", "message": f"Expected {expected_value}, got {actual_value}."})
+
+    return compliance_summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON reference compliance checks.")
+    parser.add_argument("--acquisitions", type=int, default=20)
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--slices", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    in_session = make_session(args.acquisitions, args.series, args.slices)
+    ref_session = make_reference(in_session)
+    session_map = {
+        (acq, series): (acq, series)
+        for acq, series in in_session[["Acquisition", "Series"]].drop_duplicates().itertuples(index=False)
+    }
+
+    def key(issue):
+        return (issue["input acquisition"], issue["field"], issue["rule"], issue["message"])
+
+    new = check_session_compliance_with_json_reference(in_session, ref_session, session_map)
+    old = legacy_check_session_compliance_with_json_reference(in_session, ref_session, session_map)
+    assert [key(issue) for issue in new] == [key(issue) for issue in old], "Results differ from the legacy implementation"
+
+    print(f"{len(in_session)} rows, {len(session_map)} series, {len(new)} issues")
+    for name, func in [("legacy", legacy_check_session_compliance_with_json_reference), ("grouped", check_session_compliance_with_json_reference)]:
+        seconds = min(timeit.repeat(lambda: func(in_session, ref_session, session_map), number=1, repeat=args.repeat))
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark labelling acquisitions in `load_dicom_session` against the previous groupby/apply implementation.
+
+Usage:
+    python benchmarks/bench_label_acquisitions.py [--rows 50000] [--acquisitions 40]
+
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from dicompare.io import _label_acquisitions
+from dicompare.utils import clean_string
+
+def make_session(n_rows, n_acquisitions, seed=0):
+    rng = np.random.default_rng(seed)
+    protocols = np.array([f"T1 MPRAGE ({a})" if a % 2 else f"qsm_p2_{a}" for a in range(n_acquisitions)], dtype=object)
+    protocol_names = protocols[rng.integers(0, n_acquisitions, n_rows)]
+    protocol_names[rng.random(n_rows) < 0.001] = None
+    return pd.DataFrame({
+        "ProtocolName": protocol_names,
+        "SeriesNumber": rng.integers(1, 4, n_rows),
+        "InstanceNumber": rng.permutation(n_rows) + 1,
+        "EchoTime": rng.choice([5.0, 10.0, 15.0], n_rows),
+        "DICOM_Path": [f"/data/{i}.dcm" for i in range(n_rows)],
+        "ImageType": [("ORIGINAL", "PRIMARY", "M")] * n_rows,
+    })
+
+def legacy_label_acquisitions(session_df, acquisition_fields):
+    """The groupby/apply implementation used before the single-pass labeler, kept for comparison."""
+    if "InstanceNumber" in session_df.columns:
+        session_df.sort_values("InstanceNumber", inplace=True)
+    elif "DICOM_Path" in session_df.columns:
+        session_df.sort_values("DICOM_Path", inplace=True)
+
+    if acquisition_fields:
+        session_df = session_df.groupby(acquisition_fields).apply(lambda x: x.reset_index(drop=True))
+
+    def clean_acquisition_values(row):
+        return "-".join(str(val) if pd.notnull(val) else "NA" for val in row)
+
+    session_df["Acquisition"] = (
+        "acq-"
+        + session_df[acquisition_fields]
+        .apply(clean_acquisition_values, axis=1)
+        .apply(clean_string)
+    )
+    return session_df
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark acquisition labelling.")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--acquisitions", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    session_df = make_session(args.rows, args.acquisitions)
+    acquisition_fields = ["ProtocolName", "SeriesNumber"]
+
+    new = _label_acquisitions(session_df.copy(), acquisition_fields)
+    old = legacy_label_acquisitions(session_df.copy(), acquisition_fields)
+    pd.testing.assert_frame_equal(new, old)
+
+    print(f"{len(session_df)} rows, {new['Acquisition'].nunique()} acquisitions")
+    for name, func in [("legacy", legacy_label_acquisitions), ("ngroup", _label_acquisitions)]:
+        seconds = min(timeit.repeat(lambda: func(session_df.copy(), acquisition_fields), number=1, repeat=args.repeat))
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark the bit-parallel `levenshtein_distance` and the capped, memoized kernel used by
+`calculate_field_score` against the previous dynamic programming implementation.
+
+Usage:
+    python benchmarks/bench_levenshtein.py [--pairs 2000] [--length 40] [--distinct 200]
+
+"""
+
+import argparse
+import random
+import timeit
+
+from dicompare.mapping import MAX_DIFF_SCORE, levenshtein_distance, capped_levenshtein_distance
+
+def legacy_levenshtein_distance(s1, s2):
+    """The dynamic programming implementation used before the bit-parallel kernel, kept for comparison."""
+    if len(s1) < len(s2):
+        return legacy_levenshtein_distance(s2, s1)
+
+    previous_row = range(len(s2) + 1)
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+def make_pairs(n_pairs, length, n_distinct, seed=0):
+    """Series-description-like strings; pairs are drawn from a small pool so that they repeat, as in mapping."""
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz_0123456789"
+    pool = []
+    for _ in range(n_distinct):
+        base = "".join(rng.choice(alphabet) for _ in range(rng.randint(length // 2, length)))
+        pool.append(base)
+        # Near-duplicates, as found between the series of an acquisition
+        pool.append(base[:-2] + "".join(rng.choice(alphabet) for _ in range(2)))
+    return [(rng.choice(pool), rng.choice(pool)) for _ in range(n_pairs)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Levenshtein distance kernels.")
+    parser.add_argument("--pairs", type=int, default=2000)
+    parser.add_argument("--length", type=int, default=40)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.pairs, args.length, args.distinct)
+    for s1, s2 in pairs:
+        expected = legacy_levenshtein_distance(s1, s2)
+        assert levenshtein_distance(s1, s2) == expected, (s1, s2)
+        assert capped_levenshtein_distance(s1, s2) == min(expected, MAX_DIFF_SCORE), (s1, s2)
+
+    def run_uncached():
+        capped_levenshtein_distance.cache_clear()
+        for s1, s2 in pairs:
+            capped_levenshtein_distance(s1, s2)
+
+    print(f"{len(pairs)} pairs of up to {args.length} characters")
+    for name, func in [
+        ("legacy", lambda: [legacy_levenshtein_distance(s1, s2) for s1, s2 in pairs]),
+        ("bit-parallel", lambda: [levenshtein_distance(s1, s2) for s1, s2 in pairs]),
+        ("capped", run_uncached),
+        ("memoized", lambda: [capped_levenshtein_distance(s1, s2) for s1, s2 in pairs]),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:>12}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark `map_to_json_reference` against the previous cell-by-cell implementation.
+
+Usage:
+    python benchmarks/bench_mapping.py [--acquisitions 20] [--series 10] [--slices 20]
+
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+from dicompare.mapping import calculate_field_score, map_to_json_reference
+
+def make_session(n_acquisitions, n_series, n_slices, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for a in range(n_acquisitions):
+        repetition_time = float(rng.choice([8.0, 20.0, 2300.0, 5000.0]))
+        for s in range(n_series):
+            echo_time = round(float(rng.uniform(2, 40)), 2)
+            for i in range(n_slices):
+                rows.append({
+                    "Acquisition": f"acq-protocol{a}",
+                    "Series": f"Series {s + 1}",
+                    "InstanceNumber": i + 1,
+                    "EchoTime": echo_time,
+                    "RepetitionTime": repetition_time,
+                    "FlipAngle": 15.0,
+                    # Varies within the series, so it is ambiguous
+                    "SliceLocation": float(i),
+                    "SeriesDescription": f"protocol{a}_{'mag' if s % 2 else 'phase'}",
+                    "ImageType": ("ORIGINAL", "PRIMARY", "M" if s % 2 else "P"),
+                })
+    return pd.DataFrame(rows)
+
+def make_reference(in_session, seed=1):
+    """One reference series per input series, with perturbed values so that the mapping is not trivial."""
+    rng = np.random.default_rng(seed)
+    acquisitions = {}
+    first_rows = in_session.drop_duplicates(["Acquisition", "Series"])
+    for _, row in first_rows.iterrows():
+        acq = acquisitions.setdefault(row["Acquisition"][len("acq-"):], {"fields": [], "series": []})
+        acq["series"].append({
+            "name": row["Series"],
+            "fields": [
+                {"field": "EchoTime", "value": row["EchoTime"] + float(rng.normal(0, 0.5)), "tolerance": 0.1},
+                {"field": "RepetitionTime", "value": row["RepetitionTime"]},
+                {"field": "FlipAngle", "value": 15.0},
+                {"field": "SliceLocation", "value": 0.0},
+                {"field": "SeriesDescription", "value": row["SeriesDescription"].replace("protocol", "prot")},
+                {"field": "ImageType", "value": list(row["ImageType"])},
+                {"field": "MissingField", "value": "x"},
+            ],
+        })
+    return {"acquisitions": acquisitions}
+
+def legacy_map_to_json_reference(in_session_df, ref_session):
+    """The cell-by-cell implementation used before the field-by-field cost matrix, kept for comparison."""
+    input_acquisition_series = sorted(in_session_df[["Acquisition", "Series"]].drop_duplicates().values.tolist())
+    reference_acquisitions = ref_session["acquisitions"]
+    reference_acquisition_series = sorted(
+        (ref_acq, series["name"]) for ref_acq, acq in reference_acquisitions.items() for series in acq.get("series", [])
+    )
+
+    cost_matrix = []
+    for in_acq, in_series in input_acquisition_series:
+        input_series_df = in_session_df[
+            (in_session_df["Acquisition"] == in_acq) & (in_session_df["Series"] == in_series)
+        ]
+        row = []
+        for ref_acq, ref_series in reference_acquisition_series:
+            ref_series_data = next(
+                series for series in reference_acquisitions[ref_acq]["series"] if series["name"] == ref_series
+            )
+            diff_score = 0.0
+            for ref_field in ref_series_data.get("fields", []):
+                field = ref_field["field"]
+                actual_value = None
+                if field in input_series_df.columns:
+                    actual_values = input_series_df[field].unique()
+                    if len(actual_values) == 1:
+                        actual_value = actual_values[0]
+                diff_score += calculate_field_score(
+                    ref_field.get("value"), actual_value, tolerance=ref_field.get("tolerance"), contains=ref_field.get("contains")
+                )
+            row.append(diff_score)
+        cost_matrix.append(row)
+
+    row_indices, col_indices = linear_sum_assignment(np.array(cost_matrix))
+    return {
+        tuple(input_acquisition_series[row]): tuple(reference_acquisition_series[col])
+        for row, col in zip(row_indices, col_indices)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mapping input series to a JSON reference.")
+    parser.add_argument("--acquisitions", type=int, default=20)
+    parser.add_argument("--series", type=int, default=10)
+    parser.add_argument("--slices", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    in_session = make_session(args.acquisitions, args.series, args.slices)
+    ref_session = make_reference(in_session)
+
+    new = map_to_json_reference(in_session, ref_session)
+    old = legacy_map_to_json_reference(in_session, ref_session)
+    assert new == old, "Mapping differs from the legacy implementation"
+
+    print(f"{len(in_session)} rows, {len(new)} input series x {len(new)} reference series")
+    for name, func in [("legacy", legacy_map_to_json_reference), ("staged", map_to_json_reference)]:
+        seconds = min(timeit.repeat(lambda: func(in_session, ref_session), number=1, repeat=args.repeat))
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
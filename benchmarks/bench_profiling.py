@@ -0,0 +1,44 @@
+"""
+Benchmark the cost of the profiling instrumentation when disabled and enabled.
+
+Usage:
+    python benchmarks/bench_profiling.py [--acquisitions 4] [--series 2] [--slices 50]
+
+"""
+
+import argparse
+import timeit
+
+from dicompare import profiling
+from dicompare.io import load_dicom_session
+
+from synthetic_session import make_session_bytes
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark profiling overhead.")
+    parser.add_argument("--acquisitions", type=int, default=4)
+    parser.add_argument("--series", type=int, default=2)
+    parser.add_argument("--slices", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    dicom_bytes = make_session_bytes(args.acquisitions, args.series, args.slices)
+
+    def profiled():
+        with profiling.profile():
+            return load_dicom_session(dicom_bytes=dicom_bytes)
+
+    assert profiled().equals(load_dicom_session(dicom_bytes=dicom_bytes))
+
+    n_calls = 1_000_000
+    seconds = timeit.timeit(lambda: profiling.span("noop").__enter__(), number=n_calls)
+    print(f"{len(dicom_bytes)} files; disabled span: {seconds / n_calls * 1e9:.0f} ns per call")
+    for name, func in [
+        ("disabled", lambda: load_dicom_session(dicom_bytes=dicom_bytes)),
+        ("enabled", profiled),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
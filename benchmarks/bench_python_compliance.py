@@ -0,0 +1,154 @@
+"""
+Benchmark `check_session_compliance_with_python_module` against the previous implementation,
+which masked and copied the session for every acquisition.
+
+Usage:
+    python benchmarks/bench_python_compliance.py [--acquisitions 10 20 40] [--slices 2000]
+
+"""
+
+import argparse
+import timeit
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dicompare import BaseValidationModel, ValidationError, validator
+from dicompare.compliance import check_session_compliance_with_python_module
+
+class QSMLikeModel(BaseValidationModel):
+    """Validators shaped like those of `guidelines/qsm/qsm.py`."""
+
+    @validator(["ImageType", "EchoTime"], rule_message="Each echo must have magnitude and phase.")
+    def validate_image_types(cls, value):
+        if value["Count"].nunique() > 1:
+            raise ValidationError("Echoes have different numbers of images.")
+        return value
+
+    @validator(["EchoTime"], rule_message="At least three echoes are required.")
+    def validate_echo_count(cls, value):
+        if len(value["EchoTime"].dropna().unique()) < 3:
+            raise ValidationError("Fewer than three echoes.")
+        return value
+
+    @validator(["EchoTime"], rule_message="Echoes must be uniformly spaced.")
+    def validate_echo_spacing(cls, value):
+        spacing = np.diff(value["EchoTime"].dropna().sort_values())
+        if len(spacing) and not np.allclose(spacing, spacing[0]):
+            raise ValidationError("Echo spacing is not uniform.")
+        return value
+
+    @validator(["EchoTime"], rule_message="The first echo time must be short.")
+    def validate_first_echo(cls, value):
+        if value["EchoTime"].min() > 10:
+            raise ValidationError("First echo time is too long.")
+        return value
+
+    @validator(["RepetitionTime", "FlipAngle"], rule_message="Flip angle must be near the Ernst angle.")
+    def validate_flip_angle(cls, value):
+        if not 5 <= value["FlipAngle"].iloc[0] <= 30:
+            raise ValidationError("Flip angle out of range.")
+        return value
+
+    @validator(["PixelSpacing", "SliceThickness"], rule_message="Voxels must be isotropic.")
+    def validate_voxels(cls, value):
+        if value["PixelSpacing"].iloc[0][0] != value["SliceThickness"].iloc[0]:
+            raise ValidationError("Voxels are not isotropic.")
+        return value
+
+def make_session(n_acquisitions, n_slices, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for a in range(n_acquisitions):
+        n_echoes = int(rng.integers(2, 6))
+        echo_times = np.arange(1, n_echoes + 1) * float(rng.choice([5.0, 6.5]))
+        frames.append(pd.DataFrame({
+            "Acquisition": f"acq-qsm{a}",
+            "EchoTime": np.repeat(echo_times, n_slices // n_echoes + 1)[:n_slices],
+            "ImageType": [("ORIGINAL", "PRIMARY", "M" if i % 2 else "P") for i in range(n_slices)],
+            "RepetitionTime": 30.0,
+            "FlipAngle": float(rng.choice([15.0, 40.0])),
+            "PixelSpacing": [(1.0, 1.0)] * n_slices,
+            "SliceThickness": float(rng.choice([1.0, 2.0])),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+def legacy_validate(model, data):
+    """`BaseValidationModel.validate` as it was before combination tables were shared."""
+    errors, passes = [], []
+    for acquisition in data["Acquisition"].unique():
+        acquisition_data = data[data["Acquisition"] == acquisition]
+        for field_names, validator_list in model._field_validators.items():
+            filtered_data = acquisition_data[list(field_names)].copy()
+            unique_combinations = filtered_data.groupby(list(field_names), dropna=False).size().reset_index(name="Count")
+            for validator_func in validator_list:
+                record = {
+                    "acquisition": acquisition,
+                    "field": ", ".join(field_names),
+                    "rule": validator_func._rule_message,
+                    "value": unique_combinations.to_dict(orient="list"),
+                }
+                try:
+                    validator_func(model, unique_combinations)
+                    passes.append({**record, "message": None, "passed": True})
+                except ValidationError as e:
+                    errors.append({**record, "message": e.message, "passed": False})
+    return len(errors) == 0, errors, passes
+
+def legacy_check_session_compliance_with_python_module(in_session, ref_models, session_map):
+    """The per-acquisition mask and copy used before partitioned execution, kept for comparison."""
+    compliance_summary = []
+    for ref_acq_name, in_acq_name in session_map.items():
+        in_acq = in_session[in_session["Acquisition"] == in_acq_name]
+        _, errors, passes = legacy_validate(ref_models[ref_acq_name](), in_acq.copy())
+        for result, passed in [(errors, "❌"), (passes, "✅")]:
+            for entry in result:
+                compliance_summary.append({
+                    "reference acquisition": ref_acq_name,
+                    "reference series": None,
+                    "input acquisition": in_acq_name,
+                    "input series": None,
+                    "field": entry["field"],
+                    "value": entry["value"],
+                    "rule": entry["rule"],
+                    "message": entry["message"],
+                    "passed": passed,
+                })
+    return compliance_summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Python module compliance checks.")
+    parser.add_argument("--acquisitions", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--slices", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=4, help="Threads for the executor variant.")
+    args = parser.parse_args()
+    executor = ThreadPoolExecutor(max_workers=args.threads)
+
+    for n_acquisitions in args.acquisitions:
+        in_session = make_session(n_acquisitions, args.slices)
+        ref_models = {f"qsm{a}": QSMLikeModel for a in range(n_acquisitions)}
+        session_map = {f"qsm{a}": f"acq-qsm{a}" for a in range(n_acquisitions)}
+
+        new = check_session_compliance_with_python_module(in_session, ref_models, session_map)
+        old = legacy_check_session_compliance_with_python_module(in_session, ref_models, session_map)
+        assert new == old, "Results differ from the legacy implementation"
+        timings = []
+        threaded = check_session_compliance_with_python_module(in_session, ref_models, session_map, executor=executor, timings=timings)
+        assert threaded == new, "Results differ when validators run on an executor"
+        slowest = max(timings, key=lambda timing: timing["seconds"])
+
+        print(f"{n_acquisitions} acquisitions, {len(in_session)} rows, {len(new)} results")
+        print(f"  slowest validator: {slowest['rule']} ({slowest['seconds'] * 1000:.2f} ms)")
+        for name, func in [
+            ("legacy", legacy_check_session_compliance_with_python_module),
+            ("partitioned", check_session_compliance_with_python_module),
+            ("threads", lambda *a: check_session_compliance_with_python_module(*a, executor=executor)),
+        ]:
+            seconds = min(timeit.repeat(lambda: func(in_session, ref_models, session_map), number=1, repeat=args.repeat))
+            print(f"{name:>12}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
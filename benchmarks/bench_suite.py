@@ -0,0 +1,102 @@
+"""
+pytest-benchmark suite of the main pipeline stages on synthetic sessions.
+
+Results depend on the machine, so compare two commits on the same one; CI does this for pull requests.
+
+Usage:
+    # Benchmark the reference commit, then another; fails if a median regresses by more than 25%
+    python -m pytest benchmarks/bench_suite.py --benchmark-save=base
+    python -m pytest benchmarks/bench_suite.py --benchmark-compare --benchmark-compare-fail=median:25%
+
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synthetic_session import (
+    make_enhanced_dataset, make_qsm_session_bytes, make_reference, make_session_bytes, to_bytes,
+)
+
+from dicompare.io import load_dicom_session, load_python_session, assign_series
+from dicompare.reference import compile_json_reference
+from dicompare.mapping import map_to_json_reference
+from dicompare.compliance import check_session_compliance_with_json_reference, check_session_compliance_with_python_module
+from dicompare.cli.gen_session import create_json_reference
+
+N_ACQUISITIONS, N_SERIES, N_SLICES = 16, 4, 8
+REFERENCE_FIELDS = ["EchoTime", "FlipAngle", "ProtocolName", "RepetitionTime", "SeriesDescription"]
+QSM_REFERENCE = os.path.join(os.path.dirname(__file__), "..", "dicompare", "tests", "fixtures", "ref_qsm.py")
+
+@pytest.fixture(scope="module")
+def session_bytes():
+    return make_session_bytes(N_ACQUISITIONS, N_SERIES, N_SLICES)
+
+@pytest.fixture(scope="module")
+def wide_session_bytes():
+    return make_session_bytes(2, 2, 10, extra_elements=1000)
+
+@pytest.fixture(scope="module")
+def qsm_session_bytes():
+    return make_qsm_session_bytes(n_echoes=4, n_slices=32)
+
+@pytest.fixture(scope="module")
+def enhanced_bytes():
+    return {"enhanced.dcm": to_bytes(make_enhanced_dataset(n_frames=1000, n_echoes=4))}
+
+@pytest.fixture(scope="module")
+def in_session(session_bytes):
+    in_session = load_dicom_session(dicom_bytes=session_bytes, fields=REFERENCE_FIELDS)
+    return assign_series(in_session, ["ProtocolName"], REFERENCE_FIELDS)
+
+@pytest.fixture(scope="module")
+def ref_session():
+    return compile_json_reference(make_reference(N_ACQUISITIONS, N_SERIES))
+
+def test_load_dicom_session(benchmark, session_bytes):
+    session_df = benchmark(load_dicom_session, dicom_bytes=session_bytes)
+    assert len(session_df) == N_ACQUISITIONS * N_SERIES * N_SLICES
+
+def test_load_dicom_session_fields(benchmark, session_bytes):
+    session_df = benchmark(load_dicom_session, dicom_bytes=session_bytes, fields=REFERENCE_FIELDS)
+    assert len(session_df) == N_ACQUISITIONS * N_SERIES * N_SLICES
+
+def test_load_dicom_session_wide(benchmark, wide_session_bytes):
+    session_df = benchmark(load_dicom_session, dicom_bytes=wide_session_bytes)
+    assert len(session_df) == len(wide_session_bytes)
+
+def test_load_dicom_session_qsm(benchmark, qsm_session_bytes):
+    session_df = benchmark(load_dicom_session, dicom_bytes=qsm_session_bytes)
+    assert session_df["EchoTime"].nunique() == 4
+
+def test_load_dicom_session_enhanced(benchmark, enhanced_bytes):
+    session_df = benchmark(load_dicom_session, dicom_bytes=enhanced_bytes, frames="expand")
+    assert len(session_df) == 1000
+
+def test_map_to_json_reference(benchmark, in_session, ref_session):
+    session_map = benchmark(map_to_json_reference, in_session, ref_session)
+    assert len(session_map) == N_ACQUISITIONS * N_SERIES
+
+def test_check_session_compliance_with_json_reference(benchmark, in_session, ref_session):
+    session_map = map_to_json_reference(in_session, ref_session)
+    compliance_summary = benchmark(check_session_compliance_with_json_reference, in_session, ref_session, session_map)
+    assert compliance_summary
+
+def test_check_session_compliance_with_python_module(benchmark, qsm_session_bytes):
+    ref_models = load_python_session(QSM_REFERENCE)
+    in_session = load_dicom_session(dicom_bytes=qsm_session_bytes)
+    compliance_summary = benchmark(check_session_compliance_with_python_module, in_session, ref_models, {"QSM": "acq-qsm"})
+    assert compliance_summary
+
+def test_create_json_reference(benchmark, in_session):
+    json_reference = benchmark.pedantic(
+        create_json_reference,
+        setup=lambda: ((in_session.copy(), REFERENCE_FIELDS), {}),
+        rounds=10,
+    )
+    assert len(json_reference["acquisitions"]) == N_ACQUISITIONS
@@ -0,0 +1,76 @@
+"""
+Benchmark `get_unique_combinations` against the previous per-column implementation.
+
+Usage:
+    python benchmarks/bench_unique_combinations.py [--rows 50000] [--columns 300]
+
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from dicompare.validation import get_unique_combinations, make_hashable
+
+def make_frame(n_rows, n_columns, seed=0):
+    rng = np.random.default_rng(seed)
+    echo = rng.integers(0, 5, n_rows)
+    columns = {
+        "EchoTime": echo * 5.0 + 5.0,
+        "ImageType": [("ORIGINAL", "PRIMARY", "M" if i % 2 else "P") for i in range(n_rows)],
+    }
+    for c in range(n_columns - len(columns)):
+        kind = c % 10
+        if kind < 7:
+            # Numeric fields, constant or varying within combinations
+            columns[f"Numeric{c}"] = echo * 2.0 if c % 3 else rng.normal(size=n_rows)
+        elif kind < 9:
+            columns[f"String{c}"] = np.where(echo % 2, "mag", "phase").astype(object)
+        else:
+            columns[f"List{c}"] = [[1.0, 1.0]] * n_rows
+    return pd.DataFrame(columns)
+
+def legacy_get_unique_combinations(data, fields):
+    """The per-column implementation used before the single grouping, kept for comparison."""
+    for col in data.columns:
+        data[col] = data[col].apply(make_hashable)
+    unique_combinations = data.groupby(fields, dropna=False).first().reset_index()
+    for col in data.columns:
+        if col not in fields:
+            if data.groupby(fields)[col].nunique(dropna=False).max() != 1:
+                unique_combinations[col] = None
+            else:
+                unique_combinations[col] = data.groupby(fields)[col].first().values
+    return unique_combinations
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark get_unique_combinations.")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--columns", type=int, default=300)
+    args = parser.parse_args()
+
+    data = make_frame(args.rows, args.columns)
+    fields = ["EchoTime", "ImageType"]
+
+    timings = {}
+    for name, func in [("legacy", legacy_get_unique_combinations), ("grouped", get_unique_combinations)]:
+        frame = data.copy()
+        start = time.perf_counter()
+        timings[name] = (func(frame, fields), time.perf_counter() - start)
+        if name == "legacy":
+            # The legacy implementation made the frame hashable in place, as load_dicom_session does
+            hashable_frame = frame
+
+    start = time.perf_counter()
+    timings["hashable"] = (get_unique_combinations(hashable_frame, fields), time.perf_counter() - start)
+
+    pd.testing.assert_frame_equal(timings["grouped"][0], timings["legacy"][0])
+    pd.testing.assert_frame_equal(timings["hashable"][0], timings["legacy"][0])
+    print(f"{args.rows} rows x {args.columns} columns, {len(timings['grouped'][0])} combinations")
+    for name, (_, seconds) in timings.items():
+        print(f"{name:>8}: {seconds * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
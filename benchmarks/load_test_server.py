@@ -0,0 +1,131 @@
+"""
+Load-test the compliance server (`dcm-serve`) with synthetic sessions, reporting requests per second and
+latency percentiles, against running `dcm-check-session` once per session.
+
+Usage:
+    python benchmarks/load_test_server.py [--workers 4] [--clients 8] [--requests 200] [--mode dir|upload]
+    python benchmarks/load_test_server.py --url http://127.0.0.1:8000 ...   # test an already running server
+
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import signal
+import socket
+import argparse
+import tempfile
+import subprocess
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from synthetic_session import make_reference, make_session_bytes, write_session
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(workers, root):
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "dicompare.cli.serve", "--port", str(port), "--workers", str(workers), "--root", root],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url + "/health").read()
+            return process, url
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("The server did not start.")
+
+def post(url, body):
+    start = time.perf_counter()
+    request = urllib.request.Request(url + "/check", data=body, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        result = json.loads(response.read())
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the compliance server.")
+    parser.add_argument("--url", help="URL of a running server. Defaults to starting one.")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes of the started server.")
+    parser.add_argument("--clients", type=int, default=8, help="Number of concurrent clients.")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=8, help="Number of distinct synthetic sessions.")
+    parser.add_argument("--mode", choices=["dir", "upload"], default="dir", help="Send session paths or uploaded files.")
+    parser.add_argument("--acquisitions", type=int, default=4)
+    parser.add_argument("--series", type=int, default=2)
+    parser.add_argument("--slices", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_ref = os.path.join(tmp_dir, "ref.json")
+        with open(json_ref, "w") as f:
+            json.dump(make_reference(args.acquisitions, args.series), f)
+
+        bodies = []
+        for seed in range(args.sessions):
+            request = {"json_ref": json_ref, "session": f"sub-{seed:02d}"}
+            if args.mode == "dir":
+                request["session_dir"] = os.path.join(tmp_dir, f"sub-{seed:02d}")
+                write_session(request["session_dir"], args.acquisitions, args.series, args.slices, seed=0)
+            else:
+                dicom_bytes = make_session_bytes(args.acquisitions, args.series, args.slices, seed=0)
+                request["files"] = {name: base64.b64encode(content).decode() for name, content in dicom_bytes.items()}
+            bodies.append(json.dumps(request).encode())
+        n_files = args.acquisitions * args.series * args.slices
+
+        process = None
+        url = args.url
+        if url is None:
+            process, url = start_server(args.workers, tmp_dir)
+        try:
+            # Warm up every worker: the first request of each loads the reference
+            expected = post(url, bodies[0])[1]["summary"]
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                list(executor.map(lambda body: post(url, body), bodies[:1] * args.workers))
+            warm_seconds = [post(url, bodies[0])[0] for _ in range(5)]
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.clients) as executor:
+                results = list(executor.map(lambda i: post(url, bodies[i % len(bodies)]), range(args.requests)))
+            elapsed = time.perf_counter() - start
+        finally:
+            if process is not None:
+                # Interrupt rather than terminate, so that the server shuts down its worker pool
+                process.send_signal(signal.SIGINT)
+                process.wait()
+
+        for _, result in results:
+            assert {**result["summary"], "session": expected["session"]} == expected
+
+        cli_seconds = []
+        if args.mode == "dir":
+            for request in map(json.loads, bodies[:3]):
+                start = time.perf_counter()
+                subprocess.run(
+                    [sys.executable, "-m", "dicompare.cli.check_session", "--json_ref", json_ref, "--in_session",
+                     request["session_dir"], "--auto_yes", "--out_json", os.path.join(tmp_dir, "out.json")],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+                )
+                cli_seconds.append(time.perf_counter() - start)
+
+    latencies = np.array([latency for latency, _ in results])
+    print(f"{args.requests} requests, {args.clients} clients, {n_files} files per session ({args.mode})")
+    print(f"{'req/s':>8}: {args.requests / elapsed:9.1f}")
+    for name, value in [("p50", np.percentile(latencies, 50)), ("p99", np.percentile(latencies, 99))]:
+        print(f"{name:>8}: {value * 1000:9.1f} ms")
+    print(f"{'warm':>8}: {min(warm_seconds) * 1000:9.1f} ms")
+    if cli_seconds:
+        print(f"{'cli':>8}: {min(cli_seconds) * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
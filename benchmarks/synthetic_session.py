@@ -0,0 +1,222 @@
+"""
+Generate synthetic DICOM sessions and matching JSON references for benchmarks.
+
+Layouts:
+    - N acquisitions x M series x K slices of single-frame MR images, optionally with wide headers
+      (many extra numeric and text elements, as in vendor private groups).
+    - Multi-echo QSM-like acquisitions: a magnitude and a phase series per echo.
+    - Enhanced multi-frame MR objects with shared and per-frame functional groups.
+
+Usage:
+    python benchmarks/synthetic_session.py OUT_DIR [--acquisitions 4] [--series 2] [--slices 20] [--extra_elements 0]
+
+"""
+
+import os
+import json
+import argparse
+from io import BytesIO
+
+import numpy as np
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, MRImageStorage, UID, generate_uid
+
+def make_file_meta(ds, sop_class_uid=MRImageStorage):
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.MediaStorageSOPClassUID = sop_class_uid
+    ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.SOPClassUID = sop_class_uid
+    ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+
+def add_pixel_data(ds, size=16):
+    ds.Rows = size
+    ds.Columns = size
+    ds.BitsAllocated = 16
+    ds.BitsStored = 12
+    ds.HighBit = 11
+    ds.PixelRepresentation = 0
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.PixelData = np.zeros((int(getattr(ds, "NumberOfFrames", 1)), size, size), dtype=np.uint16).tobytes()
+
+def add_extra_elements(ds, n_elements, seed=0):
+    """Add `n_elements` private elements to `ds`, alternating numeric vectors and short strings."""
+    rng = np.random.default_rng(seed)
+    ds.add_new(0x00190010, "LO", "SYNTHETIC")
+    for i in range(n_elements):
+        group, element = 0x0019 + 2 * (i // 0xFF), 0x1000 + i % 0xFF
+        if group != 0x0019 and i % 0xFF == 0:
+            ds.add_new((group << 16) | 0x0010, "LO", "SYNTHETIC")
+        if i % 2:
+            ds.add_new((group << 16) | element, "LO", f"value_{int(rng.integers(1000))}")
+        else:
+            ds.add_new((group << 16) | element, "FD", [float(value) for value in rng.random(8)])
+
+def make_dataset(acquisition, series, slice_index, seed=0, extra_elements=0):
+    """A minimal MR slice of the given acquisition and series; parameters are derived from `seed`."""
+    rng = np.random.default_rng([seed, acquisition])
+    ds = Dataset()
+    make_file_meta(ds)
+    ds.PatientName = "Synthetic^Subject"
+    ds.PatientID = f"sub-{seed:02d}"
+    ds.Modality = "MR"
+    ds.ProtocolName = f"protocol_{acquisition}"
+    ds.SeriesDescription = f"protocol_{acquisition}_series_{series}"
+    ds.SeriesNumber = acquisition * 10 + series + 1
+    ds.InstanceNumber = series * 1000 + slice_index + 1
+    ds.ImageType = ["ORIGINAL", "PRIMARY", "M" if series % 2 == 0 else "P", "ND"]
+    ds.RepetitionTime = round(float(rng.uniform(5, 3000)), 1)
+    ds.EchoTime = round(float(rng.uniform(2, 20)) * (series + 1), 2)
+    ds.FlipAngle = int(rng.integers(5, 90))
+    ds.SliceThickness = 1.0
+    ds.PixelSpacing = [0.5, 0.5]
+    ds.ImagePositionPatient = [-128.0, -128.0, float(slice_index)]
+    ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    ds.MagneticFieldStrength = 3
+    add_pixel_data(ds)
+    if extra_elements:
+        add_extra_elements(ds, extra_elements, seed=acquisition)
+    return ds
+
+def to_bytes(ds):
+    buffer = BytesIO()
+    ds.save_as(buffer, enforce_file_format=True)
+    return buffer.getvalue()
+
+def make_session_bytes(n_acquisitions=4, n_series=2, n_slices=20, seed=0, extra_elements=0):
+    """
+    Generate a session in memory.
+
+    Returns:
+        Dict[str, bytes]: File names and their content.
+    """
+    dicom_bytes = {}
+    for acquisition in range(n_acquisitions):
+        for series in range(n_series):
+            for slice_index in range(n_slices):
+                ds = make_dataset(acquisition, series, slice_index, seed, extra_elements)
+                dicom_bytes[f"acq-{acquisition}/series-{series}/{slice_index:04d}.dcm"] = to_bytes(ds)
+    return dicom_bytes
+
+def make_qsm_session_bytes(n_echoes=4, n_slices=20, first_echo_time=5.0, echo_spacing=5.0, protocol_name="qsm"):
+    """
+    Generate a multi-echo gradient echo acquisition in memory, with a magnitude and a phase series per echo.
+
+    Returns:
+        Dict[str, bytes]: File names and their content.
+    """
+    dicom_bytes = {}
+    for echo in range(n_echoes):
+        for image_type in ("M", "P"):
+            for slice_index in range(n_slices):
+                ds = make_dataset(0, 0, slice_index)
+                ds.ProtocolName = protocol_name
+                ds.SeriesDescription = f"{protocol_name}_{image_type.lower()}"
+                ds.SeriesNumber = 1 if image_type == "M" else 2
+                ds.InstanceNumber = (echo * 2 + (image_type == "P")) * n_slices + slice_index + 1
+                ds.ImageType = ["ORIGINAL", "PRIMARY", image_type, "ND"]
+                ds.EchoTime = first_echo_time + echo * echo_spacing
+                ds.EchoNumbers = echo + 1
+                ds.RepetitionTime = 30.0
+                ds.FlipAngle = 15
+                ds.MRAcquisitionType = "3D"
+                ds.PixelSpacing = [1.0, 1.0]
+                ds.SliceThickness = 1.0
+                ds.PixelBandwidth = 200.0
+                name = f"{protocol_name}/echo-{echo + 1}_{image_type.lower()}/{slice_index:04d}.dcm"
+                dicom_bytes[name] = to_bytes(ds)
+    return dicom_bytes
+
+def make_enhanced_dataset(n_frames=100, n_echoes=4, protocol_name="qsm_multi_echo"):
+    """An enhanced MR object with a shared timing group and per-frame echo, frame type and position groups."""
+    ds = Dataset()
+    make_file_meta(ds, UID("1.2.840.10008.5.1.4.1.1.4.1"))
+    ds.ProtocolName = protocol_name
+    ds.InstanceNumber = 1
+    ds.ImageType = ["ORIGINAL", "PRIMARY", "MIXED", "NONE"]
+    ds.NumberOfFrames = n_frames
+
+    timing = Dataset()
+    timing.RepetitionTime = 30.0
+    timing.FlipAngle = 15
+    shared = Dataset()
+    shared.MRTimingAndRelatedParametersSequence = [timing]
+    ds.SharedFunctionalGroupsSequence = [shared]
+
+    frames = []
+    for i in range(n_frames):
+        echo = Dataset()
+        echo.EffectiveEchoTime = 5.0 * (i % n_echoes + 1)
+        frame_type = Dataset()
+        frame_type.FrameType = ["ORIGINAL", "PRIMARY", "M" if (i // n_echoes) % 2 == 0 else "P", "NONE"]
+        position = Dataset()
+        position.ImagePositionPatient = [-128.0, -128.0, float(i // (2 * n_echoes))]
+        content = Dataset()
+        content.InStackPositionNumber = i // (2 * n_echoes) + 1
+        frame = Dataset()
+        frame.MREchoSequence = [echo]
+        frame.MRImageFrameTypeSequence = [frame_type]
+        frame.PlanePositionSequence = [position]
+        frame.FrameContentSequence = [content]
+        frames.append(frame)
+    ds.PerFrameFunctionalGroupsSequence = frames
+    return ds
+
+def write_session(session_dir, n_acquisitions=4, n_series=2, n_slices=20, seed=0, extra_elements=0):
+    """Generate a session and write its files under `session_dir`."""
+    write_files(session_dir, make_session_bytes(n_acquisitions, n_series, n_slices, seed, extra_elements))
+
+def write_files(session_dir, dicom_bytes):
+    """Write generated files under `session_dir`."""
+    for name, content in dicom_bytes.items():
+        path = os.path.join(session_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+def make_reference(n_acquisitions=4, n_series=2, seed=0, mismatch_every=3):
+    """
+    A JSON reference for a session generated with the same arguments; every `mismatch_every`-th
+    acquisition expects a different flip angle, so that checks report some issues.
+
+    Returns:
+        Dict[str, Any]: The reference, in the format read by `load_json_session`.
+    """
+    acquisitions = {}
+    for acquisition in range(n_acquisitions):
+        first = make_dataset(acquisition, 0, 0, seed)
+        flip_angle = first.FlipAngle + (1 if mismatch_every and acquisition % mismatch_every == 0 else 0)
+        series = []
+        for s in range(n_series):
+            ds = make_dataset(acquisition, s, 0, seed)
+            series.append({"name": f"Series {s + 1}", "fields": [
+                {"field": "EchoTime", "value": float(ds.EchoTime), "tolerance": 0.1},
+                {"field": "SeriesDescription", "value": ds.SeriesDescription},
+                {"field": "FlipAngle", "value": flip_angle},
+            ]})
+        acquisitions[f"protocol_{acquisition}"] = {
+            "fields": [
+                {"field": "ProtocolName", "value": f"protocol_{acquisition}"},
+                {"field": "RepetitionTime", "value": float(first.RepetitionTime)},
+            ],
+            "series": series,
+        }
+    return {"acquisitions": acquisitions}
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic DICOM session and a matching JSON reference.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--acquisitions", type=int, default=4)
+    parser.add_argument("--series", type=int, default=2)
+    parser.add_argument("--slices", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--extra_elements", type=int, default=0, help="Extra private elements per file.")
+    args = parser.parse_args()
+
+    write_session(os.path.join(args.out_dir, "session"), args.acquisitions, args.series, args.slices, args.seed, args.extra_elements)
+    with open(os.path.join(args.out_dir, "ref.json"), "w") as f:
+        json.dump(make_reference(args.acquisitions, args.series, args.seed), f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,43 @@
 __version__ = "0.1.10"
 
-# Import core functionalities
-from .io import get_dicom_values, load_dicom, load_json_session, load_dicom_session, load_python_session
-from .compliance import check_session_compliance_with_json_reference, check_session_compliance_with_python_module, check_dicom_compliance, is_session_compliant, is_dicom_compliant
-from .mapping import map_to_json_reference, interactive_mapping_to_json_reference, interactive_mapping_to_python_reference
-from .validation import BaseValidationModel, ValidationError, validator
+import importlib
+
+# Core functionalities, by the module that provides them. The modules are imported on first access
+# (PEP 562), so that `import dicompare` and entry points that only need part of the package do not
+# pay for pandas, pydicom and scipy up front.
+_EXPORTS = {
+    "cache": ["DicomHeaderCache"],
+    "io": [
+        "TruncatedHeaderError", "get_dicom_values", "get_dicom_path_value", "get_frame_values", "load_dicom",
+        "find_truncated_headers", "load_json_session", "load_dicom_session", "iter_dicom_session",
+        "load_python_session", "assign_series", "load_dicom_files", "build_session_frame",
+    ],
+    "reference": ["CompiledReference", "compile_json_reference"],
+    "compliance": [
+        "check_session_compliance_with_json_reference", "check_session_compliance_with_python_module",
+        "check_dicom_compliance", "is_session_compliant", "is_dicom_compliant",
+    ],
+    "mapping": [
+        "map_to_json_reference", "map_to_python_reference", "interactive_mapping_to_json_reference",
+        "interactive_mapping_to_python_reference",
+    ],
+    "validation": ["BaseValidationModel", "ValidationError", "validator"],
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# Submodules, which are also available as attributes of the package (e.g., `dicompare.io`)
+_SUBMODULES = ["cache", "io", "reference", "compliance", "mapping", "validation", "utils", "profiling", "watch"]
+
+__all__ = list(_MODULES)
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
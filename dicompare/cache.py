@@ -0,0 +1,236 @@
+"""
+This module provides a persistent on-disk cache of DICOM header values so that unchanged files
+do not need to be parsed again on later runs.
+
+"""
+
+import os
+import json
+import time
+import sqlite3
+
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Union
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dicompare")
+# Bumped whenever the output of `load_dicom` changes; older entries are discarded
+SCHEMA_VERSION = 2
+
+class DicomHeaderCache:
+    """
+    SQLite-backed cache of `load_dicom` output, keyed by file path, size and modification time.
+
+    Notes:
+        - Entries are only returned if the file's size and `mtime_ns` still match, so changed
+          files are re-read automatically.
+        - Entries are stored per set of requested fields, sequence policy and frame mode; a whitelisted read
+          (see `load_dicom`) does not satisfy a later full read and vice versa.
+        - Entries written by a version of `load_dicom` with different output (see `SCHEMA_VERSION`)
+          are discarded when the cache is opened.
+        - `stats` counts cache hits, misses and the total size of the missed files (`bytes_missed`). This is
+          the size on disk, not the bytes `load_dicom` then reads, which stops after the header when it can.
+
+    Args:
+        cache_dir (Optional[str]): Directory holding the cache database. Defaults to the
+            `DICOMPARE_CACHE_DIR` environment variable or `~/.cache/dicompare`.
+
+    Attributes:
+        path (str): Path to the SQLite database.
+        stats (Dict[str, int]): Running counts of `hits`, `misses` and `bytes_missed`.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        cache_dir = cache_dir or os.environ.get("DICOMPARE_CACHE_DIR", DEFAULT_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "headers.sqlite")
+        self.stats = {"hits": 0, "misses": 0, "bytes_missed": 0}
+        self._conn = sqlite3.connect(self.path)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS headers")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS headers (
+                path TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                accessed REAL NOT NULL,
+                dicom_values TEXT NOT NULL,
+                PRIMARY KEY (path, fields)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _fields_key(fields: Optional[Iterable[str]], sequences: Union[str, int] = "all", frames: Optional[str] = None) -> str:
+        fields_key = "" if fields is None else ",".join(sorted(set(fields)))
+        if sequences != "all":
+            fields_key += f";sequences={sequences}"
+        if frames is not None:
+            fields_key += f";frames={frames}"
+        return fields_key
+
+    def get(
+        self,
+        path: str,
+        fields: Optional[Iterable[str]] = None,
+        sequences: Union[str, int] = "all",
+        frames: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached header values for a file.
+
+        Args:
+            path (str): Path to the DICOM file.
+            fields (Optional[Iterable[str]]): The fields the values were loaded with.
+            sequences (Union[str, int]): The sequence policy the values were loaded with.
+            frames (Optional[str]): The frame mode the values were loaded with.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached values, or None if the file is not cached or has changed.
+        """
+
+        stat = os.stat(path)
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, dicom_values FROM headers WHERE path = ? AND fields = ?",
+            (os.path.abspath(path), self._fields_key(fields, sequences, frames)),
+        ).fetchone()
+
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            self.stats["misses"] += 1
+            self.stats["bytes_missed"] += stat.st_size
+            return None
+
+        self.stats["hits"] += 1
+        self._conn.execute(
+            "UPDATE headers SET accessed = ? WHERE path = ? AND fields = ?",
+            (time.time(), os.path.abspath(path), self._fields_key(fields, sequences, frames)),
+        )
+        return json.loads(row[2])
+
+    def put(
+        self,
+        path: str,
+        dicom_values: Dict[str, Any],
+        fields: Optional[Iterable[str]] = None,
+        sequences: Union[str, int] = "all",
+        frames: Optional[str] = None,
+    ):
+        """
+        Store the header values for a single file.
+
+        Args:
+            path (str): Path to the DICOM file.
+            dicom_values (Dict[str, Any]): The output of `load_dicom` for the file.
+            fields (Optional[Iterable[str]]): The fields the values were loaded with.
+            sequences (Union[str, int]): The sequence policy the values were loaded with.
+            frames (Optional[str]): The frame mode the values were loaded with.
+        """
+
+        self.put_many([(path, dicom_values)], fields=fields, sequences=sequences, frames=frames)
+
+    def put_many(
+        self,
+        entries: List[Tuple[str, Dict[str, Any]]],
+        fields: Optional[Iterable[str]] = None,
+        sequences: Union[str, int] = "all",
+        frames: Optional[str] = None,
+    ):
+        """
+        Store the header values for several files in a single transaction.
+
+        Args:
+            entries (List[Tuple[str, Dict[str, Any]]]): Pairs of file path and `load_dicom` output.
+            fields (Optional[Iterable[str]]): The fields the values were loaded with.
+            sequences (Union[str, int]): The sequence policy the values were loaded with.
+            frames (Optional[str]): The frame mode the values were loaded with.
+        """
+
+        fields_key = self._fields_key(fields, sequences, frames)
+        now = time.time()
+        rows = []
+        for path, dicom_values in entries:
+            stat = os.stat(path)
+            rows.append((
+                os.path.abspath(path),
+                fields_key,
+                stat.st_size,
+                stat.st_mtime_ns,
+                now,
+                json.dumps(dicom_values, default=str),
+            ))
+
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO headers VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Remove cached entries.
+
+        Args:
+            path (Optional[str]): A file or directory whose entries should be removed.
+                Defaults to clearing the whole cache.
+
+        Returns:
+            int: The number of entries removed.
+        """
+
+        with self._conn:
+            if path is None:
+                cursor = self._conn.execute("DELETE FROM headers")
+            else:
+                path = os.path.abspath(path)
+                cursor = self._conn.execute(
+                    "DELETE FROM headers WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                    (path, _escape_like(os.path.join(path, "")) + "%"),
+                )
+        return cursor.rowcount
+
+    def prune(self, max_age: Optional[float] = None) -> int:
+        """
+        Remove entries for files that were deleted or changed, and optionally entries not used recently.
+
+        Args:
+            max_age (Optional[float]): Remove entries that have not been read for this many seconds.
+
+        Returns:
+            int: The number of entries removed.
+        """
+
+        stale = []
+        cutoff = None if max_age is None else time.time() - max_age
+        for path, fields_key, size, mtime_ns, accessed in self._conn.execute(
+            "SELECT path, fields, size, mtime_ns, accessed FROM headers"
+        ).fetchall():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stale.append((path, fields_key))
+                continue
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns or (cutoff is not None and accessed < cutoff):
+                stale.append((path, fields_key))
+
+        with self._conn:
+            self._conn.executemany("DELETE FROM headers WHERE path = ? AND fields = ?", stale)
+        return len(stale)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM headers").fetchone()[0]
+
+    def close(self):
+        """
+        Commit pending updates and close the database connection.
+        """
+
+        self._conn.commit()
+        self._conn.close()
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
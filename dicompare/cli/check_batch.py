@@ -0,0 +1,186 @@
+import os
+import json
+import argparse
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+
+from dicompare.io import TruncatedHeaderError, load_json_session, load_python_session, load_dicom_session, assign_series
+from dicompare.compliance import check_session_compliance_with_json_reference, check_session_compliance_with_python_module
+from dicompare.reference import compile_json_reference
+from dicompare.mapping import map_to_json_reference, map_to_python_reference
+from dicompare.cli.check_session import get_model_fields
+
+# Reference loaded once per process by `load_reference`
+_reference = None
+
+def load_reference(json_ref=None, python_ref=None):
+    """
+    Load the reference once for the current process.
+
+    Args:
+        json_ref (Optional[str]): Path to the JSON reference file.
+        python_ref (Optional[str]): Path to the Python module containing validation models.
+
+    Returns:
+        Dict[str, Any]: The loaded reference and the fields it uses.
+    """
+    global _reference
+    if json_ref:
+        reference_fields, ref_session = load_json_session(json_ref=json_ref)
+        _reference = {"json": compile_json_reference(ref_session), "fields": reference_fields}
+    else:
+        ref_models = load_python_session(module_path=python_ref)
+        _reference = {"python": ref_models, "fields": get_model_fields(ref_models)}
+    return _reference
+
+def find_sessions(sessions_root):
+    """
+    Find session directories: the subdirectories of `sessions_root` that contain DICOM files.
+
+    Args:
+        sessions_root (str): Directory containing one subdirectory per session.
+
+    Returns:
+        List[str]: Sorted paths of the session directories.
+    """
+    sessions = []
+    for entry in sorted(os.scandir(sessions_root), key=lambda entry: entry.name):
+        if not entry.is_dir():
+            continue
+        if any(file.endswith((".dcm", ".IMA")) for _, _, files in os.walk(entry.path) for file in files):
+            sessions.append(entry.path)
+    return sessions
+
+def check_session(session_dir, acquisition_fields, dicom_bytes=None, file_sizes=None, reference=None, cache=None, session_id=None):
+    """
+    Load a session, map it automatically to the loaded reference and check its compliance.
+
+    Args:
+        session_dir (Optional[str]): Directory path for the DICOM session.
+        acquisition_fields (List[str]): Fields used to uniquely identify each acquisition.
+        dicom_bytes (Optional[Dict[str, bytes]]): File content (or header prefixes) used instead of `session_dir`.
+        file_sizes (Optional[Dict[str, int]]): Sizes of the whole files, for `dicom_bytes` holding header prefixes.
+        reference (Optional[Dict[str, Any]]): A reference as built by `load_reference`. Defaults to the loaded one.
+        cache (Optional[DicomHeaderCache]): Persistent header cache for files in `session_dir`.
+        session_id (Optional[str]): Name of the session in the report. Defaults to the directory name, or to
+            "upload" for a session given as `dicom_bytes`.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[str, Any]]: The compliance issues and a summary for the session.
+
+    Raises:
+        ValueError: If neither `session_dir` nor `dicom_bytes` is provided.
+        TruncatedHeaderError: If a header prefix in `dicom_bytes` is too short.
+    """
+    if session_dir is None and dicom_bytes is None:
+        raise ValueError("Either session_dir or dicom_bytes must be provided.")
+    reference = reference or _reference
+    if session_id is None:
+        session_id = "upload" if session_dir is None else os.path.basename(os.path.normpath(session_dir))
+    try:
+        in_session = load_dicom_session(
+            session_dir=session_dir,
+            dicom_bytes=dicom_bytes,
+            acquisition_fields=acquisition_fields,
+            fields=reference["fields"],
+            cache=cache,
+            file_sizes=file_sizes,
+        )
+
+        if "json" in reference:
+            in_session = assign_series(in_session, acquisition_fields, reference["fields"])
+            session_map = map_to_json_reference(in_session, reference["json"])
+            compliance_summary = check_session_compliance_with_json_reference(
+                in_session=in_session,
+                ref_session=reference["json"],
+                session_map=session_map
+            )
+        else:
+            session_map = map_to_python_reference(in_session, reference["python"])
+            compliance_summary = check_session_compliance_with_python_module(
+                in_session=in_session,
+                ref_models=reference["python"],
+                session_map=session_map
+            )
+    except TruncatedHeaderError:
+        raise
+    except Exception as e:
+        return [], {"session": session_id, "files": 0, "issues": 0, "passed": False, "error": str(e)}
+
+    failures = sum(1 for entry in compliance_summary if entry.get("passed") == "❌")
+    summary = {"session": session_id, "files": len(in_session), "issues": failures, "passed": failures == 0, "error": None}
+    return [{"session": session_id, **entry} for entry in compliance_summary], summary
+
+def _json_default(value):
+    return value.item() if hasattr(value, "item") else str(value)
+
+def write_report(report_rows, out_report):
+    """
+    Write the consolidated report as JSON lines, or as Parquet if `out_report` ends with `.parquet`.
+
+    Args:
+        report_rows (List[Dict[str, Any]]): Compliance issues of all sessions, with a `session` column.
+        out_report (str): Path to save the report.
+    """
+    if out_report.endswith(".parquet"):
+        report_df = pd.DataFrame(report_rows)
+        # Values of different types cannot share a Parquet column; store them as JSON
+        for col in report_df.columns:
+            if report_df[col].dtype == object:
+                report_df[col] = [
+                    value if value is None or isinstance(value, str) else json.dumps(value, default=_json_default)
+                    for value in report_df[col]
+                ]
+        report_df.to_parquet(out_report, index=False)
+    else:
+        with open(out_report, "w") as f:
+            for row in report_rows:
+                f.write(json.dumps(row, default=_json_default) + "\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check many DICOM sessions against a single reference.")
+    parser.add_argument("--json_ref", help="Path to the JSON reference file.")
+    parser.add_argument("--python_ref", help="Path to the Python module containing validation models.")
+    parser.add_argument("--sessions_root", required=True, help="Directory containing one subdirectory per DICOM session.")
+    parser.add_argument("--out_report", default="compliance_report.jsonl", help="Path to save the consolidated report (.jsonl, or .parquet if pyarrow is installed).")
+    parser.add_argument("--out_summary", help="Path to save the per-session pass/fail summary as JSON.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of sessions to check concurrently.")
+    args = parser.parse_args()
+
+    if not (args.json_ref or args.python_ref):
+        raise ValueError("You must provide either --json_ref or --python_ref.")
+
+    sessions = find_sessions(args.sessions_root)
+    if not sessions:
+        raise ValueError(f"No DICOM sessions found in {args.sessions_root}.")
+    acquisition_fields = ["ProtocolName"]
+
+    # Load the reference once, or once per worker process
+    if args.workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=load_reference,
+            initargs=(args.json_ref, args.python_ref),
+        ) as executor:
+            results = list(executor.map(check_session, sessions, [acquisition_fields] * len(sessions)))
+    else:
+        load_reference(args.json_ref, args.python_ref)
+        results = [check_session(session_dir, acquisition_fields) for session_dir in sessions]
+
+    report_rows = [row for rows, _ in results for row in rows]
+    summaries = [summary for _, summary in results]
+
+    write_report(report_rows, args.out_report)
+    if args.out_summary:
+        with open(args.out_summary, "w") as f:
+            json.dump(summaries, f, indent=4)
+
+    for summary in summaries:
+        status = "ERROR" if summary["error"] else ("PASS" if summary["passed"] else "FAIL")
+        details = summary["error"] or f"{summary['files']} files, {summary['issues']} issues"
+        print(f"{status:<5} {summary['session']}: {details}")
+    print(f"{sum(summary['passed'] for summary in summaries)}/{len(summaries)} sessions passed. Report saved to {args.out_report}")
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,69 @@ import json
 import argparse
 import pandas as pd
 
-from dicompare.io import load_json_session, load_python_session, load_dicom_session
+from dicompare import profiling
+from dicompare.cache import DicomHeaderCache
+from dicompare.io import load_json_session, load_python_session, load_dicom_session, assign_series
 from dicompare.compliance import check_session_compliance_with_json_reference, check_session_compliance_with_python_module
-from dicompare.mapping import map_to_json_reference, interactive_mapping_to_json_reference, interactive_mapping_to_python_reference
+from dicompare.reference import compile_json_reference
+from dicompare.mapping import map_to_json_reference, map_to_python_reference, interactive_mapping_to_json_reference, interactive_mapping_to_python_reference
+from dicompare.watch import SessionWatcher
+
+def get_model_fields(ref_models):
+    """
+    Collect the fields used by the validators of Python reference models.
+
+    Args:
+        ref_models (Dict[str, BaseValidationModel]): Dictionary mapping acquisition names to validation models.
+
+    Returns:
+        List[str]: The fields used by any validator.
+    """
+    return sorted({
+        field
+        for ref_model in ref_models.values()
+        for field_names in ref_model._field_validators
+        for field in field_names
+    })
+
+def print_compliance_summary(compliance_summary):
+    """
+    Print the entries of a compliance summary.
+
+    Args:
+        compliance_summary (List[Dict[str, Any]]): Compliance issues.
+    """
+    if not compliance_summary:
+        print("Session is fully compliant with the reference model.")
+        return
+
+    for entry in compliance_summary:
+        if entry.get('acquisition'): print(f"Acquisition: {entry.get('acquisition')}")
+        if entry.get('field'): print(f"Field: {entry.get('field')}")
+        if entry.get('value'): print(f"Value: {entry.get('value')}")
+        if entry.get('rule'): print(f"Rule: {entry.get('rule')}")
+        if entry.get('message'): print(f"Message: {entry.get('message')}")
+        if entry.get('passed'): print(f"Passed: {entry.get('passed')}")
+        print("-" * 40)
+
+def watch_session(args, watcher):
+    """
+    Re-check a session as files arrive, printing and saving the summary after each update.
+
+    Args:
+        args (argparse.Namespace): Command-line arguments.
+        watcher (SessionWatcher): Watcher for the input session.
+    """
+    print(f"Watching {args.in_session} for new DICOM files (Ctrl+C to stop).")
+    try:
+        for changed in watcher.watch(poll_interval=args.poll_interval, idle_timeout=args.idle_exit):
+            print(f"{watcher.n_files} files loaded; updated {', '.join(sorted(changed))}.")
+            print_compliance_summary(watcher.compliance_summary)
+            if args.out_json:
+                with open(args.out_json, "w") as f:
+                    json.dump(watcher.compliance_summary, f)
+    except KeyboardInterrupt:
+        pass
 
 def main():
     parser = argparse.ArgumentParser(description="Generate compliance summaries for a DICOM session.")
@@ -14,44 +74,85 @@ def main():
     parser.add_argument("--in_session", required=True, help="Directory path for the DICOM session.")
     parser.add_argument("--out_json", default="compliance_report.json", help="Path to save the JSON compliance summary report.")
     parser.add_argument("--auto_yes", action="store_true", help="Automatically map acquisitions to series.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes used to read DICOM headers.")
+    parser.add_argument("--cache_dir", help="Directory for a persistent DICOM header cache; unchanged files are not re-read.")
+    parser.add_argument("--watch", action="store_true", help="Keep polling the session directory and re-check acquisitions as new files arrive.")
+    parser.add_argument("--poll_interval", type=float, default=2.0, help="Seconds between polls in watch mode.")
+    parser.add_argument("--idle_exit", type=float, help="In watch mode, stop after this many seconds without new files.")
+    parser.add_argument("--profile", nargs="?", const="-", help="Print a timing breakdown of the check, or save it as JSON to the given path.")
     args = parser.parse_args()
 
     if not (args.json_ref or args.python_ref):
         raise ValueError("You must provide either --json_ref or --python_ref.")
 
+    if args.profile:
+        with profiling.profile() as profile:
+            check(args)
+        profiling.write_profile(profile, args.profile)
+    else:
+        check(args)
+
+def check(args):
+    """
+    Check the input session against the reference given on the command line.
+
+    Args:
+        args (argparse.Namespace): Command-line arguments.
+    """
     # Load the reference models and fields
-    if args.json_ref:
-        reference_fields, ref_session = load_json_session(json_ref=args.json_ref)
-    elif args.python_ref:
-        ref_models = load_python_session(module_path=args.python_ref)
+    with profiling.span("load reference"):
+        if args.json_ref:
+            reference_fields, ref_session = load_json_session(json_ref=args.json_ref)
+            ref_session = compile_json_reference(ref_session)
+            required_fields = reference_fields
+        elif args.python_ref:
+            ref_models = load_python_session(module_path=args.python_ref)
+            required_fields = get_model_fields(ref_models)
     acquisition_fields = ["ProtocolName"]
 
-    # Load the input session
-    in_session = load_dicom_session(
-        session_dir=args.in_session,
-        acquisition_fields=acquisition_fields,
-    )
+    cache = DicomHeaderCache(args.cache_dir) if args.cache_dir else None
 
-    if args.json_ref:
-        # reset index to avoid issues with groupby
-        in_session.reset_index(drop=True, inplace=True)
-        # Group by acquisition fields to create Series labels starting from 1 for each acquisition
-        in_session["Series"] = (
-            in_session.groupby(acquisition_fields).apply(
-                lambda group: group.groupby(reference_fields, dropna=False).ngroup().add(1)
-            ).reset_index(level=0, drop=True)  # Reset multi-index back to DataFrame
-        ).apply(lambda x: f"Series {x}")
-        # Sort by acquisition, then series, then all other fields
-        in_session.sort_values(by=["Acquisition", "Series"] + acquisition_fields + reference_fields, inplace=True)
+    # In watch mode, acquisitions are mapped automatically and re-checked as files arrive
+    if args.watch:
+        watcher = SessionWatcher(
+            session_dir=args.in_session,
+            acquisition_fields=acquisition_fields,
+            ref_session=ref_session if args.json_ref else None,
+            reference_fields=reference_fields if args.json_ref else None,
+            ref_models=None if args.json_ref else ref_models,
+            fields=required_fields,
+            cache=cache,
+        )
+        watch_session(args, watcher)
+        if cache is not None:
+            cache.close()
+        return
+
+    # Load the input session, decoding only the fields the reference needs
+    with profiling.span("load session"):
+        in_session = load_dicom_session(
+            session_dir=args.in_session,
+            acquisition_fields=acquisition_fields,
+            workers=args.workers,
+            cache=cache,
+            fields=required_fields,
+        )
 
+    if cache is not None:
+        print(f"Header cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses, {cache.stats['bytes_missed']} bytes in missed files.")
+        cache.close()
+
+    if args.json_ref:
+        in_session = assign_series(in_session, acquisition_fields, reference_fields)
 
     if args.json_ref:
         session_map = map_to_json_reference(in_session, ref_session)
         if not args.auto_yes and sys.stdin.isatty():
             session_map = interactive_mapping_to_json_reference(in_session, ref_session, initial_mapping=session_map)
     else:
-        session_map = interactive_mapping_to_python_reference(in_session, ref_models)
-    
+        session_map = map_to_python_reference(in_session, ref_models)
+        if not args.auto_yes and sys.stdin.isatty():
+            session_map = interactive_mapping_to_python_reference(in_session, ref_models, initial_mapping=session_map)
 
     # Perform compliance check
     if args.json_ref:
@@ -74,14 +175,7 @@ def main():
         return
 
     # Inline summary output
-    for entry in compliance_summary:
-        if entry.get('acquisition'): print(f"Acquisition: {entry.get('acquisition')}")
-        if entry.get('field'): print(f"Field: {entry.get('field')}")
-        if entry.get('value'): print(f"Value: {entry.get('value')}")
-        if entry.get('rule'): print(f"Rule: {entry.get('rule')}")
-        if entry.get('message'): print(f"Message: {entry.get('message')}")
-        if entry.get('passed'): print(f"Passed: {entry.get('passed')}")
-        print("-" * 40)
+    print_compliance_summary(compliance_summary)
 
     # Save compliance summary to JSON
     if args.out_json:
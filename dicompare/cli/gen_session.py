@@ -3,9 +3,12 @@
 import argparse
 import json
 import pandas as pd
+from dicompare import profiling
+from dicompare.cache import DicomHeaderCache
 from dicompare.io import load_dicom_session
 from dicompare.utils import clean_string, make_hashable
 
+@profiling.timed("create_json_reference")
 def create_json_reference(session_df, reference_fields):
     """
     Create a JSON reference from the session DataFrame.
@@ -69,13 +72,40 @@ def main():
     parser.add_argument("--acquisition_fields", nargs="+", required=True, help="Fields to uniquely identify each acquisition.")
     parser.add_argument("--reference_fields", nargs="+", required=True, help="Fields to include in JSON reference with their values.")
     parser.add_argument("--name_template", default="{ProtocolName}", help="Naming template for each acquisition series.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes used to read DICOM headers.")
+    parser.add_argument("--cache_dir", help="Directory for a persistent DICOM header cache; unchanged files are not re-read.")
+    parser.add_argument("--profile", nargs="?", const="-", help="Print a timing breakdown, or save it as JSON to the given path.")
     args = parser.parse_args()
 
+    if args.profile:
+        with profiling.profile() as profile:
+            generate(args)
+        profiling.write_profile(profile, args.profile)
+    else:
+        generate(args)
+
+def generate(args):
+    """
+    Generate the JSON reference described by the command-line arguments.
+
+    Args:
+        args (argparse.Namespace): Command-line arguments.
+    """
+    cache = DicomHeaderCache(args.cache_dir) if args.cache_dir else None
+
     # Read DICOM session
-    session_data = load_dicom_session(
-        session_dir=args.in_session_dir,
-        acquisition_fields=args.acquisition_fields,
-    )
+    with profiling.span("load session"):
+        session_data = load_dicom_session(
+            session_dir=args.in_session_dir,
+            acquisition_fields=args.acquisition_fields,
+            workers=args.workers,
+            cache=cache,
+            fields=args.reference_fields,
+        )
+
+    if cache is not None:
+        print(f"Header cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses, {cache.stats['bytes_missed']} bytes in missed files.")
+        cache.close()
 
     # Filter fields in DataFrame
     relevant_fields = set(args.acquisition_fields + args.reference_fields)
@@ -0,0 +1,263 @@
+import os
+import json
+import base64
+import binascii
+import argparse
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dicompare.cache import DicomHeaderCache
+from dicompare.io import TruncatedHeaderError
+from dicompare.cli.check_batch import load_reference, check_session, _json_default
+
+# Per-worker state set by `init_worker`: loaded references (least recently used first) and the header cache
+_references = OrderedDict()
+_reference_cache_size = 8
+_cache = None
+
+def init_worker(cache_dir=None, reference_cache_size=8):
+    """
+    Set up the state of a worker: an empty reference cache and, optionally, a header cache.
+
+    Args:
+        cache_dir (Optional[str]): Directory for a persistent DICOM header cache.
+        reference_cache_size (int): Maximum number of references kept loaded.
+    """
+    global _cache, _reference_cache_size
+    _references.clear()
+    _reference_cache_size = reference_cache_size
+    _cache = DicomHeaderCache(cache_dir) if cache_dir else None
+
+def get_reference(json_ref=None, python_ref=None):
+    """
+    Get a loaded reference, loading it if it is not cached or if the file changed since it was loaded.
+
+    Args:
+        json_ref (Optional[str]): Path to the JSON reference file.
+        python_ref (Optional[str]): Path to the Python module containing validation models.
+
+    Returns:
+        Dict[str, Any]: The loaded reference, as built by `load_reference`.
+    """
+    path = os.path.abspath(json_ref or python_ref)
+    key = ("json" if json_ref else "python", path, os.stat(path).st_mtime_ns)
+    reference = _references.get(key)
+    if reference is None:
+        reference = load_reference(json_ref=path if json_ref else None, python_ref=None if json_ref else path)
+        _references[key] = reference
+        while len(_references) > _reference_cache_size:
+            _references.popitem(last=False)
+    _references.move_to_end(key)
+    return reference
+
+def resolve_path(path, root=None):
+    """
+    Resolve a path given in a request, relative to `root`, and check that it lies within `root`.
+
+    Args:
+        path (str): The path from the request.
+        root (Optional[str]): The directory that paths must lie within; None allows any path.
+
+    Returns:
+        str: The resolved path, with symbolic links followed.
+
+    Raises:
+        ValueError: If the path lies outside `root`.
+    """
+    if root is None:
+        return os.path.realpath(path)
+    root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"Path {path} is outside the served root directory.")
+    return resolved
+
+def run_check(request, root=None):
+    """
+    Check one session described by a request.
+
+    Notes:
+        - The request holds `json_ref` or `python_ref`, and either a `session_dir` or `files`, a dictionary
+          of file names and base64-encoded content (or header prefixes, with `file_sizes`).
+        - `json_ref`, `python_ref` and `session_dir` are resolved relative to `root` and must lie within it;
+          Python references are executed when loaded.
+        - `acquisition_fields` defaults to `["ProtocolName"]` and `session` names the session in the result.
+
+    Args:
+        request (Dict[str, Any]): The decoded request body.
+        root (Optional[str]): The directory that paths in the request must lie within; None allows any path.
+
+    Returns:
+        Tuple[int, Dict[str, Any]]: The HTTP status and the response body.
+    """
+    if not (request.get("json_ref") or request.get("python_ref")):
+        return 400, {"error": "The request must provide either json_ref or python_ref."}
+    if not (request.get("session_dir") or request.get("files")):
+        return 400, {"error": "The request must provide either session_dir or files."}
+
+    try:
+        json_ref, python_ref, session_dir = (
+            resolve_path(request[key], root) if request.get(key) else None
+            for key in ("json_ref", "python_ref", "session_dir")
+        )
+    except (ValueError, TypeError) as e:
+        return 403 if isinstance(e, ValueError) else 400, {"error": str(e)}
+
+    try:
+        reference = get_reference(json_ref, python_ref)
+    except Exception as e:
+        return 400, {"error": f"Could not load the reference: {e}"}
+
+    dicom_bytes = None
+    if request.get("files"):
+        if not isinstance(request["files"], dict):
+            return 400, {"error": "files must map file names to base64-encoded content."}
+        try:
+            dicom_bytes = {name: base64.b64decode(content, validate=True) for name, content in request["files"].items()}
+        except (binascii.Error, TypeError) as e:
+            return 400, {"error": f"Invalid base64 content in files: {e}"}
+
+    try:
+        issues, summary = check_session(
+            session_dir,
+            request.get("acquisition_fields") or ["ProtocolName"],
+            dicom_bytes=dicom_bytes,
+            file_sizes=request.get("file_sizes"),
+            reference=reference,
+            cache=_cache if dicom_bytes is None else None,
+            session_id=request.get("session") or None,
+        )
+    except TruncatedHeaderError as e:
+        return 422, {"error": str(e), "bytes_needed": e.files}
+    return 200, {"summary": summary, "issues": issues}
+
+class ComplianceRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve compliance checks: `POST /check` with a JSON request (see `run_check`), and `GET /health`.
+
+    Notes:
+        - Browsers may only call the server from the origin given as `allow_origin`, if any; requests
+          carrying any other `Origin` are refused, so other web pages cannot trigger checks.
+    """
+
+    def end_headers(self):
+        if self.server.allow_origin:
+            self.send_header("Access-Control-Allow-Origin", self.server.allow_origin)
+            self.send_header("Vary", "Origin")
+        super().end_headers()
+
+    def origin_allowed(self):
+        origin = self.headers.get("Origin")
+        return origin is None or origin == self.server.allow_origin
+
+    def send_json(self, status, body):
+        content = json.dumps(body, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_OPTIONS(self):
+        if not self.server.allow_origin or not self.origin_allowed():
+            self.send_json(403, {"error": "Cross-origin requests are not allowed."})
+            return
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path != "/health":
+            self.send_json(404, {"error": f"Unknown path {self.path}."})
+            return
+        self.send_json(200, {"status": "ok"})
+
+    def do_POST(self):
+        if self.path != "/check":
+            self.send_json(404, {"error": f"Unknown path {self.path}."})
+            return
+        if not self.origin_allowed():
+            self.send_json(403, {"error": "Cross-origin requests are not allowed."})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as e:
+            self.send_json(400, {"error": f"Invalid JSON request: {e}"})
+            return
+        if not isinstance(request, dict):
+            self.send_json(400, {"error": "The request must be a JSON object."})
+            return
+
+        try:
+            status, body = self.server.executor.submit(run_check, request, self.server.root).result()
+        except Exception as e:
+            status, body = 500, {"error": str(e)}
+        self.send_json(status, body)
+
+    def log_message(self, format, *args):
+        if self.server.log_requests:
+            super().log_message(format, *args)
+
+def make_server(host="127.0.0.1", port=8000, workers=1, cache_dir=None, reference_cache_size=8, log_requests=False,
+                root=None, allow_origin=None):
+    """
+    Create the compliance server and its worker pool.
+
+    Notes:
+        - With `workers` > 1, checks run in a process pool and each worker keeps its own references and
+          header cache; otherwise they run one at a time in a single background thread.
+        - Sessions and references named in requests must lie within `root`.
+
+    Args:
+        host (str): Address to bind to.
+        port (int): Port to listen on; 0 picks a free port.
+        workers (int): Number of worker processes.
+        cache_dir (Optional[str]): Directory for a persistent DICOM header cache.
+        reference_cache_size (int): Maximum number of references kept loaded per worker.
+        log_requests (bool): Whether to log each request to stderr.
+        root (Optional[str]): The directory that paths in requests must lie within; defaults to the
+            current directory.
+        allow_origin (Optional[str]): The web origin allowed to call the server from a browser, e.g.,
+            `http://localhost:8080`; by default, cross-origin requests are refused.
+
+    Returns:
+        ThreadingHTTPServer: The server, with its pool as `executor`.
+    """
+    server = ThreadingHTTPServer((host, port), ComplianceRequestHandler)
+    pool = ProcessPoolExecutor if workers > 1 else ThreadPoolExecutor
+    server.executor = pool(max_workers=max(workers, 1), initializer=init_worker, initargs=(cache_dir, reference_cache_size))
+    server.log_requests = log_requests
+    server.root = os.path.realpath(root or os.getcwd())
+    server.allow_origin = allow_origin
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve DICOM compliance checks over HTTP, keeping references loaded between requests.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind to.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes running checks.")
+    parser.add_argument("--cache_dir", help="Directory for a persistent DICOM header cache; unchanged files are not re-read.")
+    parser.add_argument("--reference_cache_size", type=int, default=8, help="Maximum number of references kept loaded per worker.")
+    parser.add_argument("--log_requests", action="store_true", help="Log each request.")
+    parser.add_argument("--root", help="Directory that sessions and references in requests must lie within. Defaults to the current directory.")
+    parser.add_argument("--allow_origin", help="Web origin allowed to call the server from a browser. By default, cross-origin requests are refused.")
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host, args.port, args.workers, args.cache_dir, args.reference_cache_size, args.log_requests,
+        root=args.root, allow_origin=args.allow_origin,
+    )
+    print(f"Serving compliance checks of {server.root} on {args.host}:{server.server_port} with {args.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.executor.shutdown(cancel_futures=True)
+
+if __name__ == "__main__":
+    main()
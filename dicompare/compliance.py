@@ -5,38 +5,206 @@ The module supports compliance checks for JSON-based reference sessions and Pyth
 
 """
 
-from typing import List, Dict, Any, Tuple
-from dicompare.validation import BaseValidationModel
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable
+from dicompare import profiling
+from dicompare.reference import CompiledReference, compile_json_reference
+from dicompare.validation import BaseValidationModel, CombinationTables
+import numpy as np
 import pandas as pd
 
+def _iter_session_chunks(in_session: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> Iterable[pd.DataFrame]:
+    """
+    Treat a single session DataFrame as a session made of one chunk.
+    """
+
+    return [in_session] if isinstance(in_session, pd.DataFrame) else in_session
+
+def _series_issue(in_key, ref_key, field, value, rule, message) -> Dict[str, Any]:
+    return {
+        "reference acquisition": ref_key,
+        "input acquisition": in_key,
+        "field": field,
+        "value": value,
+        "rule": rule,
+        "message": message,
+        "passed": "❌"
+    }
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float))
+
+def _check_chunk_compliance_with_json_reference(
+    chunk: pd.DataFrame,
+    reference: CompiledReference,
+    session_map: Dict[Tuple[str, str], Tuple[str, str]]
+) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    Validate all mapped input series found in a session chunk against the JSON reference.
+
+    Notes:
+        - The chunk is reduced once to the first row of each (Acquisition, Series) group, which
+          holds the values that are compared against the reference.
+        - Reference fields are grouped by field name and each group is checked in bulk: tolerance
+          checks and numeric exact checks are evaluated with NumPy, and only object columns fall
+          back to per-value comparisons.
+
+    Args:
+        chunk (pd.DataFrame): Input session (or session chunk) with `Acquisition` and `Series` labels.
+        reference (CompiledReference): The compiled JSON reference.
+        session_map (Dict[Tuple[str, str], Tuple[str, str]]): Mapping of input acquisitions/series
+            to reference acquisitions/series.
+
+    Returns:
+        Dict[Tuple[str, str], List[Dict[str, Any]]]: Compliance issues of each mapped input series
+            present in the chunk, in reference field order.
+    """
+    first_rows = chunk.drop_duplicates(["Acquisition", "Series"])
+    row_positions = {key: i for i, key in enumerate(zip(first_rows["Acquisition"], first_rows["Series"]))}
+
+    # Flatten the reference fields of every mapped series into rules, grouped by field name
+    series_slots = {}
+    issues = []
+    field_rules = {}
+    for in_key, ref_key in session_map.items():
+        if in_key not in row_positions:
+            continue
+
+        ref_rules = reference.get_rules(*ref_key)
+        if ref_rules is None:
+            series_slots[in_key] = [len(issues)]
+            issues.append(_series_issue(
+                in_key, ref_key, "Reference-Level Error", None,
+                "Reference acquisition and series must be present.",
+                "Reference acquisition or series not found."
+            ))
+            continue
+
+        series_slots[in_key] = []
+        for rule in ref_rules:
+            series_slots[in_key].append(len(issues))
+            field_rules.setdefault(rule.field, []).append(
+                (len(issues), row_positions[in_key], in_key, ref_key, rule)
+            )
+            issues.append(None)
+
+    for field_name, rules in field_rules.items():
+        if field_name not in first_rows.columns:
+            for slot, _, in_key, ref_key, _ in rules:
+                issues[slot] = _series_issue(
+                    in_key, ref_key, field_name, None, "Field must be present.", "Field not found in input session."
+                )
+            continue
+
+        column = first_rows[field_name].to_numpy()
+        actual_values = column[np.array([rule[1] for rule in rules])]
+        compiled_rules = [rule[4] for rule in rules]
+        expected_values = [rule.value for rule in compiled_rules]
+        tolerances = [rule.tolerance for rule in compiled_rules]
+        contains_values = [rule.contains for rule in compiled_rules]
+
+        # Contains rules are always checked as such; tolerance rules only apply to numeric values
+        # and otherwise fall back to an exact match, like wildcard values
+        has_contains = np.array([rule.kind == "contains" for rule in compiled_rules], dtype=bool)
+        if column.dtype.kind == "f":
+            is_number = np.ones(len(rules), dtype=bool)
+        elif column.dtype.kind == "O":
+            is_number = np.fromiter((_is_number(value) for value in actual_values), dtype=bool, count=len(rules))
+        else:
+            is_number = np.zeros(len(rules), dtype=bool)  # NumPy integers and booleans are not Python numbers
+        is_tolerance = is_number & np.array([rule.kind == "tolerance" for rule in compiled_rules], dtype=bool)
+        is_exact = ~has_contains & ~is_tolerance & np.array([expected is not None for expected in expected_values], dtype=bool)
+
+        failed = np.zeros(len(rules), dtype=bool)
+        bounds = reference.field_bounds[field_name]
+        rule_idx = np.array([rule.index for rule in compiled_rules])
+
+        # Contains check
+        for i in np.flatnonzero(has_contains):
+            failed[i] = not isinstance(actual_values[i], list) or contains_values[i] not in actual_values[i]
+
+        # Tolerance check
+        tolerance_idx = np.flatnonzero(is_tolerance)
+        if len(tolerance_idx):
+            actual = actual_values[tolerance_idx].astype(float)
+            lower, upper = bounds["lower"][rule_idx[tolerance_idx]], bounds["upper"][rule_idx[tolerance_idx]]
+            failed[tolerance_idx] = ~((lower <= actual) & (actual <= upper))
+
+        # Exact match check
+        exact_idx = np.flatnonzero(is_exact)
+        if len(exact_idx):
+            if column.dtype.kind in "fiu" and bounds["numeric"][rule_idx[exact_idx]].all():
+                failed[exact_idx] = actual_values[exact_idx] != bounds["value"][rule_idx[exact_idx]]
+            else:
+                failed[exact_idx] = [bool(actual_values[i] != expected_values[i]) for i in exact_idx]
+
+        for i in np.flatnonzero(failed):
+            slot, _, in_key, ref_key, _ = rules[i]
+            actual_value = actual_values[i]
+            if has_contains[i]:
+                issues[slot] = _series_issue(
+                    in_key, ref_key, field_name, actual_value, "Field must contain value.",
+                    f"Expected to contain {contains_values[i]}, got {actual_value}."
+                )
+            elif is_tolerance[i]:
+                issues[slot] = _series_issue(
+                    in_key, ref_key, field_name, actual_value, "Field must be within tolerance.",
+                    f"Expected {expected_values[i]} ± {tolerances[i]}, got {actual_value}."
+                )
+            else:
+                issues[slot] = _series_issue(
+                    in_key, ref_key, field_name, actual_value, "Field must match expected value.",
+                    f"Expected {expected_values[i]}, got {actual_value}."
+                )
+
+    return {
+        in_key: [issues[slot] for slot in slots if issues[slot] is not None]
+        for in_key, slots in series_slots.items()
+    }
+
+@profiling.timed("validation")
 def check_session_compliance_with_json_reference(
-    in_session: pd.DataFrame,
-    ref_session: Dict[str, Any],
+    in_session: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    ref_session: Union[Dict[str, Any], CompiledReference],
     session_map: Dict[Tuple[str, str], Tuple[str, str]]
 ) -> List[Dict[str, Any]]:
     """
     Validate a DICOM session against a JSON reference session.
 
+    Notes:
+        - `in_session` may also be an iterable of session chunks, which are consumed one at a time.
+          Each chunk must hold complete acquisitions, with `Series` labels assigned per chunk (e.g.,
+          `iter_dicom_session` with its default `by_acquisition=True`, then `assign_series`); series
+          split across chunks would be labelled and checked inconsistently.
+        - Each chunk is grouped by (Acquisition, Series) once and the reference fields are
+          checked in bulk, rather than filtering the session for every mapped series.
+        - As before, the first row of each input series is compared against the reference.
+
     Args:
-        in_session (pd.DataFrame): Input session DataFrame containing DICOM metadata.
-        ref_session (Dict[str, Any]): Reference session data loaded from a JSON file.
+        in_session (Union[pd.DataFrame, Iterable[pd.DataFrame]]): Input session DataFrame containing
+            DICOM metadata, or an iterable of session chunks.
+        ref_session (Union[Dict[str, Any], CompiledReference]): Reference session data loaded from a
+            JSON file, or a reference compiled with `compile_json_reference`.
         session_map (Dict[Tuple[str, str], Tuple[str, str]]): Mapping of input acquisitions/series 
             to reference acquisitions/series.
 
     Returns:
         List[Dict[str, Any]]: A list of compliance issues, where each issue is represented as a dictionary.
     """
-    compliance_summary = []
+    reference = compile_json_reference(ref_session)
+    series_issues = {}
 
-    # Iterate over the session mapping
-    for (in_acq_name, in_series_name), (ref_acq_name, ref_series_name) in session_map.items():
-        # Filter the input session for the current acquisition and series
-        in_acq_series = in_session[
-            (in_session["Acquisition"] == in_acq_name) & 
-            (in_session["Series"] == in_series_name)
-        ]
+    for chunk in _iter_session_chunks(in_session):
+        pending_map = {
+            in_key: ref_key for in_key, ref_key in session_map.items() if in_key not in series_issues
+        }
+        if pending_map:
+            series_issues.update(_check_chunk_compliance_with_json_reference(chunk, reference, pending_map))
 
-        if in_acq_series.empty:
+    # Report issues in the order of the session map
+    compliance_summary = []
+    for (in_acq_name, in_series_name), (ref_acq_name, ref_series_name) in session_map.items():
+        if (in_acq_name, in_series_name) not in series_issues:
             compliance_summary.append({
                 "reference acquisition": (ref_acq_name, ref_series_name),
                 "input acquisition": (in_acq_name, in_series_name),
@@ -47,117 +215,206 @@ def check_session_compliance_with_json_reference(
                 "passed": "❌"
             })
             continue
+        compliance_summary.extend(series_issues[(in_acq_name, in_series_name)])
 
-        # Filter the reference session for the current acquisition and series
-        ref_acq = ref_session["acquisitions"].get(ref_acq_name, {})
-        ref_series = next(
-            (series for series in ref_acq.get("series", []) if series["name"] == ref_series_name),
-            None
-        )
+    return compliance_summary
 
-        if not ref_series:
-            compliance_summary.append({
-                "reference acquisition": (ref_acq_name, ref_series_name),
-                "input acquisition": (in_acq_name, in_series_name),
-                "field": "Reference-Level Error",
-                "value": None,
-                "rule": "Reference acquisition and series must be present.",
-                "message": "Reference acquisition or series not found.",
-                "passed": "❌"
-            })
-            continue
+def _submit_acquisition_compliance_with_python_module(
+    in_acq: pd.DataFrame,
+    ref_models: Dict[str, BaseValidationModel],
+    ref_acq_name: str,
+    in_acq_name: str,
+    tables: Optional[Dict[str, CombinationTables]] = None,
+    executor: Optional[Executor] = None
+) -> Union[List[Dict[str, Any]], Tuple[BaseValidationModel, List[Tuple[Dict[str, Any], Any]]]]:
+    """
+    Start validating the rows of a single input acquisition against its reference model.
 
-        # Iterate through the reference fields and check compliance
-        for ref_field in ref_series.get("fields", []):
-            field_name = ref_field["field"]
-            expected_value = ref_field.get("value")
-            tolerance = ref_field.get("tolerance")
-            contains = ref_field.get("contains")
+    Args:
+        in_acq (pd.DataFrame): Rows of the input acquisition.
+        ref_models (Dict[str, BaseValidationModel]): Dictionary mapping acquisition names to 
+            validation models.
+        ref_acq_name (str): The reference acquisition name.
+        in_acq_name (str): The input acquisition name.
+        tables (Optional[Dict[str, CombinationTables]]): Combination tables keyed by input acquisition,
+            shared between the models validating the same acquisition.
+        executor (Optional[Executor]): Executor to run validators on.
 
-            # Check the corresponding field in the input session DataFrame
-            if field_name not in in_acq_series.columns:
-                compliance_summary.append({
-                    "reference acquisition": (ref_acq_name, ref_series_name),
-                    "input acquisition": (in_acq_name, in_series_name),
-                    "field": field_name,
-                    "value": None,
-                    "rule": "Field must be present.",
-                    "message": "Field not found in input session.",
-                    "passed": "❌"
-                })
-                continue
+    Returns:
+        Union[List[Dict[str, Any]], Tuple[BaseValidationModel, List[Tuple[Dict[str, Any], Any]]]]:
+            The compliance issues if the reference model does not exist, otherwise the model and its
+            pending validators, to be passed to `_collect_acquisition_compliance_with_python_module`.
+    """
 
-            actual_value = in_acq_series[field_name].iloc[0]
-
-            # Contains check
-            if contains is not None:
-                if not isinstance(actual_value, list) or contains not in actual_value:
-                    compliance_summary.append({
-                        "reference acquisition": (ref_acq_name, ref_series_name),
-                        "input acquisition": (in_acq_name, in_series_name),
-                        "field": field_name,
-                        "value": actual_value,
-                        "rule": "Field must contain value.",
-                        "message": f"Expected to contain {contains}, got {actual_value}.",
-                        "passed": "❌"
-                    })
-
-            # Tolerance check
-            elif tolerance is not None and isinstance(actual_value, (int, float)):
-                if not (expected_value - tolerance <= actual_value <= expected_value + tolerance):
-                    compliance_summary.append({
-                        "reference acquisition": (ref_acq_name, ref_series_name),
-                        "input acquisition": (in_acq_name, in_series_name),
-                        "field": field_name,
-                        "value": actual_value,
-                        "rule": "Field must be within tolerance.",
-                        "message": f"Expected {expected_value} ± {tolerance}, got {actual_value}.",
-                        "passed": "❌"
-                    })
-
-            # Exact match check
-            elif expected_value is not None and actual_value != expected_value:
-                compliance_summary.append({
-                    "reference acquisition": (ref_acq_name, ref_series_name),
-                    "input acquisition": (in_acq_name, in_series_name),
-                    "field": field_name,
-                    "value": actual_value,
-                    "rule": "Field must match expected value.",
-                    "message": f"Expected {expected_value}, got {actual_value}.",
-                    "passed": "❌"
-                })
+    # Retrieve reference model
+    ref_model_cls = ref_models.get(ref_acq_name)
+    if not ref_model_cls:
+        return [{
+            "reference acquisition": ref_acq_name,
+            "input acquisition": in_acq_name,
+            "field": "Model Error",
+            "value": None,
+            "rule": "Reference model must exist.",
+            "message": f"No model found for reference acquisition '{ref_acq_name}'.",
+            "passed": "❌"
+        }]
+    ref_model = ref_model_cls()
+
+    # Validate using the reference model
+    return ref_model, ref_model._submit_validation(in_acq, tables=tables, executor=executor)
+
+def _collect_acquisition_compliance_with_python_module(
+    submitted: Union[List[Dict[str, Any]], Tuple[BaseValidationModel, List[Tuple[Dict[str, Any], Any]]]],
+    ref_acq_name: str,
+    in_acq_name: str,
+    raise_errors: bool = False,
+    timings: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Wait for the validation of a single input acquisition and build its compliance issues.
+
+    Args:
+        submitted: The result of `_submit_acquisition_compliance_with_python_module`.
+        ref_acq_name (str): The reference acquisition name.
+        in_acq_name (str): The input acquisition name.
+        raise_errors (bool): Whether to raise exceptions for validation failures. Defaults to False.
+        timings (Optional[List[Dict[str, Any]]]): If given, the wall time of each validator is appended to it.
+
+    Returns:
+        List[Dict[str, Any]]: A list of compliance issues for the acquisition.
+
+    Raises:
+        ValueError: If `raise_errors` is True and validation fails.
+    """
+    if isinstance(submitted, list):
+        return submitted
+    ref_model, pending = submitted
+
+    validator_timings = [] if timings is not None else None
+    success, errors, passes = ref_model._collect_validation(pending, timings=validator_timings)
+    if timings is not None:
+        for timing in validator_timings:
+            timings.append({
+                "reference acquisition": ref_acq_name,
+                "input acquisition": in_acq_name,
+                "field": timing["field"],
+                "rule": timing["rule"],
+                "seconds": timing["seconds"],
+            })
+
+    compliance_summary = []
+
+    # Record errors
+    for error in errors:
+        compliance_summary.append({
+            "reference acquisition": ref_acq_name,
+            "reference series": None,
+            "input acquisition": in_acq_name,
+            "input series": None,
+            "field": error['field'],
+            "value": error['value'],
+            "rule": error['rule'],
+            "message": error['message'],
+            "passed": "❌"
+        })
+
+    # Record passes
+    for passed_test in passes:
+        compliance_summary.append({
+            "reference acquisition": ref_acq_name,
+            "reference series": None,
+            "input acquisition": in_acq_name,
+            "input series": None,
+            "field": passed_test['field'],
+            "value": passed_test['value'],
+            "rule": passed_test['rule'],
+            "message": passed_test['message'],
+            "passed": "✅"
+        })
+
+    # Raise an error if validation fails and `raise_errors` is True
+    if raise_errors and not success:
+        raise ValueError(f"Validation failed for acquisition '{in_acq_name}'.")
 
     return compliance_summary
 
+@profiling.timed("validation")
 def check_session_compliance_with_python_module(
-    in_session: pd.DataFrame,
+    in_session: Union[pd.DataFrame, Iterable[pd.DataFrame]],
     ref_models: Dict[str, BaseValidationModel],
     session_map: Dict[str, str],
-    raise_errors: bool = False
+    raise_errors: bool = False,
+    executor: Optional[Executor] = None,
+    timings: Optional[List[Dict[str, Any]]] = None
 ) -> List[Dict[str, Any]]:
     """
     Validate a DICOM session against Python module-based validation models.
 
+    Notes:
+        - `in_session` may also be an iterable of session chunks, which are consumed one at a time.
+          Each chunk must hold complete acquisitions (e.g., `iter_dicom_session` with its default
+          `by_acquisition=True`).
+        - With an `executor`, the validators of all acquisitions in a chunk are submitted before any
+          result is awaited; issues are still reported in the order of the session map.
+
     Args:
-        in_session (pd.DataFrame): Input session DataFrame containing DICOM metadata.
+        in_session (Union[pd.DataFrame, Iterable[pd.DataFrame]]): Input session DataFrame containing
+            DICOM metadata, or an iterable of session chunks.
         ref_models (Dict[str, BaseValidationModel]): Dictionary mapping acquisition names to 
             validation models.
         session_map (Dict[str, str]): Mapping of reference acquisitions to input acquisitions.
         raise_errors (bool): Whether to raise exceptions for validation failures. Defaults to False.
+        executor (Optional[Executor]): Thread or process pool to run validators on. Defaults to
+            running them in the calling thread. A `ProcessPoolExecutor` requires the models to be
+            importable by the worker processes.
+        timings (Optional[List[Dict[str, Any]]]): If given, the wall time of each validator is appended
+            to it as a dictionary with `reference acquisition`, `input acquisition`, `field`, `rule`
+            and `seconds`.
 
     Returns:
         List[Dict[str, Any]]: A list of compliance issues, where each issue is represented as a dictionary.
     
     Raises:
-        ValueError: If `raise_errors` is True and validation fails for any acquisition.
+        ValueError: If `raise_errors` is True and validation fails for any acquisition, or if an
+            acquisition is split across several chunks.
     """
-    compliance_summary = []
+    if timings is None:
+        timings = profiling.validator_timings()
+
+    acquisition_issues = {}
+    seen_acquisitions = set()
+
+    for chunk in _iter_session_chunks(in_session):
+        # Partition the chunk by acquisition once
+        profiling.count("groupbys")
+        acquisition_rows = chunk.groupby("Acquisition", sort=False).indices
+        chunk_acquisitions = set(acquisition_rows)
+        split_acquisitions = chunk_acquisitions & seen_acquisitions
+        if split_acquisitions:
+            raise ValueError(f"Acquisitions {sorted(split_acquisitions)} are split across several session chunks.")
+        seen_acquisitions |= chunk_acquisitions
+
+        # Combination tables of each input acquisition, shared by all models mapped to it
+        tables = {}
+        submitted = {}
+        for ref_acq_name, in_acq_name in session_map.items():
+            if ref_acq_name in acquisition_issues or in_acq_name not in chunk_acquisitions:
+                continue
 
-    for ref_acq_name, in_acq_name in session_map.items():
-        # Filter the input session for the current acquisition
-        in_acq = in_session[in_session["Acquisition"] == in_acq_name]
+            in_acq = chunk.iloc[acquisition_rows[in_acq_name]]
+            submitted[ref_acq_name] = _submit_acquisition_compliance_with_python_module(
+                in_acq, ref_models, ref_acq_name, in_acq_name, tables=tables, executor=executor
+            )
+
+        for ref_acq_name, pending in submitted.items():
+            acquisition_issues[ref_acq_name] = _collect_acquisition_compliance_with_python_module(
+                pending, ref_acq_name, session_map[ref_acq_name], raise_errors=raise_errors, timings=timings
+            )
 
-        if in_acq.empty:
+    # Report issues in the order of the session map
+    compliance_summary = []
+    for ref_acq_name, in_acq_name in session_map.items():
+        if ref_acq_name not in acquisition_issues:
             compliance_summary.append({
                 "reference acquisition": ref_acq_name,
                 "input acquisition": in_acq_name,
@@ -168,59 +425,7 @@ def check_session_compliance_with_python_module(
                 "passed": "❌"
             })
             continue
-
-        # Retrieve reference model
-        ref_model_cls = ref_models.get(ref_acq_name)
-        if not ref_model_cls:
-            compliance_summary.append({
-                "reference acquisition": ref_acq_name,
-                "input acquisition": in_acq_name,
-                "field": "Model Error",
-                "value": None,
-                "rule": "Reference model must exist.",
-                "message": f"No model found for reference acquisition '{ref_acq_name}'.",
-                "passed": "❌"
-            })
-            continue
-        ref_model = ref_model_cls()
-
-        # Prepare acquisition data as a single DataFrame
-        acquisition_df = in_acq.copy()
-
-        # Validate using the reference model
-        success, errors, passes = ref_model.validate(data=acquisition_df)
-
-        # Record errors
-        for error in errors:
-            compliance_summary.append({
-                "reference acquisition": ref_acq_name,
-                "reference series": None,
-                "input acquisition": in_acq_name,
-                "input series": None,
-                "field": error['field'],
-                "value": error['value'],
-                "rule": error['rule'],
-                "message": error['message'],
-                "passed": "❌"
-            })
-
-        # Record passes
-        for passed_test in passes:
-            compliance_summary.append({
-                "reference acquisition": ref_acq_name,
-                "reference series": None,
-                "input acquisition": in_acq_name,
-                "input series": None,
-                "field": passed_test['field'],
-                "value": passed_test['value'],
-                "rule": passed_test['rule'],
-                "message": passed_test['message'],
-                "passed": "✅"
-            })
-
-        # Raise an error if validation fails and `raise_errors` is True
-        if raise_errors and not success:
-            raise ValueError(f"Validation failed for acquisition '{in_acq_name}'.")
+        compliance_summary.extend(acquisition_issues[ref_acq_name])
 
     return compliance_summary
 
@@ -4,67 +4,515 @@ This module contains functions for loading and processing DICOM data, JSON refer
 """
 
 import os
+import re
+import time
+import struct
+import tempfile
+import warnings
+import zlib
 import pydicom
 import json
+import numpy as np
 import pandas as pd
 import importlib.util
 
+from concurrent.futures import ProcessPoolExecutor
+
+from pydicom.datadict import tag_for_keyword
+from pydicom.filereader import read_partial
 from pydicom.multival import MultiValue
+from pydicom.tag import Tag
 from pydicom.uid import UID
 from pydicom.valuerep import PersonName, DSfloat, IS
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import List, Optional, Dict, Any, Union, Tuple, Iterable, Iterator
 from io import BytesIO
 
+from . import profiling
+from .cache import DicomHeaderCache
 from .utils import clean_string, convert_jsproxy, make_hashable, normalize_numeric_values
 from .validation import BaseValidationModel
 
-def get_dicom_values(ds: pydicom.dataset.FileDataset) -> Dict[str, Any]:
+# Value representations holding numbers, whose multiple values are converted in bulk
+_NUMERIC_VRS = {"DS", "IS", "FD", "FL", "US", "SS", "UL", "SL", "UV", "SV"}
+# Value representations holding raw bytes, skipped unless requested
+_BINARY_VRS = {"OB", "OW", "OD", "OF", "OL", "OV", "UN"}
+# Values are truncated to this many characters
+_MAX_VALUE_LENGTH = 50
+# Sequence policies accepted by `get_dicom_values`, besides a maximum depth
+_SEQUENCE_POLICIES = {"all", "skip", "shared", "lazy"}
+# Sequences holding one item per frame, left out by the "shared" policy
+_PER_FRAME_SEQUENCES = {"PerFrameFunctionalGroupsSequence"}
+# Frame modes accepted by `load_dicom`
+_FRAME_MODES = {"expand", "runs"}
+# Per-frame columns are returned under this key by `load_dicom` with `frames` set
+_FRAME_VALUES_KEY = "__frames__"
+_FUNCTIONAL_GROUP_SEQUENCES = ["SharedFunctionalGroupsSequence", "PerFrameFunctionalGroupsSequence"]
+# Functional group keywords that stand in for the keywords of classic (single-frame) images
+_FRAME_ALIASES = {"EffectiveEchoTime": "EchoTime", "FrameType": "ImageType"}
+# Per-frame keywords that differ between slices; dropped when frames are compacted into runs
+_FRAME_POSITION_KEYWORDS = {
+    "ImagePositionPatient", "InStackPositionNumber", "DimensionIndexValues", "SliceLocation",
+    "FrameAcquisitionNumber", "FrameAcquisitionDateTime", "FrameReferenceDateTime", "TemporalPositionIndex",
+}
+_FLOAT_VRS = {"DS", "FD", "FL"}
+# Marks files whose header prefix was truncated in `_load_session_chunk` output
+_TRUNCATED_KEY = "__truncated__"
+# A component of a dotted field path: a keyword and an optional item index
+_PATH_COMPONENT = re.compile(r"([A-Za-z][A-Za-z0-9]*)(?:\[(\d+)\])?")
+
+class TruncatedHeaderError(ValueError):
+    """
+    Raised when a header prefix ends before the elements that need to be read from it.
+
+    Attributes:
+        bytes_needed (int): The length of the prefix needed to read further, at most the file size.
+        files (Dict[str, int]): For sessions, the prefix length needed for each truncated file.
+    """
+
+    def __init__(self, message: str, bytes_needed: int, files: Optional[Dict[str, int]] = None):
+        super().__init__(message)
+        self.bytes_needed = bytes_needed
+        self.files = files or {}
+
+def _convert_value(value: Any) -> Any:
+    """
+    Convert a non-sequence DICOM value to a plain Python value.
+    """
+    if isinstance(value, MultiValue):
+        try:
+            return [int(float(item)) if int(float(item)) == float(item) else float(item) for item in value]
+        except ValueError:
+            return [item for item in value]
+    elif isinstance(value, (UID, PersonName)):
+        return str(value)
+    elif isinstance(value, (DSfloat, float)):
+        return float(value)
+    elif isinstance(value, (IS, int)):
+        return int(value)
+    else:
+        return str(value)[:_MAX_VALUE_LENGTH]
+
+def _convert_numbers(values: MultiValue) -> List[Any]:
+    """
+    Convert multiple numeric values at once, keeping integral values as `int`.
+    """
+    try:
+        array = np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        return _convert_value(values)
+    if np.isnan(array).any():
+        return [item for item in values]
+    is_integer = np.isfinite(array) & (array == np.trunc(array))
+    return [int(item) if integer else item for item, integer in zip(array.tolist(), is_integer.tolist())]
+
+def _convert_binary(value: Any) -> str:
+    """
+    Convert a binary value to a truncated string without building the string of the whole value.
+    """
+    if not isinstance(value, bytes):
+        return _convert_value(value)
+    head = value[:_MAX_VALUE_LENGTH]
+    # The quotes of a bytes literal depend on the whole value
+    if (b"'" in value and b'"' not in value) != (b"'" in head and b'"' not in head):
+        return str(value)[:_MAX_VALUE_LENGTH]
+    return str(head)[:_MAX_VALUE_LENGTH]
+
+def _check_sequence_policy(sequences: Union[str, int]):
+    """
+    Raise a ValueError for an unknown sequence policy.
+    """
+    if isinstance(sequences, bool) or not (
+        sequences in _SEQUENCE_POLICIES or (isinstance(sequences, int) and sequences >= 0)
+    ):
+        raise ValueError(
+            f"Invalid sequence policy {sequences!r}; expected one of {sorted(_SEQUENCE_POLICIES)} or a depth >= 0."
+        )
+
+def get_dicom_values(
+    ds: pydicom.dataset.FileDataset,
+    include_binary: bool = False,
+    vr_stats: Optional[Dict[str, Dict[str, float]]] = None,
+    sequences: Union[str, int] = "all",
+) -> Dict[str, Any]:
     """
     Convert a DICOM dataset to a dictionary, handling sequences and DICOM-specific data types.
     
     Notes:
-        - Sequences are recursively processed.
+        - Sequences are recursively processed according to `sequences`:
+            - `"all"`: every sequence is converted into a list of nested dictionaries.
+            - `"skip"` or `"lazy"`: sequences are left out. With `"lazy"`, values inside sequences
+              are only read through dotted field paths (see `get_dicom_path_value`).
+            - `"shared"`: like `"all"`, except for per-frame sequences (e.g.,
+              `PerFrameFunctionalGroupsSequence`), which are left out.
+            - An integer N: sequences nested more than N levels deep are left out (0 is `"skip"`).
         - Common DICOM data types (e.g., UID, PersonName) are converted to strings.
-        - Numeric values are normalized.
+        - Numeric values are normalized; multiple values of numeric VRs are converted in bulk.
+        - Binary values (VRs OB, OW, OD, OF, OL, OV and UN) are skipped unless `include_binary`
+          is True, in which case they are truncated like other values.
 
     Args:
         ds (pydicom.dataset.FileDataset): The DICOM dataset to process.
+        include_binary (bool): Whether to include elements with binary VRs.
+        vr_stats (Optional[Dict[str, Dict[str, float]]]): If given, the number of elements and the
+            time spent converting them (in seconds, including nested sequence items) are added to
+            `vr_stats[VR]["count"]` and `vr_stats[VR]["seconds"]`.
+        sequences (Union[str, int]): The sequence policy: `"all"`, `"skip"`, `"shared"`, `"lazy"`
+            or a maximum nesting depth.
 
     Returns:
         Dict[str, Any]: A dictionary of extracted DICOM metadata, excluding pixel data.
+
+    Raises:
+        ValueError: If `sequences` is not a valid sequence policy.
     """
-    dicom_dict = {}
+    _check_sequence_policy(sequences)
 
-    def process_element(element):
-        if element.VR == 'SQ':
-            return [get_dicom_values(item) for item in element]
-        elif isinstance(element.value, MultiValue):
-            try:
-                return [int(float(item)) if int(float(item)) == float(item) else float(item) for item in element.value]
-            except ValueError:
-                return [item for item in element.value]
-        elif isinstance(element.value, (UID, PersonName)):
-            return str(element.value)
-        elif isinstance(element.value, (DSfloat, float)):
-            return float(element.value)
-        elif isinstance(element.value, (IS, int)):
-            return int(element.value)
-        else:
-            return str(element.value)[:50]
+    if sequences in ("skip", "lazy", 0):
+        keep_sequence = lambda element: False
+        item_sequences = sequences
+    elif sequences == "shared":
+        keep_sequence = lambda element: element.keyword not in _PER_FRAME_SEQUENCES
+        item_sequences = sequences
+    else:
+        keep_sequence = lambda element: True
+        item_sequences = sequences if sequences == "all" else sequences - 1
 
+    dicom_dict = {}
     for element in ds:
         if element.tag == 0x7fe00010:  # skip pixel data
             continue
-        dicom_dict[element.keyword] = process_element(element)
+        if not include_binary and element.VR in _BINARY_VRS:
+            continue
+        if element.VR == 'SQ' and not keep_sequence(element):
+            continue
+        if vr_stats is None:
+            dicom_dict[element.keyword] = _convert_element(element, include_binary, vr_stats, item_sequences)
+        else:
+            start = time.perf_counter()
+            dicom_dict[element.keyword] = _convert_element(element, include_binary, vr_stats, item_sequences)
+            stats = vr_stats.setdefault(element.VR, {"count": 0, "seconds": 0.0})
+            stats["count"] += 1
+            stats["seconds"] += time.perf_counter() - start
 
     return dicom_dict
 
-def load_dicom(dicom_file: Union[str, bytes]) -> Dict[str, Any]:
+def _convert_element(
+    element: pydicom.DataElement,
+    include_binary: bool = True,
+    vr_stats: Optional[Dict[str, Dict[str, float]]] = None,
+    sequences: Union[str, int] = "all",
+) -> Any:
+    """
+    Convert a single data element, dispatching on its VR.
+    """
+    vr = element.VR
+    if vr == 'SQ':
+        return [get_dicom_values(item, include_binary=include_binary, vr_stats=vr_stats, sequences=sequences) for item in element]
+    elif vr in _NUMERIC_VRS and isinstance(element.value, MultiValue):
+        return _convert_numbers(element.value)
+    elif vr == 'PN' and isinstance(element.value, MultiValue):
+        return [str(name) for name in element.value]
+    elif vr in _BINARY_VRS:
+        return _convert_binary(element.value)
+    else:
+        return _convert_value(element.value)
+
+def _parse_field_path(path: str) -> List[Tuple[str, Optional[int]]]:
+    """
+    Split a dotted field path into keywords and optional item indices.
+
+    Args:
+        path (str): A path such as `PerFrameFunctionalGroupsSequence[0].MREchoSequence.EffectiveEchoTime`.
+
+    Returns:
+        List[Tuple[str, Optional[int]]]: The keyword and item index (None if absent) of each component.
+
+    Raises:
+        ValueError: If a component is not of the form `Keyword` or `Keyword[index]`.
+    """
+
+    components = []
+    for component in path.split("."):
+        match = _PATH_COMPONENT.fullmatch(component)
+        if match is None:
+            raise ValueError(f"Invalid field path {path!r}.")
+        keyword, index = match.groups()
+        components.append((keyword, None if index is None else int(index)))
+    return components
+
+_MISSING = object()
+
+def _convert_frame_column(elements: List[Any]) -> List[Any]:
+    """
+    Convert the elements of a per-frame column, with None for frames lacking the element.
+
+    Notes:
+        - Single-valued float VRs are converted in one NumPy pass; other elements are converted
+          like top-level elements.
+    """
+    present = [element for element in elements if element is not _MISSING]
+    vr = present[0].VR
+    converted = None
+    if vr in _FLOAT_VRS and not any(isinstance(element.value, MultiValue) for element in present):
+        try:
+            converted = np.array([element.value for element in present], dtype=float).tolist()
+        except (TypeError, ValueError):
+            pass
+    if converted is None:
+        converted = [_convert_element(element) for element in present]
+    if len(present) == len(elements):
+        return converted
+    converted = iter(converted)
+    return [None if element is _MISSING else next(converted) for element in elements]
+
+def get_frame_values(
+    ds: pydicom.dataset.Dataset,
+    fields: Optional[Iterable[str]] = None,
+    runs: bool = False,
+) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+    """
+    Extract the shared and per-frame functional group values of an enhanced multi-frame dataset.
+
+    Notes:
+        - The elements of each functional group macro (e.g., `MREchoSequence`) are flattened to
+          their keywords, so `EffectiveEchoTime` becomes a column rather than a nested sequence.
+        - `EffectiveEchoTime` and `FrameType` are also returned as `EchoTime` and `ImageType`, so
+          that references and validators written for classic images apply to frames.
+        - Values are gathered per keyword across frames (one list per column, no per-frame
+          dictionaries) and single-valued float columns are converted in bulk.
+        - With `runs`, consecutive frames with identical values are compacted into a single entry
+          with a `FrameCount`; per-slice keywords such as `ImagePositionPatient` are dropped.
+
+    Args:
+        ds (pydicom.dataset.Dataset): The DICOM dataset with functional group sequences.
+        fields (Optional[Iterable[str]]): Keywords to extract (or their aliases). Defaults to all.
+        runs (bool): Whether to compact consecutive identical frames into runs.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, List[Any]]]: Values shared by all frames, and per-frame
+            columns with one value per frame (or run), including `FrameNumber` (the first frame of
+            each run) and, with `runs`, `FrameCount`.
+    """
+
+    wanted = None if fields is None else set(fields)
+
+    def keep(keyword):
+        return wanted is None or keyword in wanted or _FRAME_ALIASES.get(keyword) in wanted
+
+    def functional_group_elements(item):
+        for group in item:
+            if group.VR == "SQ" and len(group.value):
+                yield from (element for element in group.value[0] if keep(element.keyword))
+
+    shared_values = {}
+    if "SharedFunctionalGroupsSequence" in ds and len(ds.SharedFunctionalGroupsSequence):
+        for element in functional_group_elements(ds.SharedFunctionalGroupsSequence[0]):
+            shared_values[element.keyword] = _convert_element(element)
+
+    frames = ds.PerFrameFunctionalGroupsSequence if "PerFrameFunctionalGroupsSequence" in ds else []
+    n_frames = len(frames)
+    frame_elements = {}
+    for i, frame in enumerate(frames):
+        for element in functional_group_elements(frame):
+            column = frame_elements.get(element.keyword)
+            if column is None:
+                column = frame_elements[element.keyword] = [_MISSING] * n_frames
+            column[i] = element
+    frame_values = {keyword: _convert_frame_column(column) for keyword, column in frame_elements.items()}
+
+    for values in (shared_values, frame_values):
+        for keyword, alias in _FRAME_ALIASES.items():
+            if keyword in values and alias not in values:
+                values[alias] = values[keyword]
+
+    frame_numbers = list(range(1, n_frames + 1))
+    if runs:
+        frame_values = {
+            keyword: column for keyword, column in frame_values.items() if keyword not in _FRAME_POSITION_KEYWORDS
+        }
+        keys = list(zip(*(map(make_hashable, column) for column in frame_values.values()))) or [()] * n_frames
+        starts = [i for i in range(n_frames) if i == 0 or keys[i] != keys[i - 1]]
+        frame_values = {keyword: [column[i] for i in starts] for keyword, column in frame_values.items()}
+        frame_values["FrameCount"] = np.diff(starts + [n_frames]).tolist()
+        frame_numbers = [i + 1 for i in starts]
+    frame_values["FrameNumber"] = frame_numbers
+
+    return shared_values, frame_values
+
+def get_dicom_path_value(ds: pydicom.dataset.Dataset, path: str, default: Any = None) -> Any:
+    """
+    Look up a value inside nested sequences using a dotted field path.
+
+    Notes:
+        - Every component but the last must be a sequence keyword, optionally followed by an item
+          index (e.g., `PerFrameFunctionalGroupsSequence[0]`).
+        - A sequence without an index descends into its only item, or into every item if it has
+          several; the values of all items are then returned as a list (None for items lacking the
+          element).
+        - Only the elements on the path are converted, so large sequences are never materialized.
+
+    Args:
+        ds (pydicom.dataset.Dataset): The DICOM dataset to search.
+        path (str): Dotted path, such as
+            `SharedFunctionalGroupsSequence.MRTimingAndRelatedParametersSequence.RepetitionTime`.
+        default (Any): The value returned if the path does not exist.
+
+    Returns:
+        Any: The converted value, a list of values for paths through several sequence items, or `default`.
+
+    Raises:
+        ValueError: If `path` is not a valid field path.
+    """
+
+    def resolve(dataset, components):
+        keyword, index = components[0]
+        if keyword not in dataset:
+            return _MISSING
+        element = dataset[keyword]
+        if index is not None and element.VR != "SQ":
+            return _MISSING
+        if len(components) == 1:
+            if index is not None:
+                return get_dicom_values(element.value[index]) if index < len(element.value) else _MISSING
+            return _convert_element(element)
+        if element.VR != "SQ":
+            return _MISSING
+
+        if index is not None:
+            return resolve(element.value[index], components[1:]) if index < len(element.value) else _MISSING
+        if len(element.value) == 1:
+            return resolve(element.value[0], components[1:])
+        values = [resolve(item, components[1:]) for item in element.value]
+        if all(value is _MISSING for value in values):
+            return _MISSING
+        return [None if value is _MISSING else value for value in values]
+
+    value = resolve(ds, _parse_field_path(path))
+    return default if value is _MISSING else value
+
+def _fields_to_tags(fields: Iterable[str]) -> List[Tag]:
+    """
+    Convert DICOM keywords to sorted tags, ignoring names that are not DICOM keywords.
+
+    Notes:
+        - For dotted field paths, the tag of the top-level sequence is used.
+
+    Args:
+        fields (Iterable[str]): DICOM keywords (e.g., `EchoTime`) or dotted field paths.
+
+    Returns:
+        List[Tag]: The sorted tags of all recognised keywords.
+    """
+
+    tags = set()
+    for field in fields:
+        tag = tag_for_keyword(_PATH_COMPONENT.match(field).group(1) if "." in field or "[" in field else field)
+        if tag is not None:
+            tags.add(Tag(tag))
+    return sorted(tags)
+
+def _read_header_prefix(buffer: bytes, file_size: int, tags: Optional[List[Tag]] = None) -> pydicom.Dataset:
+    """
+    Parse the first bytes of a DICOM file, checking that they hold every element that is needed.
+
+    Notes:
+        - Reading stops at pixel data and, if `tags` is given, after the highest requested tag.
+        - An element whose value runs past the end of the buffer stops the parse, and the prefix
+          length needed to read it (but at least twice the current length, to bound the number of
+          retries) is reported. If the buffer ends before reading stops or cannot be parsed (e.g.,
+          inside an undefined-length sequence), twice the current length is requested.
+          Deflated datasets need the whole file.
+
+    Args:
+        buffer (bytes): The first bytes of the file.
+        file_size (int): The size of the whole file.
+        tags (Optional[List[Tag]]): Sorted tags to read. Defaults to all elements.
+
+    Returns:
+        pydicom.Dataset: The parsed dataset.
+
+    Raises:
+        TruncatedHeaderError: If the buffer ends before the needed elements.
+    """
+
+    fp = BytesIO(buffer)
+    last_tag = None if tags is None else (tags[-1] if tags else -1)
+    state = {"stopped": False, "needed": None}
+
+    def stop_when(tag, vr, length):
+        if tag >= 0x7fe00010 or (last_tag is not None and tag > last_tag):
+            state["stopped"] = True
+            return True
+        if length != 0xFFFFFFFF and fp.tell() + length > len(buffer):
+            state["needed"] = max(fp.tell() + length, 2 * len(buffer))
+            return True
+        return False
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # pydicom warns when the buffer ends early
+            ds = read_partial(fp, stop_when=stop_when, defer_size=len(buffer), force=True, specific_tags=tags)
+    except (EOFError, OSError, struct.error):
+        state["needed"] = 2 * len(buffer)
+    except zlib.error:
+        state["needed"] = file_size  # deflated datasets can only be read as a whole
+
+    if state["needed"] is None and not state["stopped"]:
+        state["needed"] = 2 * len(buffer)
+    if state["needed"] is not None:
+        bytes_needed = min(state["needed"], file_size)
+        raise TruncatedHeaderError(
+            f"DICOM header is truncated: {len(buffer)} of {file_size} bytes read, {bytes_needed} needed.",
+            bytes_needed,
+        )
+    return ds
+
+def load_dicom(
+    dicom_file: Union[str, bytes],
+    fields: Optional[Iterable[str]] = None,
+    include_binary: bool = False,
+    vr_stats: Optional[Dict[str, Dict[str, float]]] = None,
+    sequences: Union[str, int] = "all",
+    frames: Optional[str] = None,
+    file_size: Optional[int] = None,
+) -> Dict[str, Any]:
     """
     Load a DICOM file and extract its metadata as a dictionary.
 
+    Notes:
+        - If `fields` is given, only those top-level elements are decoded and reading stops
+          after the highest requested tag. Names that are not DICOM keywords are ignored.
+        - Dotted field paths in `fields` (e.g.,
+          `SharedFunctionalGroupsSequence.MRTimingAndRelatedParametersSequence.RepetitionTime`)
+          are returned under the path itself; see `get_dicom_path_value`. Sequences read only to
+          resolve such paths are not returned as a whole.
+        - `sequences` sets how the remaining sequences are converted (see `get_dicom_values`).
+        - With `frames` set to `"expand"` or `"runs"`, the functional groups of enhanced multi-frame
+          files are extracted with `get_frame_values`: shared values are merged into the result and
+          the per-frame columns are stored under a private key, which `load_dicom_session` expands
+          into one row per frame (or run). The functional group sequences themselves are dropped
+          unless requested in `fields`.
+        - `SpecificCharacterSet` is always read if present so text values decode correctly.
+        - Elements with binary VRs are skipped unless `include_binary` is True or they are
+          requested in `fields`.
+        - If `dicom_file` is bytes and `file_size` is larger than their length, the bytes are
+          treated as a header prefix (e.g., the first 4096 bytes sent by the browser frontend). A
+          TruncatedHeaderError reporting the prefix length needed is raised if the prefix ends before
+          the pixel data (or, with `fields`, before the requested elements), so that a longer prefix
+          can be supplied instead of returning partial values.
+
     Args:
         dicom_file (Union[str, bytes]): Path to the DICOM file or file content in bytes.
+        fields (Optional[Iterable[str]]): DICOM keywords or dotted field paths to extract.
+            Defaults to all elements.
+        include_binary (bool): Whether to include elements with binary VRs (e.g., OB, UN).
+        vr_stats (Optional[Dict[str, Dict[str, float]]]): Per-VR conversion counts and times,
+            accumulated as in `get_dicom_values`.
+        sequences (Union[str, int]): The sequence policy: `"all"`, `"skip"`, `"shared"`, `"lazy"`
+            or a maximum nesting depth.
+        frames (Optional[str]): `"expand"` or `"runs"` to extract per-frame values of enhanced
+            multi-frame files. Defaults to None (one entry per file).
+        file_size (Optional[int]): The size of the whole file if `dicom_file` holds only its first bytes.
 
     Returns:
         Dict[str, Any]: A dictionary of DICOM metadata, with normalized and truncated values.
@@ -72,19 +520,456 @@ def load_dicom(dicom_file: Union[str, bytes]) -> Dict[str, Any]:
     Raises:
         FileNotFoundError: If the specified DICOM file path does not exist.
         pydicom.errors.InvalidDicomError: If the file is not a valid DICOM file.
+        ValueError: If `sequences`, `frames` or a field path is invalid.
+        TruncatedHeaderError: If a header prefix ends before the elements that are needed.
     """
 
-    if isinstance(dicom_file, (bytes, memoryview)):
-        ds = pydicom.dcmread(BytesIO(dicom_file), stop_before_pixels=False, force=True, defer_size=len(dicom_file))
+    _check_sequence_policy(sequences)
+    if frames is not None and frames not in _FRAME_MODES:
+        raise ValueError(f"Invalid frame mode {frames!r}; expected one of {sorted(_FRAME_MODES)} or None.")
+
+    is_prefix = isinstance(dicom_file, (bytes, memoryview)) and file_size is not None and len(dicom_file) < file_size
+
+    if fields is None:
+        paths = []
+        with profiling.span("dcmread"):
+            if is_prefix:
+                ds = _read_header_prefix(dicom_file, file_size)
+                bytes_read = len(dicom_file)
+            elif isinstance(dicom_file, (bytes, memoryview)):
+                fp = BytesIO(dicom_file)
+                ds = pydicom.dcmread(fp, stop_before_pixels=False, force=True, defer_size=len(dicom_file))
+                bytes_read = fp.tell()
+            else:
+                with open(dicom_file, "rb") as fp:
+                    ds = pydicom.dcmread(fp, stop_before_pixels=True)
+                    bytes_read = fp.tell()
     else:
-        ds = pydicom.dcmread(dicom_file, stop_before_pixels=True)
-    
-    return get_dicom_values(ds)
+        fields = list(fields)
+        paths = [field for field in fields if "." in field or "[" in field]
+        tags = _fields_to_tags(fields + (_FUNCTIONAL_GROUP_SEQUENCES if frames is not None else []))
+        last_tag = tags[-1] if tags else None
+
+        def stop_when(tag, vr, length):
+            return last_tag is None or tag > last_tag
+
+        with profiling.span("dcmread"):
+            if is_prefix:
+                ds = _read_header_prefix(dicom_file, file_size, tags)
+                bytes_read = len(dicom_file)
+            elif isinstance(dicom_file, (bytes, memoryview)):
+                fp = BytesIO(dicom_file)
+                ds = read_partial(fp, stop_when=stop_when, defer_size=len(dicom_file), force=True, specific_tags=tags)
+                bytes_read = fp.tell()
+            else:
+                with open(dicom_file, "rb") as fp:
+                    ds = read_partial(fp, stop_when=stop_when, specific_tags=tags)
+                    bytes_read = fp.tell()
+        # Binary elements are only present here if they were requested
+        include_binary = True
+    profiling.count("files read")
+    profiling.count("bytes read", bytes_read)
+
+    path_values = {}
+    for path in paths:
+        value = get_dicom_path_value(ds, path, default=_MISSING)
+        if value is not _MISSING:
+            path_values[path] = value
+
+    shared_values, frame_values = {}, None
+    if frames is not None and any(keyword in ds for keyword in _FUNCTIONAL_GROUP_SEQUENCES):
+        with profiling.span("get_frame_values"):
+            shared_values, frame_values = get_frame_values(ds, fields=fields, runs=frames == "runs")
+        if not frame_values["FrameNumber"]:
+            frame_values = None  # no per-frame groups; the file stays a single row
+
+    # Drop sequences that were only read to resolve paths or expand frames
+    read_only = {_PATH_COMPONENT.match(path).group(1) for path in paths}
+    if frames is not None:
+        read_only.update(_FUNCTIONAL_GROUP_SEQUENCES)
+    for keyword in read_only - set(fields or []):
+        if keyword in ds:
+            del ds[keyword]
+
+    if vr_stats is None:
+        vr_stats = profiling.vr_stats()
+    with profiling.span("get_dicom_values"):
+        dicom_values = get_dicom_values(ds, include_binary=include_binary, vr_stats=vr_stats, sequences=sequences)
+    dicom_values.update(shared_values)
+    dicom_values.update(path_values)
+    if frame_values is not None:
+        dicom_values[_FRAME_VALUES_KEY] = frame_values
+    return dicom_values
+
+def _load_session_chunk(
+    chunk: List[Tuple[str, Optional[bytes]]],
+    fields: Optional[List[str]] = None,
+    sequences: Union[str, int] = "all",
+    frames: Optional[str] = None,
+    file_sizes: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Load a chunk of session files; used as the unit of work for the process pool.
+
+    Args:
+        chunk (List[Tuple[str, Optional[bytes]]]): Pairs of file path and optional byte content.
+        fields (Optional[List[str]]): DICOM keywords to extract. Defaults to all elements.
+        sequences (Union[str, int]): The sequence policy passed to `load_dicom`.
+        frames (Optional[str]): The frame mode passed to `load_dicom`.
+        file_sizes (Optional[Dict[str, int]]): Sizes of the whole files whose content is a header prefix.
+
+    Returns:
+        List[Dict[str, Any]]: DICOM metadata for each file, in the order of `chunk`. Truncated header
+            prefixes give `{_TRUNCATED_KEY: bytes_needed}` instead.
+    """
+
+    file_sizes = file_sizes or {}
+    chunk_values = []
+    for dicom_path, dicom_content in chunk:
+        try:
+            chunk_values.append(load_dicom(
+                dicom_content if dicom_content is not None else dicom_path,
+                fields=fields,
+                sequences=sequences,
+                frames=frames,
+                file_size=file_sizes.get(dicom_path),
+            ))
+        except TruncatedHeaderError as e:
+            chunk_values.append({_TRUNCATED_KEY: e.bytes_needed})
+    return chunk_values
+
+def _iter_session_files(
+    session_files: List[Tuple[str, Optional[bytes]]],
+    workers: Optional[int] = 1,
+    chunk_size: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    cache: Optional[DicomHeaderCache] = None,
+    sequences: Union[str, int] = "all",
+    frames: Optional[str] = None,
+    file_sizes: Optional[Dict[str, int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Load a list of session files, optionally fanning out over a process pool.
+
+    Notes:
+        - Files are split into contiguous chunks and results are yielded in input order,
+          so the output is identical to the serial path.
+        - `workers=None` uses one worker per CPU.
+        - Files read from disk are looked up in `cache` first; only missed files are parsed,
+          and their values are added to the cache.
+        - The `DICOM_Path` and integer `InstanceNumber` bookkeeping fields are added to each entry.
+        - Files whose header prefix is truncated (see `load_dicom`) are not yielded; once all other
+          files are loaded, a TruncatedHeaderError listing them is raised.
+
+    Args:
+        session_files (List[Tuple[str, Optional[bytes]]]): Pairs of file path and optional byte content.
+        workers (Optional[int]): Number of worker processes. Values of 1 or less load serially.
+        chunk_size (Optional[int]): Number of files per task. Defaults to spreading the files
+            over roughly four tasks per worker.
+        fields (Optional[List[str]]): DICOM keywords to extract. Defaults to all elements.
+        cache (Optional[DicomHeaderCache]): Header cache for files read from disk.
+        sequences (Union[str, int]): The sequence policy passed to `load_dicom`.
+        frames (Optional[str]): The frame mode passed to `load_dicom`.
+        file_sizes (Optional[Dict[str, int]]): Sizes of the whole files whose content is a header prefix.
+
+    Yields:
+        Dict[str, Any]: DICOM metadata for each file, in the order of `session_files`.
+
+    Raises:
+        TruncatedHeaderError: If any header prefix is truncated, with the bytes needed per file.
+    """
+
+    cached = {}
+    files_to_load = []
+    for i, (dicom_path, dicom_content) in enumerate(session_files):
+        dicom_values = cache.get(dicom_path, fields, sequences=sequences, frames=frames) if cache is not None and dicom_content is None else None
+        if dicom_values is None:
+            files_to_load.append(session_files[i])
+        else:
+            cached[i] = dicom_values
+    if cache is not None:
+        profiling.count("cache hits", len(cached))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(files_to_load) // (workers * 4)))
+    chunks = [files_to_load[i:i + chunk_size] for i in range(0, len(files_to_load), chunk_size)]
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(files_to_load) > 1 else None
+    try:
+        if executor is None:
+            loaded_chunks = (_load_session_chunk(chunk, fields, sequences, frames, file_sizes) for chunk in chunks)
+        else:
+            chunk_file_sizes = [
+                {dicom_path: file_sizes[dicom_path] for dicom_path, _ in chunk if dicom_path in file_sizes} if file_sizes else None
+                for chunk in chunks
+            ]
+            loaded_chunks = executor.map(
+                _load_session_chunk, chunks, [fields] * len(chunks), [sequences] * len(chunks), [frames] * len(chunks),
+                chunk_file_sizes,
+            )
+        loaded = (
+            (dicom_path, dicom_content, dicom_values)
+            for chunk, chunk_data in zip(chunks, loaded_chunks)
+            for (dicom_path, dicom_content), dicom_values in zip(chunk, chunk_data)
+        )
+
+        to_cache = []
+        truncated = {}
+        for i, (dicom_path, _) in enumerate(session_files):
+            if i in cached:
+                dicom_values = cached.pop(i)
+            else:
+                _, dicom_content, dicom_values = next(loaded)
+                if _TRUNCATED_KEY in dicom_values:
+                    truncated[str(dicom_path)] = dicom_values[_TRUNCATED_KEY]
+                    continue
+                if cache is not None and dicom_content is None:
+                    to_cache.append((dicom_path, dict(dicom_values)))
+
+            dicom_values["DICOM_Path"] = str(dicom_path)
+            dicom_values["InstanceNumber"] = int(dicom_values.get("InstanceNumber", 0))
+            yield dicom_values
+
+        if to_cache:
+            cache.put_many(to_cache, fields=fields, sequences=sequences, frames=frames)
+        if truncated:
+            raise TruncatedHeaderError(
+                f"{len(truncated)} DICOM headers are truncated; longer prefixes are needed.",
+                max(truncated.values()),
+                truncated,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+class _SessionColumns:
+    """
+    Columnar builder for the session DataFrame.
+
+    Notes:
+        - Values are appended straight into per-keyword columns, so no per-row dictionaries
+          are kept and the DataFrame is built in a single pass.
+        - Values are made hashable once as they are appended (lists become tuples).
+        - Repeated strings within a column share a single object.
+        - Rows missing a keyword are filled with NaN, and numeric columns become float64/int64.
+        - Files with per-frame values (see `load_dicom` with `frames`) add one row per frame (or
+          run); their per-frame columns are extended as a whole and file values are repeated.
+
+    Attributes:
+        n_rows (int): The number of rows appended so far.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, List[Any]] = {}
+        self._strings: Dict[str, Dict[str, str]] = {}
+        self.n_rows = 0
+
+    def append(self, dicom_values: Dict[str, Any]):
+        """
+        Append the values of a single file as a new row.
+
+        Args:
+            dicom_values (Dict[str, Any]): DICOM metadata for the file.
+        """
+
+        frame_values = dicom_values.get(_FRAME_VALUES_KEY)
+        if frame_values is not None:
+            self._extend_frames(dicom_values, frame_values)
+            return
+
+        for keyword, value in dicom_values.items():
+            column = self._columns.get(keyword)
+            if column is None:
+                column = self._columns[keyword] = [np.nan] * self.n_rows
+                self._strings[keyword] = {}
+            elif len(column) > self.n_rows:
+                continue  # duplicate keyword in the same row; keep the first value
+
+            value = make_hashable(value)
+            if isinstance(value, str):
+                value = self._strings[keyword].setdefault(value, value)
+            column.append(value)
+
+        self.n_rows += 1
+        for column in self._columns.values():
+            if len(column) < self.n_rows:
+                column.append(np.nan)
+
+    def _extend_frames(self, dicom_values: Dict[str, Any], frame_values: Dict[str, List[Any]]):
+        """
+        Append the rows of a multi-frame file: per-frame columns, then file values repeated per frame.
+        """
+
+        n_frames = len(frame_values["FrameNumber"])
+        for keyword, values in frame_values.items():
+            column = self._columns.get(keyword)
+            if column is None:
+                column = self._columns[keyword] = [np.nan] * self.n_rows
+                self._strings[keyword] = {}
+            strings = self._strings[keyword]
+            for value in values:
+                value = np.nan if value is None else make_hashable(value)
+                column.append(strings.setdefault(value, value) if isinstance(value, str) else value)
+
+        for keyword, value in dicom_values.items():
+            if keyword == _FRAME_VALUES_KEY or keyword in frame_values:
+                continue  # per-frame values take precedence
+            column = self._columns.get(keyword)
+            if column is None:
+                column = self._columns[keyword] = [np.nan] * self.n_rows
+                self._strings[keyword] = {}
+            value = make_hashable(value)
+            if isinstance(value, str):
+                value = self._strings[keyword].setdefault(value, value)
+            column.extend([value] * n_frames)
+
+        self.n_rows += n_frames
+        for column in self._columns.values():
+            if len(column) < self.n_rows:
+                column.extend([np.nan] * (self.n_rows - len(column)))
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build the DataFrame from the accumulated columns.
+
+        Returns:
+            pd.DataFrame: One row per appended file, with columns in order of first appearance.
+        """
+
+        return pd.DataFrame({keyword: pd.Series(column) for keyword, column in self._columns.items()})
+
+def _find_session_files(
+    session_dir: Optional[str] = None,
+    dicom_bytes: Optional[Union[Dict[str, bytes], Any]] = None,
+) -> List[Tuple[str, Optional[bytes]]]:
+    """
+    List the files of a session from a directory or a dictionary of byte content.
+
+    Args:
+        session_dir (Optional[str]): Path to a directory containing DICOM files.
+        dicom_bytes (Optional[Union[Dict[str, bytes], Any]]): Dictionary of file paths and their byte content.
+
+    Returns:
+        List[Tuple[str, Optional[bytes]]]: Pairs of file path and byte content (None for files on disk).
+
+    Raises:
+        ValueError: If neither `session_dir` nor `dicom_bytes` is provided.
+    """
+
+    if dicom_bytes is not None:
+        dicom_bytes = convert_jsproxy(dicom_bytes)
+        return list(dicom_bytes.items())
+    elif session_dir is not None:
+        with profiling.span("discover files"):
+            return [
+                (os.path.join(root, file), None)
+                for root, _, files in os.walk(session_dir)
+                for file in files
+                if file.endswith((".dcm", ".IMA"))
+            ]
+    raise ValueError("Either session_dir or dicom_bytes must be provided.")
+
+def find_truncated_headers(
+    dicom_bytes: Union[Dict[str, bytes], Any],
+    file_sizes: Union[Dict[str, int], Any],
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, int]:
+    """
+    Find the files whose header prefix is too short to be loaded, and the prefix length each needs.
+
+    Notes:
+        - Meant for callers that send only the first bytes of each file (e.g., the browser frontend):
+          longer prefixes are read for the returned files only, until none are returned.
+
+    Args:
+        dicom_bytes (Union[Dict[str, bytes], Any]): Dictionary of file paths and the first bytes of each file.
+        file_sizes (Union[Dict[str, int], Any]): Dictionary of file paths and the size of each whole file.
+        fields (Optional[Iterable[str]]): DICOM keywords or dotted field paths that will be loaded.
+            Defaults to all elements.
+
+    Returns:
+        Dict[str, int]: The prefix length needed for each truncated file.
+    """
+
+    dicom_bytes = convert_jsproxy(dicom_bytes)
+    file_sizes = convert_jsproxy(file_sizes)
+    fields = None if fields is None else list(fields)
+
+    bytes_needed = {}
+    for dicom_path, dicom_content in dicom_bytes.items():
+        try:
+            load_dicom(dicom_content, fields=fields, file_size=file_sizes.get(dicom_path))
+        except TruncatedHeaderError as e:
+            bytes_needed[dicom_path] = e.bytes_needed
+    return bytes_needed
+
+@profiling.timed("acquisition grouping")
+def _label_acquisitions(session_df: pd.DataFrame, acquisition_fields: Optional[List[str]]) -> pd.DataFrame:
+    """
+    Sort the session, group it by the acquisition fields and add the `Acquisition` label.
+
+    Args:
+        session_df (pd.DataFrame): One row per DICOM file.
+        acquisition_fields (Optional[List[str]]): List of fields used to uniquely identify each acquisition.
+
+    Returns:
+        pd.DataFrame: The sorted and grouped session with an `Acquisition` column.
+    """
+
+    # Sort data by InstanceNumber if present
+    if "InstanceNumber" in session_df.columns:
+        # Frames of a multi-frame file share its InstanceNumber and keep their frame order
+        session_df.sort_values(
+            ["InstanceNumber", "FrameNumber"] if "FrameNumber" in session_df.columns else "InstanceNumber",
+            inplace=True,
+        )
+    elif "DICOM_Path" in session_df.columns:
+        session_df.sort_values("DICOM_Path", inplace=True)
+
+    if not acquisition_fields:
+        session_df["Acquisition"] = "acq-" + clean_string("")
+        return session_df
+
+    # Order rows by their acquisition key (as a sorted groupby would), keeping the order within
+    # each acquisition and dropping rows with missing key values
+    profiling.count("groupbys")
+    group_ids = session_df.groupby(acquisition_fields, sort=True).ngroup().to_numpy()
+    order = np.argsort(group_ids, kind="stable")
+    order = order[group_ids[order] >= 0]
+    session_df = session_df.take(order)
+    group_ids = group_ids[order]
+
+    # Index rows by their acquisition key and position within the acquisition
+    group_starts = np.flatnonzero(np.r_[True, group_ids[1:] != group_ids[:-1]]) if len(group_ids) else group_ids
+    group_sizes = np.diff(np.r_[group_starts, len(group_ids)])
+    position = np.arange(len(group_ids)) - np.repeat(group_starts, group_sizes)
+    session_df.index = pd.MultiIndex.from_arrays(
+        [session_df[field].to_numpy() for field in acquisition_fields] + [position],
+        names=list(acquisition_fields) + [None],
+    )
+
+    # Build the 'Acquisition' label once per acquisition and broadcast it to its rows
+    first_rows = session_df[acquisition_fields].iloc[group_starts]
+    labels = np.array([
+        "acq-" + clean_string("-".join(str(val) if pd.notnull(val) else "NA" for val in row))
+        for row in first_rows.itertuples(index=False, name=None)
+    ], dtype=object)
+    session_df["Acquisition"] = labels[np.repeat(np.arange(len(group_starts)), group_sizes)]
+
+    return session_df
 
 def load_dicom_session(
     session_dir: Optional[str] = None,
     dicom_bytes: Optional[Union[Dict[str, bytes], Any]] = None,
     acquisition_fields: Optional[List[str]] = ["ProtocolName"],
+    workers: Optional[int] = 1,
+    fields: Optional[Iterable[str]] = None,
+    cache: Optional[DicomHeaderCache] = None,
+    sequences: Union[str, int] = "all",
+    frames: Optional[str] = None,
+    file_sizes: Optional[Union[Dict[str, int], Any]] = None,
 ) -> pd.DataFrame:
     """
     Load and process all DICOM files in a session directory or a dictionary of byte content.
@@ -93,71 +978,268 @@ def load_dicom_session(
         - The function can process files directly from a directory or byte content.
         - Metadata is grouped and sorted based on the acquisition fields and `InstanceNumber`.
         - Missing fields are normalized with default values.
+        - With `workers` > 1, header parsing is spread over a process pool; the result is
+          identical to the serial path.
+        - If `fields` is given, only those elements (plus `InstanceNumber` and the acquisition
+          fields) are decoded from each file, which is much cheaper for large headers.
+        - If a `cache` is given, files whose path, size and modification time are unchanged
+          since a previous run are not parsed again.
+        - `sequences` controls how DICOM sequences are converted (see `get_dicom_values`); for
+          enhanced multi-frame files, `"lazy"` with dotted field paths in `fields` avoids
+          materializing the per-frame sequences.
+        - With `frames="expand"`, enhanced multi-frame files give one row per frame, with their
+          functional group values (e.g., `EchoTime` from `EffectiveEchoTime`) as columns and a
+          `FrameNumber`. `frames="runs"` gives one row per run of identical consecutive frames
+          instead, with a `FrameCount`. Other files still give a single row.
+        - If `file_sizes` is given, `dicom_bytes` may hold only the first bytes of each file; if any
+          header is truncated, a TruncatedHeaderError lists the prefix length needed per file
+          (see `find_truncated_headers`).
 
     Args:
         session_dir (Optional[str]): Path to a directory containing DICOM files.
         dicom_bytes (Optional[Union[Dict[str, bytes], Any]]): Dictionary of file paths and their byte content.
         acquisition_fields (Optional[List[str]]): List of fields used to uniquely identify each acquisition.
+        workers (Optional[int]): Number of worker processes used to parse headers. Defaults to 1 (serial);
+            `None` uses one worker per CPU.
+        fields (Optional[Iterable[str]]): DICOM keywords or dotted field paths needed by the check
+            (e.g., reference fields). Defaults to all elements.
+        cache (Optional[DicomHeaderCache]): Persistent header cache used for files in `session_dir`.
+        sequences (Union[str, int]): The sequence policy: `"all"`, `"skip"`, `"shared"`, `"lazy"`
+            or a maximum nesting depth.
+        frames (Optional[str]): `"expand"` or `"runs"` to expand enhanced multi-frame files.
+            Defaults to None (one row per file).
+        file_sizes (Optional[Union[Dict[str, int], Any]]): Sizes of the whole files, for `dicom_bytes`
+            holding header prefixes.
 
     Returns:
         pd.DataFrame: A DataFrame containing metadata for all DICOM files in the session.
 
     Raises:
         ValueError: If neither `session_dir` nor `dicom_bytes` is provided, or if no DICOM data is found.
+        TruncatedHeaderError: If a header prefix is too short.
     """
-    session_data = []
 
-    if dicom_bytes is not None:
-        dicom_bytes = convert_jsproxy(dicom_bytes)
-        for dicom_path, dicom_byte_content in dicom_bytes.items():
-            dicom_values = load_dicom(dicom_byte_content)
-            dicom_values["DICOM_Path"] = str(dicom_path)
-            dicom_values["InstanceNumber"] = int(dicom_values.get("InstanceNumber", 0))
-            session_data.append(dicom_values)
-    elif session_dir is not None:
-        for root, _, files in os.walk(session_dir):
-            for file in files:
-                if file.endswith((".dcm", ".IMA")):
-                    dicom_path = os.path.join(root, file)
-                    dicom_values = load_dicom(dicom_path)
-                    dicom_values["DICOM_Path"] = dicom_path
-                    dicom_values["InstanceNumber"] = int(dicom_values.get("InstanceNumber", 0))
-                    session_data.append(dicom_values)
-    else:
-        raise ValueError("Either session_dir or dicom_bytes must be provided.")
+    session_files = _find_session_files(session_dir, dicom_bytes)
+
+    if fields is not None:
+        fields = sorted(set(fields) | set(acquisition_fields or []) | {"InstanceNumber"})
+
+    file_sizes = None if file_sizes is None else convert_jsproxy(file_sizes)
+
+    session_columns = _SessionColumns()
+    for dicom_values in _iter_session_files(
+        session_files, workers=workers, fields=fields, cache=cache, sequences=sequences, frames=frames,
+        file_sizes=file_sizes,
+    ):
+        with profiling.span("make_hashable"):
+            session_columns.append(dicom_values)
 
-    if not session_data:
+    if not session_columns.n_rows:
         raise ValueError("No DICOM data found to process.")
 
-    # Create a DataFrame
-    session_df = pd.DataFrame(session_data)
+    # Create a DataFrame; values are already hashable
+    with profiling.span("build DataFrame"):
+        session_df = session_columns.to_frame()
 
-    # Ensure all values are hashable
-    for col in session_df.columns:
-        session_df[col] = session_df[col].apply(make_hashable)
+    return _label_acquisitions(session_df, acquisition_fields)
 
-    # Sort data by InstanceNumber if present
-    if "InstanceNumber" in session_df.columns:
-        session_df.sort_values("InstanceNumber", inplace=True)
-    elif "DICOM_Path" in session_df.columns:
-        session_df.sort_values("DICOM_Path", inplace=True)
+def iter_dicom_session(
+    session_dir: Optional[str] = None,
+    dicom_bytes: Optional[Union[Dict[str, bytes], Any]] = None,
+    acquisition_fields: Optional[List[str]] = ["ProtocolName"],
+    chunk_size: int = 1000,
+    by_acquisition: bool = True,
+    workers: Optional[int] = 1,
+    fields: Optional[Iterable[str]] = None,
+    cache: Optional[DicomHeaderCache] = None,
+    sequences: Union[str, int] = "all",
+    frames: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Load a DICOM session incrementally, yielding DataFrames in bounded chunks.
+
+    Notes:
+        - Each chunk is processed like `load_dicom_session` output (sorted, grouped and labelled
+          with `Acquisition`), but only holds the rows of its own files.
+        - By default (`by_acquisition=True`), one chunk is yielded per acquisition, so memory use is
+          bounded by the largest acquisition rather than the whole session. Every file is parsed once,
+          `chunk_size` files at a time, to group the files by acquisition; the values of files on disk
+          are kept in `cache` (a temporary cache if none is given) and read back from it per acquisition,
+          while the values of `dicom_bytes` files are kept in memory along with their content.
+        - These chunks can be passed to `assign_series` and to the compliance checks one at a time.
+        - With `by_acquisition=False`, chunks hold at most `chunk_size` files in discovery order, so an
+          acquisition may be spread over several chunks. Series labels and compliance results computed
+          per chunk are then wrong; only use these chunks for checks that look at single rows.
+
+    Args:
+        session_dir (Optional[str]): Path to a directory containing DICOM files.
+        dicom_bytes (Optional[Union[Dict[str, bytes], Any]]): Dictionary of file paths and their byte content.
+        acquisition_fields (Optional[List[str]]): List of fields used to uniquely identify each acquisition.
+        chunk_size (int): Maximum number of files per chunk when `by_acquisition` is False, and number of
+            files parsed at a time when grouping files by acquisition.
+        by_acquisition (bool): Whether to yield exactly one chunk per acquisition.
+        workers (Optional[int]): Number of worker processes used to parse headers.
+        fields (Optional[Iterable[str]]): DICOM keywords or dotted field paths needed by the check.
+            Defaults to all elements.
+        cache (Optional[DicomHeaderCache]): Persistent header cache used for files in `session_dir`.
+        sequences (Union[str, int]): The sequence policy passed to `load_dicom`.
+        frames (Optional[str]): `"expand"` or `"runs"` to expand enhanced multi-frame files.
 
-    # Group by unique combinations of acquisition fields
-    if acquisition_fields:
-        session_df = session_df.groupby(acquisition_fields).apply(lambda x: x.reset_index(drop=True))
+    Yields:
+        pd.DataFrame: A DataFrame containing metadata for a subset of the DICOM files in the session.
 
-    # Convert acquisition fields to strings and handle missing values
-    def clean_acquisition_values(row):
-        return "-".join(str(val) if pd.notnull(val) else "NA" for val in row)
+    Raises:
+        ValueError: If neither `session_dir` nor `dicom_bytes` is provided, or if no DICOM data is found.
+    """
 
-    # Add 'Acquisition' field
-    session_df["Acquisition"] = (
-        "acq-"
-        + session_df[acquisition_fields]
-        .apply(clean_acquisition_values, axis=1)
-        .apply(clean_string)
-    )
+    session_files = _find_session_files(session_dir, dicom_bytes)
+    if not session_files:
+        raise ValueError("No DICOM data found to process.")
+
+    if fields is not None:
+        fields = sorted(set(fields) | set(acquisition_fields or []) | {"InstanceNumber"})
+
+    if not by_acquisition:
+        for i in range(0, len(session_files), chunk_size):
+            session_df = build_session_frame(
+                _iter_session_files(
+                    session_files[i:i + chunk_size], workers=workers, fields=fields, cache=cache, sequences=sequences, frames=frames
+                ),
+                acquisition_fields,
+            )
+            if not session_df.empty:
+                yield session_df
+        return
+
+    temporary_dir = None
+    if cache is None and session_dir is not None:
+        temporary_dir = tempfile.TemporaryDirectory()
+        cache = DicomHeaderCache(temporary_dir.name)
+    try:
+        # First pass: parse every file, in chunks so that parsed values are flushed to the cache, and group
+        # the files by acquisition
+        acquisitions = {}
+        key_fields = list(acquisition_fields or [])
+        for i in range(0, len(session_files), chunk_size):
+            chunk = session_files[i:i + chunk_size]
+            # The chunk is loaded as a whole, so that its values are added to the cache before grouping
+            loaded = list(_iter_session_files(chunk, workers=workers, fields=fields, cache=cache, sequences=sequences, frames=frames))
+            for session_file, dicom_values in zip(chunk, loaded):
+                key = tuple(make_hashable(dicom_values.get(field)) for field in key_fields)
+                # Values of files on disk are read back from the cache
+                acquisitions.setdefault(key, []).append((session_file, None if session_file[1] is None else dicom_values))
+
+        # Second pass: build one chunk per acquisition
+        for entries in acquisitions.values():
+            on_disk = [session_file for session_file, dicom_values in entries if dicom_values is None]
+            values = iter(_iter_session_files(on_disk, fields=fields, cache=cache, sequences=sequences, frames=frames))
+            session_df = build_session_frame(
+                (next(values) if dicom_values is None else dicom_values for _, dicom_values in entries),
+                acquisition_fields,
+            )
+            if not session_df.empty:
+                yield session_df
+    finally:
+        if temporary_dir is not None:
+            cache.close()
+            temporary_dir.cleanup()
+
+def load_dicom_files(
+    paths: List[str],
+    fields: Optional[Iterable[str]] = None,
+    cache: Optional[DicomHeaderCache] = None,
+    workers: Optional[int] = 1,
+    sequences: Union[str, int] = "all",
+    frames: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Load the header values of a list of DICOM files, as the rows of a session.
+
+    Notes:
+        - This is the incremental counterpart of `load_dicom_session`: the rows of files loaded at
+          different times can be combined and passed to `build_session_frame`.
+        - Each row holds the `load_dicom` output plus the `DICOM_Path` and integer `InstanceNumber`
+          of the file.
+        - Files are looked up in `cache` first; only missed files are parsed.
+
+    Args:
+        paths (List[str]): Paths to the DICOM files.
+        fields (Optional[Iterable[str]]): DICOM keywords or dotted field paths to read. Defaults to all elements.
+        cache (Optional[DicomHeaderCache]): Persistent header cache.
+        workers (Optional[int]): Number of worker processes used to parse headers.
+        sequences (Union[str, int]): The sequence policy passed to `load_dicom`.
+        frames (Optional[str]): The frame mode passed to `load_dicom`.
+
+    Returns:
+        List[Dict[str, Any]]: DICOM metadata for each file, in the order of `paths`.
+    """
+
+    fields = None if fields is None else sorted(set(fields))
+    return list(_iter_session_files(
+        [(path, None) for path in paths], workers=workers, fields=fields, cache=cache, sequences=sequences, frames=frames,
+    ))
+
+def build_session_frame(rows: Iterable[Dict[str, Any]], acquisition_fields: Optional[List[str]]) -> pd.DataFrame:
+    """
+    Build the session DataFrame of a set of rows, as `load_dicom_session` does.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): DICOM metadata per file, e.g., from `load_dicom_files`.
+        acquisition_fields (Optional[List[str]]): List of fields used to uniquely identify each acquisition.
+
+    Returns:
+        pd.DataFrame: The sorted session, grouped by acquisition and labelled with `Acquisition`.
+            Rows with a missing acquisition field are dropped.
+    """
+
+    session_columns = _SessionColumns()
+    for dicom_values in rows:
+        with profiling.span("make_hashable"):
+            session_columns.append(dicom_values)
+
+    with profiling.span("build DataFrame"):
+        session_df = session_columns.to_frame()
+    return _label_acquisitions(session_df, acquisition_fields)
+
+@profiling.timed("series labeling")
+def assign_series(
+    session_df: pd.DataFrame,
+    acquisition_fields: List[str],
+    reference_fields: List[str],
+) -> pd.DataFrame:
+    """
+    Label the series of each acquisition based on unique combinations of the reference fields.
+
+    Notes:
+        - Series are numbered from 1 within each acquisition, in the sorted order of the reference
+          field values (missing values form their own series).
+        - Uses a single groupby over the acquisition and reference fields: the global group number of
+          a row minus the first group number of its acquisition gives its series number.
+
+    Args:
+        session_df (pd.DataFrame): DataFrame of the DICOM session.
+        acquisition_fields (List[str]): Fields used to uniquely identify each acquisition.
+        reference_fields (List[str]): Fields whose unique combinations define the series.
+
+    Returns:
+        pd.DataFrame: The session with a `Series` column (`Series 1`, `Series 2`, ...), sorted by
+        acquisition and series.
+    """
+
+    session_df = session_df.reset_index(drop=True)
+
+    # Groups are numbered in sorted order, so each acquisition owns a contiguous range of numbers
+    profiling.count("groupbys", 3)
+    group_ids = session_df.groupby(acquisition_fields + reference_fields, sort=True, dropna=False).ngroup().to_numpy()
+    acquisition_ids = session_df.groupby(acquisition_fields, sort=True).ngroup().to_numpy()
+    first_ids = pd.Series(group_ids).groupby(acquisition_ids).transform("min").to_numpy()
+
+    series_numbers = np.where(acquisition_ids >= 0, group_ids - first_ids + 1, 0)
+    series_labels = np.array(["Series nan"] + [f"Series {i}" for i in range(1, series_numbers.max(initial=0) + 1)], dtype=object)
+    session_df["Series"] = series_labels[series_numbers]
 
+    # Sort by acquisition, then series, then all other fields
+    session_df.sort_values(by=["Acquisition", "Series"] + acquisition_fields + reference_fields, inplace=True)
     return session_df
 
 def load_json_session(json_ref: str) -> Tuple[List[str], List[str], Dict[str, Any]]:
@@ -3,18 +3,15 @@ This module provides functions for mapping DICOM input data to reference models
 
 """
 
-import re
 import numpy as np
 import pandas as pd
 
-from tabulate import tabulate
-from scipy.optimize import linear_sum_assignment
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, Union
 
-try:
-    import curses
-except ImportError:
-    curses = None
+from . import profiling
+from .reference import CompiledReference, CompiledRule, compile_json_reference, compile_wildcard
+from .utils import clean_string
 
 MAX_DIFF_SCORE = 10  # Maximum allowed difference score for each field to avoid unmanageably large values
 
@@ -23,7 +20,8 @@ def levenshtein_distance(s1, s2):
     Calculate the Levenshtein distance (edit distance) between two strings.
 
     Notes:
-        - Uses a dynamic programming approach.
+        - Uses Myers' bit-parallel algorithm: each character of the longer string updates a whole
+          column of the edit distance matrix at once, encoded as bit vectors over the shorter string.
         - Distance is the number of single-character edits required to convert one string to another.
 
     Args:
@@ -33,24 +31,81 @@ def levenshtein_distance(s1, s2):
     Returns:
         int: The Levenshtein distance between the two strings.
     """
+    return _bit_parallel_levenshtein(s1, s2)
+
+def _bit_parallel_levenshtein(s1, s2, max_distance=None):
+    """
+    Myers' bit-parallel Levenshtein distance, optionally stopping once `max_distance` is reached.
+
+    Args:
+        s1 (str): First string.
+        s2 (str): Second string.
+        max_distance (Optional[int]): If given, return `max_distance` as soon as the distance is
+            known to be at least `max_distance`.
+
+    Returns:
+        int: The Levenshtein distance, or `max_distance` if the distance is at least `max_distance`.
+    """
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+    n, m = len(s1), len(s2)
+    if max_distance is not None and n - m >= max_distance:
+        return max_distance
+    if m == 0:
+        return n
+
+    # Bit i of peq[c] is set where s2[i] == c
+    peq = {}
+    for i, c in enumerate(s2):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv = mask, 0  # Vertical +1/-1 deltas of the current column
+    score = m
+
+    for j, c in enumerate(s1, 1):
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh = mh << 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+        # The remaining n - j characters can lower the score by at most one each
+        if max_distance is not None and score - (n - j) >= max_distance:
+            return max_distance
+
+    if max_distance is not None:
+        return min(score, max_distance)
+    return score
+
+@lru_cache(maxsize=65536)
+def capped_levenshtein_distance(s1, s2):
+    """
+    Calculate the Levenshtein distance between two strings, capped at `MAX_DIFF_SCORE`.
 
-    # Initialize a row with incremental values [0, 1, 2, ..., len(s2)]
-    previous_row = range(len(s2) + 1)
+    Notes:
+        - Stops as soon as the distance is known to reach `MAX_DIFF_SCORE`, since field scores are
+          capped at that value anyway.
+        - Results are memoized, as the same (expected, actual) pairs recur across series pairs.
 
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    Args:
+        s1 (str): First string.
+        s2 (str): Second string.
 
-    return previous_row[-1]
+    Returns:
+        int: `min(levenshtein_distance(s1, s2), MAX_DIFF_SCORE)`.
+    """
+    return _bit_parallel_levenshtein(s1, s2, MAX_DIFF_SCORE)
 
-def calculate_field_score(expected, actual, tolerance=None, contains=None):
+def calculate_field_score(expected, actual, tolerance=None, contains=None, pattern=None):
     """
     Calculate the difference score between expected and actual values, applying specific rules.
 
@@ -65,6 +120,8 @@ def calculate_field_score(expected, actual, tolerance=None, contains=None):
         actual (Any): The actual value.
         tolerance (Optional[float]): Tolerance for numeric comparisons.
         contains (Optional[str]): Substring or value that should be contained in `actual`.
+        pattern (Optional[re.Pattern]): Precompiled wildcard pattern for `expected`
+            (see `dicompare.reference.compile_wildcard`).
 
     Returns:
         float: A difference score capped at `MAX_DIFF_SCORE`.
@@ -74,8 +131,9 @@ def calculate_field_score(expected, actual, tolerance=None, contains=None):
         # Assign a high penalty for missing actual value
         return MAX_DIFF_SCORE
 
-    if isinstance(expected, str) and ("*" in expected or "?" in expected):
-        pattern = re.compile("^" + expected.replace("*", ".*").replace("?", ".") + "$")
+    if pattern is None:
+        pattern = compile_wildcard(expected)
+    if pattern is not None:
         if pattern.match(actual):
             return 0  # Pattern matched, no difference
         return min(MAX_DIFF_SCORE, 5)  # Pattern did not match, fixed penalty
@@ -96,7 +154,12 @@ def calculate_field_score(expected, actual, tolerance=None, contains=None):
         max_length = max(len(expected_tuple), len(actual_tuple))
         expected_padded = expected_tuple + ("",) * (max_length - len(expected_tuple))
         actual_padded = actual_tuple + ("",) * (max_length - len(actual_tuple))
-        return min(MAX_DIFF_SCORE, sum(levenshtein_distance(str(e), str(a)) for e, a in zip(expected_padded, actual_padded)))
+        score = 0
+        for e, a in zip(expected_padded, actual_padded):
+            score += capped_levenshtein_distance(str(e), str(a))
+            if score >= MAX_DIFF_SCORE:
+                return MAX_DIFF_SCORE
+        return score
     
     if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
         if tolerance is not None:
@@ -104,7 +167,7 @@ def calculate_field_score(expected, actual, tolerance=None, contains=None):
                 return 0
         return min(MAX_DIFF_SCORE, abs(expected - actual))
     
-    return min(MAX_DIFF_SCORE, levenshtein_distance(str(expected), str(actual)))
+    return capped_levenshtein_distance(str(expected), str(actual))
 
 def calculate_match_score(ref_row, in_row):
     """
@@ -134,96 +197,136 @@ def calculate_match_score(ref_row, in_row):
 
     return round(diff_score, 2)
 
-def map_to_json_reference(in_session_df: pd.DataFrame, ref_session: dict) -> dict:
+def _summarize_input_series(in_session_df: pd.DataFrame, fields: List[str]):
     """
-    Automatically map input acquisitions/series to a JSON reference using the Hungarian algorithm.
-
-    Notes:
-        - Uses `calculate_field_score` to compute a cost matrix for mapping.
-        - Assigns mappings to minimize total mapping cost.
-        - Handles grouping and ranking of input series using unique combinations of fields.
+    Summarize each input series with a single value per field.
 
     Args:
         in_session_df (pd.DataFrame): DataFrame of input session metadata.
-        ref_session (dict): Reference session data in JSON format.
+        fields (List[str]): Fields to summarize.
 
     Returns:
-        dict: Mapping of (input_acquisition, input_series) -> (reference_acquisition, reference_series).
+        Tuple[List[Tuple[str, str]], Dict[str, List[Any]]]: The sorted (acquisition, series) keys and,
+        for each field present in the session, the value of each series (None where the series has
+        several distinct values).
     """
 
-    # Extract reference acquisitions and series fields
-    reference_acquisitions = ref_session["acquisitions"]
-
-    # Identify all unique series fields in the reference session
-    series_fields = set()
-    for ref_acq in reference_acquisitions.values():
-        for series in ref_acq.get("series", []):
-            for field in series.get("fields", []):
-                series_fields.add(field["field"])
-    series_fields = list(series_fields)
-
-    # Prepare lists for input acquisitions + series and reference acquisitions + series
-    input_acquisition_series = sorted(
-        in_session_df[["Acquisition", "Series"]].drop_duplicates().values.tolist()
-    )
-    reference_acquisition_series = sorted(
-        [
-            (ref_acq_name, series["name"])
-            for ref_acq_name, ref_acq in reference_acquisitions.items()
-            for series in ref_acq.get("series", [])
-        ]
-    )
+    keys = ["Acquisition", "Series"]
+    fields = [field for field in fields if field in in_session_df.columns]
+    profiling.count("groupbys")
+    grouped = in_session_df.groupby(keys, sort=True)
+    series_index = grouped.size().index
+    if not fields:
+        return series_index.tolist(), {}
 
-    # Initialize the cost matrix
-    cost_matrix = []
+    counts = grouped[fields].nunique(dropna=False)
+    first_rows = in_session_df.drop_duplicates(keys).set_index(keys)[fields].reindex(series_index)
 
-    for in_acq, in_series in input_acquisition_series:
-        # Filter input session DataFrame for the current acquisition and series
-        input_series_df = in_session_df[
-            (in_session_df["Acquisition"] == in_acq) & (in_session_df["Series"] == in_series)
-        ]
+    summary = {}
+    for field in fields:
+        unique = counts[field].to_numpy() == 1
+        summary[field] = [value if is_unique else None for value, is_unique in zip(first_rows[field].to_numpy(), unique)]
+    return series_index.tolist(), summary
 
-        row = []
-        for ref_acq, ref_series in reference_acquisition_series:
-            # Find the reference series details
-            ref_series_data = next(
-                (series for series in reference_acquisitions[ref_acq]["series"] if series["name"] == ref_series),
-                None,
-            )
-            if ref_series_data is None:
-                row.append(np.inf)  # If no matching reference series, assign a high cost
+def _score_field(actual_values: List[Any], rules: List[CompiledRule], bounds: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Score the summarized values of one field against several rules on that field.
+
+    Notes:
+        - Each distinct value is scored once; rows are then gathered from the distinct results.
+        - Numeric values against numeric rules are scored for all rules at once with NumPy, using
+          the precompiled `bounds`; other combinations use `calculate_field_score`.
+
+    Args:
+        actual_values (List[Any]): The value of each input series (None if missing or ambiguous).
+        rules (List[CompiledRule]): The rules to score against.
+        bounds (Dict[str, np.ndarray]): The `field_bounds` of the field, aligned with `rules`.
+
+    Returns:
+        np.ndarray: Scores of shape (len(actual_values), len(rules)).
+    """
+
+    # Deduplicate values, keeping unhashable ones separate
+    distinct, inverse, positions = [], [], {}
+    for value in actual_values:
+        try:
+            index = positions.setdefault(value, len(distinct))
+        except TypeError:
+            index = len(distinct)
+        if index == len(distinct):
+            distinct.append(value)
+        inverse.append(index)
+
+    scores = np.empty((len(distinct), len(rules)))
+    is_number = np.array([isinstance(value, (int, float)) for value in distinct], dtype=bool)
+    numeric_rules = bounds["numeric"]
+
+    if is_number.any() and numeric_rules.any():
+        actual = np.array([distinct[i] for i in np.flatnonzero(is_number)], dtype=float)
+        expected = bounds["value"][numeric_rules]
+        tolerance = bounds["tolerance"][numeric_rules]
+        with np.errstate(invalid="ignore"):
+            diff = np.abs(expected[None, :] - actual[:, None])
+            within = diff <= tolerance[None, :]
+        scores[np.ix_(is_number, numeric_rules)] = np.where(within, 0, np.fmin(diff, MAX_DIFF_SCORE))
+
+    for j, rule in enumerate(rules):
+        for i, value in enumerate(distinct):
+            if numeric_rules[j] and is_number[i]:
                 continue
+            scores[i, j] = calculate_field_score(
+                rule.value, value, tolerance=rule.tolerance, contains=rule.contains, pattern=rule.pattern
+            )
 
-            # Calculate the difference score for this mapping
-            diff_score = 0.0
-            for field in ref_series_data.get("fields", []):
-                field_name = field["field"]
-                expected_value = field.get("value")
-                tolerance = field.get("tolerance")
-                contains = field.get("contains")
-
-                # Check the corresponding field in the input series DataFrame
-                if field_name in input_series_df.columns:
-                    actual_values = input_series_df[field_name].unique()
-                    if len(actual_values) == 1:
-                        actual_value = actual_values[0]
-                    else:
-                        actual_value = None  # Non-unique values are ambiguous
-                else:
-                    actual_value = None
+    return scores[inverse]
 
-                # Calculate the difference for this field
-                diff = calculate_field_score(expected_value, actual_value, tolerance=tolerance, contains=contains)
-                diff_score += diff
+@profiling.timed("mapping")
+def map_to_json_reference(in_session_df: pd.DataFrame, ref_session: Union[dict, CompiledReference]) -> dict:
+    """
+    Automatically map input acquisitions/series to a JSON reference using the Hungarian algorithm.
 
-            row.append(diff_score)
+    Notes:
+        - Uses `calculate_field_score` to compute a cost matrix for mapping.
+        - Assigns mappings to minimize total mapping cost.
+        - Handles grouping and ranking of input series using unique combinations of fields.
+        - Each input series is summarized once; the cost matrix is then filled field by field,
+          scoring every distinct input value against all reference rules on that field.
 
-        cost_matrix.append(row)
+    Args:
+        in_session_df (pd.DataFrame): DataFrame of input session metadata.
+        ref_session (Union[dict, CompiledReference]): Reference session data in JSON format, or a
+            reference compiled with `compile_json_reference`.
 
-    # Convert cost_matrix to a numpy array for processing
-    cost_matrix = np.array(cost_matrix)
+    Returns:
+        dict: Mapping of (input_acquisition, input_series) -> (reference_acquisition, reference_series).
+    """
 
-    # Solve the assignment problem using the Hungarian algorithm
+    reference = compile_json_reference(ref_session)
+    reference_acquisition_series = reference.series_keys
+
+    # Summarize each input series once
+    input_acquisition_series, summary = _summarize_input_series(in_session_df, reference.series_fields)
+    n_inputs = len(input_acquisition_series)
+
+    # Score each field against all of its rules across the reference series at once
+    terms = {}
+    for field, entries in reference.field_rules.items():
+        if field in summary:
+            scores = _score_field(summary[field], [rule for _, _, rule in entries], reference.field_bounds[field])
+        else:
+            scores = np.full((n_inputs, len(entries)), float(MAX_DIFF_SCORE))
+        for k, (col, position, _) in enumerate(entries):
+            terms[(col, position)] = scores[:, k]
+
+    # Sum the field scores of each reference series in rule order
+    cost_matrix = np.zeros((n_inputs, len(reference_acquisition_series)))
+    for col, ref_key in enumerate(reference_acquisition_series):
+        for position in range(len(reference.rules[ref_key])):
+            cost_matrix[:, col] += terms[(col, position)]
+
+    # Solve the assignment problem using the Hungarian algorithm; scipy is imported here rather
+    # than with the module, as it dominates the import time of the package
+    from scipy.optimize import linear_sum_assignment
     row_indices, col_indices = linear_sum_assignment(cost_matrix)
 
     # Create the mapping
@@ -234,7 +337,43 @@ def map_to_json_reference(in_session_df: pd.DataFrame, ref_session: dict) -> dic
 
     return mapping
 
-def interactive_mapping_to_json_reference(in_session_df: pd.DataFrame, ref_session: dict, initial_mapping=None):
+@profiling.timed("mapping")
+def map_to_python_reference(in_session_df: pd.DataFrame, ref_models: dict) -> dict:
+    """
+    Automatically map reference models to input acquisitions by name using the Hungarian algorithm.
+
+    Notes:
+        - The cost of each pairing is the Levenshtein distance between the cleaned reference
+          acquisition name and the input acquisition name (without its `acq-` prefix).
+        - Intended for non-interactive use; `interactive_mapping_to_python_reference` lets users
+          adjust the mapping by hand.
+
+    Args:
+        in_session_df (pd.DataFrame): DataFrame of input session metadata.
+        ref_models (dict): Dictionary of reference validation models keyed by acquisition names.
+
+    Returns:
+        dict: Mapping of reference acquisitions -> input acquisitions.
+    """
+
+    input_acquisitions = sorted(in_session_df["Acquisition"].unique())
+    reference_acquisitions = list(ref_models.keys())
+    if not input_acquisitions or not reference_acquisitions:
+        return {}
+
+    cost_matrix = np.array([
+        [
+            levenshtein_distance(clean_string(ref_acq), in_acq[len("acq-"):] if in_acq.startswith("acq-") else in_acq)
+            for in_acq in input_acquisitions
+        ]
+        for ref_acq in reference_acquisitions
+    ])
+    from scipy.optimize import linear_sum_assignment
+    row_indices, col_indices = linear_sum_assignment(cost_matrix)
+
+    return {reference_acquisitions[row]: input_acquisitions[col] for row, col in zip(row_indices, col_indices)}
+
+def interactive_mapping_to_json_reference(in_session_df: pd.DataFrame, ref_session: Union[dict, CompiledReference], initial_mapping=None):
     """
     Interactive CLI for mapping input acquisitions/series to JSON references.
 
@@ -245,13 +384,20 @@ def interactive_mapping_to_json_reference(in_session_df: pd.DataFrame, ref_sessi
 
     Args:
         in_session_df (pd.DataFrame): DataFrame of input session metadata.
-        ref_session (dict): Reference session data in JSON format.
+        ref_session (Union[dict, CompiledReference]): Reference session data in JSON format, or a
+            reference compiled with `compile_json_reference`.
         initial_mapping (dict, optional): Initial mapping to use as a starting point.
 
     Returns:
         dict: Final mapping of (reference_acquisition, reference_series) -> (input_acquisition, input_series).
     """
 
+    # Only needed in the terminal, so not imported with the module
+    import curses
+    from tabulate import tabulate
+
+    reference = compile_json_reference(ref_session)
+
     # Prepare input series from the DataFrame with detailed identifiers
     input_series = {
         ("input", acq_name, series_name): in_session_df[
@@ -261,20 +407,14 @@ def interactive_mapping_to_json_reference(in_session_df: pd.DataFrame, ref_sessi
         for series_name in in_session_df[in_session_df["Acquisition"] == acq_name]["Series"].unique()
     }
 
-    # Prepare reference series from the JSON/dict
+    # Prepare reference series from the compiled reference
     reference_series = {
-        ("reference", ref_acq_name, ref_series["name"]): ref_series
-        for ref_acq_name, ref_acq in ref_session["acquisitions"].items()
-        for ref_series in ref_acq.get("series", [])
+        ("reference", ref_acq_name, ref_series_name): ref_series
+        for (ref_acq_name, ref_series_name), ref_series in reference.series.items()
     }
 
     # Define series_fields from the reference session
-    series_fields = set()
-    for ref_acq in ref_session["acquisitions"].values():
-        for series in ref_acq.get("series", []):
-            for field in series.get("fields", []):
-                series_fields.add(field["field"])
-    series_fields = list(series_fields)
+    series_fields = reference.series_fields
 
     # Initialize the mapping (reference -> input)
     mapping = {}
@@ -434,6 +574,10 @@ def interactive_mapping_to_python_reference(in_session_df: pd.DataFrame, ref_mod
     Returns:
         dict: Final mapping of reference acquisitions -> input acquisitions.
     """
+    # Only needed in the terminal, so not imported with the module
+    import curses
+    from tabulate import tabulate
+
     # Prepare input acquisitions
     input_acquisitions = {
         ("input", acq_name): in_session_df[in_session_df["Acquisition"] == acq_name]
@@ -0,0 +1,212 @@
+"""
+This module provides lightweight instrumentation of the loading, mapping and compliance pipeline:
+named spans, counters, per-VR conversion statistics and per-validator timings.
+
+"""
+
+import json
+import time
+import functools
+import contextlib
+
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+
+# The profile being recorded, if any; instrumented code checks it before doing any work
+_active = None
+_NULL_SPAN = contextlib.nullcontext()
+
+class Profile:
+    """
+    A record of the spans, counters and timings of a profiled run.
+
+    Notes:
+        - Spans are keyed by their path (the names of the enclosing spans and their own), so the
+          same step is reported separately under each caller, and repeated calls are aggregated.
+        - `vr_stats` and `validator_timings` are filled by `load_dicom` and
+          `check_session_compliance_with_python_module` while the profile is active.
+        - Work done in worker processes (e.g., `load_dicom_session` with `workers` > 1) is only
+          reflected in the time of the enclosing span.
+
+    Attributes:
+        spans (Dict[Tuple[str, ...], List[float]]): Number of calls and total seconds of each span path.
+        counters (Dict[str, int]): Running counts, e.g., `files read` and `bytes read`.
+        vr_stats (Dict[str, Dict[str, float]]): Number of elements converted and seconds per VR.
+        validator_timings (List[Dict[str, Any]]): Wall time of each validator run.
+        seconds (float): Total wall time of the profile.
+    """
+
+    def __init__(self):
+        self.spans: Dict[Tuple[str, ...], List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.vr_stats: Dict[str, Dict[str, float]] = {}
+        self.validator_timings: List[Dict[str, Any]] = []
+        self.seconds = 0.0
+        self._stack: List[str] = []
+        self._start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        self._stack.append(name)
+        stats = self.spans.setdefault(tuple(self._stack), [0, 0.0])
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats[0] += 1
+            stats[1] += time.perf_counter() - start
+            self._stack.pop()
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def stop(self):
+        self.seconds = time.perf_counter() - self._start
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the profile as JSON-serializable data.
+
+        Returns:
+            Dict[str, Any]: Total `seconds`, `spans` (in order of first call), `counters`, per-VR
+                conversion statistics and validator timings aggregated by field and rule (slowest first).
+        """
+
+        counters = dict(self.counters)
+        if self.vr_stats:
+            counters["elements converted"] = sum(int(stats["count"]) for stats in self.vr_stats.values())
+
+        validators = {}
+        for timing in self.validator_timings:
+            stats = validators.setdefault((timing["field"], timing["rule"]), {"field": timing["field"], "rule": timing["rule"], "calls": 0, "seconds": 0.0})
+            stats["calls"] += 1
+            stats["seconds"] += timing["seconds"]
+
+        return {
+            "seconds": self.seconds,
+            "spans": [{"path": list(path), "calls": calls, "seconds": seconds} for path, (calls, seconds) in self.spans.items()],
+            "counters": counters,
+            "vr": {vr: dict(stats) for vr, stats in sorted(self.vr_stats.items(), key=lambda item: -item[1]["seconds"])},
+            "validators": sorted(validators.values(), key=lambda stats: -stats["seconds"]),
+        }
+
+    def format(self) -> str:
+        """
+        Format the profile as a text breakdown.
+
+        Returns:
+            str: Span times as a tree, then counters, VR conversion and validator timings.
+        """
+
+        summary = self.summary()
+        total = summary["seconds"] or 1.0
+        lines = [f"Profile: {summary['seconds'] * 1000:.1f} ms total"]
+
+        # Print child spans under their parents, keeping the order of first call within each level
+        order = {path: i for i, path in enumerate(self.spans)}
+        for path in sorted(self.spans, key=lambda path: [order[path[:i + 1]] for i in range(len(path))]):
+            calls, seconds = self.spans[path]
+            name = "  " * (len(path) - 1) + path[-1]
+            lines.append(f"  {name:<40} {calls:>7} calls {seconds * 1000:10.1f} ms {100 * seconds / total:5.1f}%")
+
+        if summary["counters"]:
+            lines.append("Counters:")
+            lines.extend(f"  {name:<40} {value:>12}" for name, value in summary["counters"].items())
+        if summary["vr"]:
+            lines.append("Conversion by VR:")
+            lines.extend(f"  {vr:<40} {int(stats['count']):>7} elems {stats['seconds'] * 1000:10.1f} ms" for vr, stats in summary["vr"].items())
+        if summary["validators"]:
+            lines.append("Validators:")
+            lines.extend(f"  {stats['field'][:40]:<40} {stats['calls']:>7} calls {stats['seconds'] * 1000:10.1f} ms  {stats['rule']}" for stats in summary["validators"])
+        return "\n".join(lines)
+
+@contextlib.contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Record a profile of the code run inside the context.
+
+    Yields:
+        Profile: The profile being recorded; it is complete once the context exits.
+    """
+
+    global _active
+    previous, _active = _active, Profile()
+    try:
+        yield _active
+    finally:
+        _active.stop()
+        _active = previous
+
+def span(name: str):
+    """
+    Time the enclosed block as a named span of the active profile; does nothing if none is active.
+
+    Args:
+        name (str): The name of the span.
+
+    Returns:
+        ContextManager: The span, or a shared no-op context.
+    """
+
+    return _NULL_SPAN if _active is None else _active.span(name)
+
+def timed(name: str):
+    """
+    Decorate a function so that each call is timed as a named span of the active profile.
+
+    Args:
+        name (str): The name of the span.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name: str, n: int = 1):
+    """
+    Add `n` to a counter of the active profile, if any.
+
+    Args:
+        name (str): The name of the counter.
+        n (int): The amount to add.
+    """
+
+    if _active is not None:
+        _active.count(name, n)
+
+def vr_stats() -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    The per-VR statistics of the active profile, or None if profiling is disabled.
+    """
+
+    return None if _active is None else _active.vr_stats
+
+def validator_timings() -> Optional[List[Dict[str, Any]]]:
+    """
+    The validator timings of the active profile, or None if profiling is disabled.
+    """
+
+    return None if _active is None else _active.validator_timings
+
+def write_profile(profile: Profile, destination: str):
+    """
+    Print a profile, or save it as JSON.
+
+    Args:
+        profile (Profile): A finished profile.
+        destination (str): `-` to print the breakdown, or a path for the JSON summary.
+    """
+
+    if destination == "-":
+        print(profile.format())
+    else:
+        with open(destination, "w") as f:
+            json.dump(profile.summary(), f, indent=4)
@@ -0,0 +1,163 @@
+"""
+This module compiles JSON reference sessions into an indexed rule plan that can be shared by the
+mapping and compliance functions.
+
+"""
+
+import re
+import numpy as np
+
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+def compile_wildcard(value: Any) -> Optional[re.Pattern]:
+    """
+    Compile a reference value containing `*` or `?` wildcards into a regular expression.
+
+    Args:
+        value (Any): The expected value from a reference field.
+
+    Returns:
+        Optional[re.Pattern]: The compiled pattern, or None if `value` is not a wildcard string.
+    """
+
+    if isinstance(value, str) and ("*" in value or "?" in value):
+        return re.compile("^" + value.replace("*", ".*").replace("?", ".") + "$")
+    return None
+
+class CompiledRule:
+    """
+    A single reference field rule with its kind and derived values precomputed.
+
+    Attributes:
+        field (str): The DICOM field the rule applies to.
+        value (Any): The expected value, if any.
+        tolerance (Optional[float]): The numeric tolerance, if any.
+        contains (Any): The value that must be contained, if any.
+        kind (str): One of `contains`, `wildcard`, `tolerance`, `exact` or `none`.
+        pattern (Optional[re.Pattern]): The compiled wildcard pattern for `wildcard` rules.
+        lower (float): `value - tolerance` for `tolerance` rules, otherwise NaN.
+        upper (float): `value + tolerance` for `tolerance` rules, otherwise NaN.
+        index (Optional[int]): The position of the rule in the `field_bounds` arrays of its field,
+            set by `CompiledReference`.
+    """
+
+    __slots__ = ("field", "value", "tolerance", "contains", "kind", "pattern", "lower", "upper", "index")
+
+    def __init__(self, ref_field: Dict[str, Any]):
+        self.field = ref_field["field"]
+        self.value = ref_field.get("value")
+        self.tolerance = ref_field.get("tolerance")
+        self.contains = ref_field.get("contains")
+        self.pattern = compile_wildcard(self.value)
+        self.lower = np.nan
+        self.upper = np.nan
+        self.index = None
+
+        if self.contains is not None:
+            self.kind = "contains"
+        elif self.pattern is not None:
+            self.kind = "wildcard"
+        elif self.tolerance is not None:
+            self.kind = "tolerance"
+            if isinstance(self.value, (int, float)):
+                self.lower = self.value - self.tolerance
+                self.upper = self.value + self.tolerance
+        elif self.value is not None:
+            self.kind = "exact"
+        else:
+            self.kind = "none"
+
+class CompiledReference:
+    """
+    A JSON reference session compiled into an index of reference series and their rules.
+
+    Notes:
+        - Built once from the output of `load_json_session`; looking up a series is a dictionary
+          access regardless of how many series the reference has.
+        - The rules on each field are collected across all reference series in `field_rules`, and
+          `field_bounds` holds their numeric values and bounds as arrays, so that numeric rules are
+          evaluated for all reference series at once by the mapping and compliance functions.
+
+    Args:
+        ref_session (Dict[str, Any]): Reference session data loaded from a JSON file.
+
+    Attributes:
+        acquisitions (Dict[str, Any]): The reference acquisitions as loaded from JSON.
+        series_keys (List[Tuple[str, str]]): Sorted (acquisition, series) names of all reference series.
+        series (Dict[Tuple[str, str], Dict[str, Any]]): The reference series keyed by (acquisition, series).
+        rules (Dict[Tuple[str, str], List[CompiledRule]]): Compiled rules keyed by (acquisition, series).
+        series_fields (List[str]): All fields used by any reference series.
+        field_rules (Dict[str, List[Tuple[int, int, CompiledRule]]]): For each field, the index in
+            `series_keys`, the position in the series' rules, and the rule of every rule on that field.
+        field_bounds (Dict[str, Dict[str, np.ndarray]]): For each field, `value`, `tolerance`, `lower`
+            and `upper` arrays aligned with `field_rules` (NaN where not applicable), and a `numeric`
+            mask of the rules that compare numbers (no wildcard or `contains`, and a numeric value).
+    """
+
+    def __init__(self, ref_session: Dict[str, Any]):
+        self.acquisitions = ref_session["acquisitions"]
+        self.series = {
+            (ref_acq_name, series["name"]): series
+            for ref_acq_name, ref_acq in self.acquisitions.items()
+            for series in ref_acq.get("series", [])
+        }
+        self.series_keys = sorted(self.series)
+        self.rules = {
+            key: [CompiledRule(ref_field) for ref_field in series.get("fields", [])]
+            for key, series in self.series.items()
+        }
+
+        series_fields = set()
+        for rules in self.rules.values():
+            series_fields.update(rule.field for rule in rules)
+        self.series_fields = list(series_fields)
+
+        self.field_rules = {}
+        for col, key in enumerate(self.series_keys):
+            for position, rule in enumerate(self.rules[key]):
+                entries = self.field_rules.setdefault(rule.field, [])
+                rule.index = len(entries)
+                entries.append((col, position, rule))
+
+        self.field_bounds = {}
+        for field, entries in self.field_rules.items():
+            rules = [rule for _, _, rule in entries]
+            numeric = np.array([
+                rule.pattern is None and not rule.contains and isinstance(rule.value, (int, float)) for rule in rules
+            ], dtype=bool)
+            self.field_bounds[field] = {
+                "value": np.array([rule.value if is_numeric else np.nan for rule, is_numeric in zip(rules, numeric)], dtype=float),
+                "tolerance": np.array([np.nan if rule.tolerance is None else rule.tolerance for rule in rules], dtype=float),
+                "lower": np.array([rule.lower for rule in rules], dtype=float),
+                "upper": np.array([rule.upper for rule in rules], dtype=float),
+                "numeric": numeric,
+            }
+
+    def get_rules(self, ref_acq_name: str, ref_series_name: str) -> Optional[List[CompiledRule]]:
+        """
+        Look up the compiled rules of a reference series.
+
+        Args:
+            ref_acq_name (str): The reference acquisition name.
+            ref_series_name (str): The reference series name.
+
+        Returns:
+            Optional[List[CompiledRule]]: The rules, or None if the series does not exist.
+        """
+
+        return self.rules.get((ref_acq_name, ref_series_name))
+
+def compile_json_reference(ref_session: Union[Dict[str, Any], CompiledReference]) -> CompiledReference:
+    """
+    Compile a JSON reference session, returning already compiled references unchanged.
+
+    Args:
+        ref_session (Union[Dict[str, Any], CompiledReference]): Reference session data loaded from a JSON file.
+
+    Returns:
+        CompiledReference: The compiled reference.
+    """
+
+    if isinstance(ref_session, CompiledReference):
+        return ref_session
+    return CompiledReference(ref_session)
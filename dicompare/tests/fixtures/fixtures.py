@@ -86,3 +86,32 @@ def t1() -> Dataset:
 
     return ref_dicom
 
+
+@pytest.fixture
+def enhanced_mr(t1: Dataset) -> Dataset:
+    """Create an enhanced multi-frame MR object with shared and per-frame functional groups for testing."""
+
+    timing = Dataset()
+    timing.RepetitionTime = 8.0
+    timing.FlipAngle = 15
+    shared = Dataset()
+    shared.MRTimingAndRelatedParametersSequence = [timing]
+    t1.SharedFunctionalGroupsSequence = [shared]
+
+    per_frame = []
+    for i, echo_time in enumerate([3.0, 6.0, 9.0]):
+        echo = Dataset()
+        echo.EffectiveEchoTime = echo_time
+        position = Dataset()
+        position.ImagePositionPatient = [-128, -128, float(i)]
+        frame_type = Dataset()
+        frame_type.FrameType = ["ORIGINAL", "PRIMARY", "M" if i % 2 == 0 else "P", "NONE"]
+        frame = Dataset()
+        frame.MRImageFrameTypeSequence = [frame_type]
+        frame.MREchoSequence = [echo]
+        frame.PlanePositionSequence = [position]
+        per_frame.append(frame)
+    t1.PerFrameFunctionalGroupsSequence = per_frame
+    t1.NumberOfFrames = len(per_frame)
+
+    return t1
@@ -0,0 +1,75 @@
+import os
+import pandas as pd
+
+from pydicom.dataset import Dataset
+from .fixtures.fixtures import t1
+
+from dicompare import DicomHeaderCache, load_dicom_session
+
+def write_session(t1: Dataset, dicom_dir, n=3):
+    dicom_dir.mkdir(exist_ok=True)
+    for i in range(n):
+        t1.InstanceNumber = str(i + 1)
+        t1.EchoTime = 3.0 * (i + 1)
+        t1.save_as(dicom_dir / f"slice_{i}.dcm", enforce_file_format=True)
+
+def test_cache_hits_on_second_load(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    write_session(t1, dicom_dir)
+
+    with DicomHeaderCache(str(tmp_path / "cache")) as cache:
+        first = load_dicom_session(session_dir=str(dicom_dir), cache=cache)
+        assert cache.stats["misses"] == 3
+        assert cache.stats["hits"] == 0
+        assert cache.stats["bytes_missed"] > 0
+
+        second = load_dicom_session(session_dir=str(dicom_dir), cache=cache)
+        assert cache.stats["hits"] == 3
+        assert len(cache) == 3
+
+    pd.testing.assert_frame_equal(first, second)
+
+def test_cache_rereads_changed_files(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    write_session(t1, dicom_dir)
+
+    with DicomHeaderCache(str(tmp_path / "cache")) as cache:
+        load_dicom_session(session_dir=str(dicom_dir), cache=cache)
+
+        t1.EchoTime = 42.0
+        t1.InstanceNumber = "1"
+        t1.SeriesDescription = "T1-weighted, modified"
+        t1.save_as(dicom_dir / "slice_0.dcm", enforce_file_format=True)
+        stat = os.stat(dicom_dir / "slice_0.dcm")
+        os.utime(dicom_dir / "slice_0.dcm", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        result = load_dicom_session(session_dir=str(dicom_dir), cache=cache)
+        assert cache.stats["hits"] == 2
+        assert cache.stats["misses"] == 4
+        assert 42.0 in result["EchoTime"].values
+
+def test_cache_fields_are_part_of_the_key(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    write_session(t1, dicom_dir, n=1)
+
+    with DicomHeaderCache(str(tmp_path / "cache")) as cache:
+        partial = load_dicom_session(session_dir=str(dicom_dir), cache=cache, fields=["EchoTime"])
+        full = load_dicom_session(session_dir=str(dicom_dir), cache=cache)
+        assert cache.stats["hits"] == 0
+        assert "PatientName" not in partial.columns
+        assert "PatientName" in full.columns
+
+def test_cache_invalidate_and_prune(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    write_session(t1, dicom_dir)
+
+    with DicomHeaderCache(str(tmp_path / "cache")) as cache:
+        load_dicom_session(session_dir=str(dicom_dir), cache=cache)
+
+        os.remove(dicom_dir / "slice_2.dcm")
+        assert cache.prune() == 1
+        assert len(cache) == 2
+
+        assert cache.invalidate(str(dicom_dir / "slice_0.dcm")) == 1
+        assert cache.invalidate(str(dicom_dir)) == 1
+        assert len(cache) == 0
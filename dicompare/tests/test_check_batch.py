@@ -0,0 +1,50 @@
+import json
+import pytest
+from pydicom.dataset import Dataset
+from .fixtures.fixtures import t1
+
+from dicompare.cli import check_batch
+
+@pytest.fixture
+def sessions_root(t1: Dataset, tmp_path):
+    for session, echo_time in (("sub-01", "3.0"), ("sub-02", "4.0")):
+        session_dir = tmp_path / session
+        session_dir.mkdir()
+        t1.EchoTime = echo_time
+        t1.save_as(session_dir / "1.dcm", enforce_file_format=True)
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+# Test for `find_sessions`
+def test_find_sessions(sessions_root):
+    assert [path.split("/")[-1] for path in check_batch.find_sessions(str(sessions_root))] == ["sub-01", "sub-02"]
+
+# Test for `check_session` and `write_report`
+def test_check_session(sessions_root, tmp_path):
+    json_ref = tmp_path / "ref.json"
+    json_ref.write_text(json.dumps({"acquisitions": {"T1": {"fields": [], "series": [
+        {"name": "Series 1", "fields": [{"field": "EchoTime", "value": 3.0}]},
+    ]}}}))
+    check_batch.load_reference(json_ref=str(json_ref))
+
+    results = [check_batch.check_session(str(sessions_root / session), ["ProtocolName"]) for session in ("sub-01", "sub-02")]
+    assert [summary["passed"] for _, summary in results] == [True, False]
+    assert results[1][0][0]["session"] == "sub-02"
+
+    out_report = tmp_path / "report.jsonl"
+    check_batch.write_report([row for rows, _ in results for row in rows], str(out_report))
+    rows = [json.loads(line) for line in out_report.read_text().splitlines()]
+    assert [(row["session"], row["field"]) for row in rows] == [("sub-02", "EchoTime")]
+
+    _, summary = check_batch.check_session(str(tmp_path / "missing"), ["ProtocolName"])
+    assert summary["error"]
+
+# Test for `check_session` with uploaded files
+def test_check_session_bytes(sessions_root):
+    dicom_bytes = {"1.dcm": (sessions_root / "sub-01" / "1.dcm").read_bytes()}
+    _, summary = check_batch.check_session(None, ["ProtocolName"], dicom_bytes=dicom_bytes)
+    assert summary["session"] == "upload"
+    assert summary["files"] == 1
+
+    with pytest.raises(ValueError):
+        check_batch.check_session(None, ["ProtocolName"])
@@ -0,0 +1,144 @@
+import pytest
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from dicompare import (
+    BaseValidationModel,
+    ValidationError,
+    validator,
+    check_session_compliance_with_json_reference,
+    check_session_compliance_with_python_module,
+)
+
+@pytest.fixture
+def in_session() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Acquisition": ["acq-t1", "acq-t1", "acq-t1", "acq-qsm", "acq-qsm", "acq-qsm", "acq-qsm"],
+        "Series": ["Series 1", "Series 1", "Series 2", "Series 1", "Series 1", "Series 2", "Series 2"],
+        "EchoTime": [3.0, 3.0, 3.05, 5.0, 5.0, 10.0, 10.0],
+        "RepetitionTime": [8.0, 8.0, 8.0, 20.0, 20.0, 20.0, 20.0],
+        "SeriesDescription": ["T1w", "T1w", "T1w", "QSM", "QSM", "QSM", "QSM"],
+        "ImageType": [("M",), ("M",), ("P",), ("M",), ("M",), ("P",), ("P",)],
+    })
+
+@pytest.fixture
+def ref_session() -> dict:
+    return {
+        "acquisitions": {
+            "t1": {
+                "fields": [],
+                "series": [
+                    {"name": "Series 1", "fields": [
+                        {"field": "EchoTime", "value": 3.0, "tolerance": 0.01},
+                        {"field": "RepetitionTime", "value": 8.0},
+                    ]},
+                    {"name": "Series 2", "fields": [
+                        {"field": "EchoTime", "value": 3.0, "tolerance": 0.01},
+                        {"field": "SeriesDescription", "value": "T2w"},
+                        {"field": "FlipAngle", "value": 15.0},
+                    ]},
+                ],
+            },
+            "qsm": {
+                "fields": [],
+                "series": [
+                    {"name": "Series 1", "fields": [{"field": "EchoTime", "value": 5.0}]},
+                    {"name": "Series 2", "fields": [{"field": "ImageType", "contains": "P"}]},
+                ],
+            },
+        }
+    }
+
+@pytest.fixture
+def session_map() -> dict:
+    return {
+        ("acq-t1", "Series 1"): ("t1", "Series 1"),
+        ("acq-t1", "Series 2"): ("t1", "Series 2"),
+        ("acq-missing", "Series 1"): ("qsm", "Series 1"),
+        ("acq-qsm", "Series 2"): ("qsm", "Series 2"),
+        ("acq-qsm", "Series 1"): ("qsm", "Series 3"),
+    }
+
+class EchoModel(BaseValidationModel):
+
+    @validator(["EchoTime"], rule_message="At least two echoes are required.")
+    def validate_echo_count(cls, value):
+        if len(value["EchoTime"].unique()) < 2:
+            raise ValidationError("Found a single echo.")
+        return value
+
+def test_json_reference_compliance(in_session, ref_session, session_map):
+    compliance_summary = check_session_compliance_with_json_reference(in_session, ref_session, session_map)
+
+    assert [(issue["input acquisition"], issue["field"]) for issue in compliance_summary] == [
+        (("acq-t1", "Series 2"), "EchoTime"),
+        (("acq-t1", "Series 2"), "SeriesDescription"),
+        (("acq-t1", "Series 2"), "FlipAngle"),
+        (("acq-missing", "Series 1"), "Acquisition-Level Error"),
+        (("acq-qsm", "Series 2"), "ImageType"),
+        (("acq-qsm", "Series 1"), "Reference-Level Error"),
+    ]
+    assert compliance_summary[0]["message"] == "Expected 3.0 ± 0.01, got 3.05."
+    assert compliance_summary[2]["message"] == "Field not found in input session."
+
+def test_json_reference_compliance_with_chunks(in_session, ref_session, session_map):
+    expected = check_session_compliance_with_json_reference(in_session, ref_session, session_map)
+    chunks = (group for _, group in in_session.groupby("Acquisition", sort=False))
+    assert check_session_compliance_with_json_reference(chunks, ref_session, session_map) == expected
+
+def test_python_module_compliance(in_session):
+    session_map = {"qsm": "acq-qsm", "t1": "acq-t1", "missing": "acq-missing"}
+    ref_models = {"qsm": EchoModel, "t1": EchoModel}
+
+    compliance_summary = check_session_compliance_with_python_module(in_session, ref_models, session_map)
+    assert [(issue["reference acquisition"], issue["passed"]) for issue in compliance_summary] == [
+        ("qsm", "✅"),
+        ("t1", "✅"),
+        ("missing", "❌"),
+    ]
+
+    chunks = [group for _, group in in_session.groupby("Acquisition", sort=False)]
+    assert check_session_compliance_with_python_module(chunks, ref_models, session_map) == compliance_summary
+
+    with pytest.raises(ValueError, match="split across"):
+        check_session_compliance_with_python_module([in_session, in_session], ref_models, session_map)
+
+def test_python_module_compliance_shares_tables(in_session):
+    seen_tables = []
+
+    class RecordingModel(BaseValidationModel):
+
+        @validator(["EchoTime"], rule_message="Records the table it is given.")
+        def record_table(cls, value):
+            seen_tables.append(value)
+            return value
+
+    session_map = {"qsm": "acq-qsm", "qsm-copy": "acq-qsm", "t1": "acq-t1"}
+    ref_models = {"qsm": RecordingModel, "qsm-copy": RecordingModel, "t1": RecordingModel}
+    check_session_compliance_with_python_module(in_session, ref_models, session_map)
+
+    assert len(seen_tables) == 3
+    # Models share the computed table, but each validator gets its own copy
+    assert seen_tables[0] is not seen_tables[1]
+    assert seen_tables[0].equals(seen_tables[1])
+    assert seen_tables[0]["EchoTime"].tolist() == [5.0, 10.0]
+    assert seen_tables[0]["Count"].tolist() == [2, 2]
+
+def test_python_module_compliance_executor(in_session):
+    session_map = {"qsm": "acq-qsm", "t1": "acq-t1", "missing": "acq-missing"}
+    ref_models = {"qsm": EchoModel, "t1": EchoModel}
+    expected = check_session_compliance_with_python_module(in_session, ref_models, session_map)
+
+    for executor_cls in (ThreadPoolExecutor, ProcessPoolExecutor):
+        timings = []
+        with executor_cls(max_workers=2) as executor:
+            compliance_summary = check_session_compliance_with_python_module(
+                in_session, ref_models, session_map, executor=executor, timings=timings
+            )
+        assert compliance_summary == expected
+        assert [(timing["reference acquisition"], timing["rule"]) for timing in timings] == [
+            ("qsm", "At least two echoes are required."),
+            ("t1", "At least two echoes are required."),
+        ]
+        assert all(timing["seconds"] >= 0 for timing in timings)
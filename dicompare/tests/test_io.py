@@ -1,16 +1,29 @@
+import sys
 import pytest
 import json
+import warnings
+import subprocess
+import pandas as pd
 from io import BytesIO
 from pydicom.dataset import Dataset
-from .fixtures.fixtures import t1
+from .fixtures.fixtures import t1, enhanced_mr
 
 from dicompare import (
     load_dicom,
     get_dicom_values,
+    get_dicom_path_value,
     load_dicom_session,
+    iter_dicom_session,
+    load_dicom_files,
+    build_session_frame,
     load_json_session,
+    assign_series,
+    check_session_compliance_with_json_reference,
+    find_truncated_headers,
+    TruncatedHeaderError,
 )
 
+from dicompare import profiling
 from dicompare.cli.gen_session import create_json_reference
 
 @pytest.fixture
@@ -22,6 +35,19 @@ def temp_json(tmp_path):
         return str(path)
     return _write_json
 
+# Test for the lazily imported package attributes
+def test_package_attributes(t1: Dataset, tmp_path):
+    t1.save_as(tmp_path / "1.dcm", enforce_file_format=True)
+    code = (
+        "import sys, dicompare\n"
+        "assert 'pandas' not in sys.modules\n"
+        f"assert dicompare.io.load_dicom({str(tmp_path / '1.dcm')!r})['ProtocolName']\n"
+        "assert dicompare.load_dicom is dicompare.io.load_dicom\n"
+        "for name in ['cache', 'reference', 'compliance', 'mapping', 'validation', 'utils', 'profiling', 'watch']:\n"
+        "    assert getattr(dicompare, name) is sys.modules['dicompare.' + name]\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
 # Test for `get_dicom_values`
 def test_get_dicom_values(t1: Dataset):
     dicom_dict = get_dicom_values(t1)
@@ -29,6 +55,58 @@ def test_get_dicom_values(t1: Dataset):
     assert dicom_dict["PatientName"] == "Test^Patient"
     assert dicom_dict["PixelSpacing"] == [0.5, 0.5]
 
+# Test for `get_dicom_values` with binary value representations
+def test_get_dicom_values_binary(t1: Dataset):
+    t1.EncapsulatedDocument = b"\x00\x01" * 1000
+    assert "EncapsulatedDocument" not in get_dicom_values(t1)
+
+    dicom_dict = get_dicom_values(t1, include_binary=True)
+    assert dicom_dict["EncapsulatedDocument"] == str(b"\x00\x01" * 1000)[:50]
+
+def test_get_dicom_values_vr_stats(t1: Dataset):
+    t1.add_new(0x00180089, "IS", [1, 2, 3])
+    t1.PatientName = ["Test^One", "Test^Two"]
+    vr_stats = {}
+    dicom_dict = get_dicom_values(t1, vr_stats=vr_stats)
+    assert dicom_dict["NumberOfPhaseEncodingSteps"] == [1, 2, 3]
+    assert dicom_dict["PatientName"] == ["Test^One", "Test^Two"]
+    assert vr_stats["DS"]["count"] == sum(element.VR == "DS" for element in t1)
+    assert all(stats["seconds"] >= 0 for stats in vr_stats.values())
+
+# Test for `get_dicom_values` sequence policies
+def test_get_dicom_values_sequences(enhanced_mr: Dataset):
+    full = get_dicom_values(enhanced_mr)
+    assert len(full["PerFrameFunctionalGroupsSequence"]) == 3
+    assert full["SharedFunctionalGroupsSequence"][0]["MRTimingAndRelatedParametersSequence"][0]["RepetitionTime"] == 8.0
+
+    for policy in ["skip", "lazy", 0]:
+        dicom_dict = get_dicom_values(enhanced_mr, sequences=policy)
+        assert "PerFrameFunctionalGroupsSequence" not in dicom_dict
+        assert "SharedFunctionalGroupsSequence" not in dicom_dict
+        assert dicom_dict["EchoTime"] == full["EchoTime"]
+
+    shared = get_dicom_values(enhanced_mr, sequences="shared")
+    assert "PerFrameFunctionalGroupsSequence" not in shared
+    assert shared["SharedFunctionalGroupsSequence"] == full["SharedFunctionalGroupsSequence"]
+
+    shallow = get_dicom_values(enhanced_mr, sequences=1)
+    assert shallow["SharedFunctionalGroupsSequence"] == [{}]
+
+    with pytest.raises(ValueError):
+        get_dicom_values(enhanced_mr, sequences="depth-1")
+
+# Test for `get_dicom_path_value`
+def test_get_dicom_path_value(enhanced_mr: Dataset):
+    assert get_dicom_path_value(enhanced_mr, "SharedFunctionalGroupsSequence.MRTimingAndRelatedParametersSequence.RepetitionTime") == 8.0
+    assert get_dicom_path_value(enhanced_mr, "PerFrameFunctionalGroupsSequence.MREchoSequence.EffectiveEchoTime") == [3.0, 6.0, 9.0]
+    assert get_dicom_path_value(enhanced_mr, "PerFrameFunctionalGroupsSequence[1].PlanePositionSequence.ImagePositionPatient") == [-128, -128, 1]
+    assert get_dicom_path_value(enhanced_mr, "PerFrameFunctionalGroupsSequence[5].MREchoSequence.EffectiveEchoTime") is None
+    assert get_dicom_path_value(enhanced_mr, "SharedFunctionalGroupsSequence.MREchoSequence.EffectiveEchoTime", default="missing") == "missing"
+    assert get_dicom_path_value(enhanced_mr, "EchoTime") == 3.0
+
+    with pytest.raises(ValueError):
+        get_dicom_path_value(enhanced_mr, "PerFrameFunctionalGroupsSequence..EffectiveEchoTime")
+
 # Test for `load_dicom`
 def test_load_dicom_from_path(t1: Dataset, tmp_path):
     dicom_path = tmp_path / "test.dcm"
@@ -199,3 +277,264 @@ def test_read_dicom_session_empty_directory(tmp_path):
         load_dicom_session(
             session_dir=str(empty_dir),
         )
+
+# Test that parallel header loading matches the serial path
+def test_read_dicom_session_workers_matches_serial(tmp_path, t1: Dataset):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+
+    for i in range(12):
+        t1.ProtocolName = "T1" if i % 2 else "T2"
+        t1.InstanceNumber = str(12 - i)
+        t1.EchoTime = 3.0 + i
+        t1.save_as(dicom_dir / f"slice_{i:02d}.dcm", enforce_file_format=True)
+
+    serial = load_dicom_session(session_dir=str(dicom_dir))
+    parallel = load_dicom_session(session_dir=str(dicom_dir), workers=3)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+# Test for `load_dicom` with a fields whitelist
+def test_load_dicom_fields(t1: Dataset, tmp_path):
+    dicom_path = tmp_path / "test.dcm"
+    t1.save_as(dicom_path, enforce_file_format=True)
+
+    dicom_values = load_dicom(str(dicom_path), fields=["EchoTime", "ProtocolName", "NotAKeyword"])
+    assert dicom_values["EchoTime"] == 3.0
+    assert dicom_values["ProtocolName"] == "T1"
+    assert "PatientName" not in dicom_values
+    assert "ImageType" not in dicom_values
+
+def test_read_dicom_session_fields_matches_full(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+    for i, echo_time in enumerate([3.0, 6.0, 9.0]):
+        t1.EchoTime = echo_time
+        t1.InstanceNumber = str(i + 1)
+        t1.save_as(dicom_dir / f"echo_{i}.dcm", enforce_file_format=True)
+
+    fields = ["EchoTime", "ImageType"]
+    full = load_dicom_session(session_dir=str(dicom_dir))
+    partial = load_dicom_session(session_dir=str(dicom_dir), fields=fields)
+
+    assert "PatientName" not in partial.columns
+    for col in fields + ["ProtocolName", "InstanceNumber", "Acquisition"]:
+        assert list(partial[col]) == list(full[col])
+
+    # Byte content is parsed the same way
+    buffer = BytesIO()
+    t1.save_as(buffer, enforce_file_format=True)
+    from_bytes = load_dicom_session(dicom_bytes={"test.dcm": buffer.getvalue()}, fields=fields)
+    assert list(from_bytes["EchoTime"]) == [9.0]
+    assert "PatientName" not in from_bytes.columns
+
+# Test the column types of the session DataFrame
+def test_read_dicom_session_column_types(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+    t1.save_as(dicom_dir / "with_flip_angle.dcm", enforce_file_format=True)
+    del t1.FlipAngle
+    t1.InstanceNumber = "2"
+    t1.save_as(dicom_dir / "without_flip_angle.dcm", enforce_file_format=True)
+
+    result = load_dicom_session(session_dir=str(dicom_dir))
+
+    assert result["EchoTime"].dtype == "float64"
+    assert result["InstanceNumber"].dtype == "int64"
+    assert result["FlipAngle"].dtype == "float64"
+    assert result["FlipAngle"].isna().sum() == 1
+    assert all(image_type == ("ORIGINAL", "PRIMARY", "M", "ND") for image_type in result["ImageType"])
+
+# Test the acquisition labels and index of the session DataFrame
+def test_read_dicom_session_acquisition_labels(t1: Dataset, tmp_path):
+    for i, (protocol, series_number) in enumerate([("T1 MPRAGE", 2), ("qsm", 1), ("T1 MPRAGE", 1), ("qsm", 1)]):
+        t1.ProtocolName = protocol
+        t1.SeriesNumber = series_number
+        t1.InstanceNumber = 4 - i
+        t1.save_as(tmp_path / f"{i}.dcm", enforce_file_format=True)
+    del t1.ProtocolName
+    t1.save_as(tmp_path / "missing.dcm", enforce_file_format=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.SettingWithCopyWarning)
+        session_df = load_dicom_session(session_dir=str(tmp_path), acquisition_fields=["ProtocolName", "SeriesNumber"])
+    assert session_df.index.tolist() == [("T1 MPRAGE", 1, 0), ("T1 MPRAGE", 2, 0), ("qsm", 1, 0), ("qsm", 1, 1)]
+    assert session_df.index.names == ["ProtocolName", "SeriesNumber", None]
+    assert session_df["Acquisition"].tolist() == ["acq-t1mprage-1", "acq-t1mprage-2", "acq-qsm-1", "acq-qsm-1"]
+    assert session_df["InstanceNumber"].tolist() == [2, 4, 1, 3]
+
+# Test for `iter_dicom_session`
+def test_iter_dicom_session(t1: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+    for i in range(7):
+        t1.ProtocolName = ["T1", "T2", "FLAIR"][i % 3]
+        t1.InstanceNumber = str(i + 1)
+        t1.save_as(dicom_dir / f"slice_{i}.dcm", enforce_file_format=True)
+
+    full = load_dicom_session(session_dir=str(dicom_dir))
+
+    chunks = list(iter_dicom_session(session_dir=str(dicom_dir), chunk_size=3, by_acquisition=False))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert sorted(pd.concat(chunks)["DICOM_Path"]) == sorted(full["DICOM_Path"])
+
+    # By default, one chunk per acquisition, parsing each file once
+    dicom_bytes = {str(path): path.read_bytes() for path in dicom_dir.iterdir()}
+    for kwargs in [{"session_dir": str(dicom_dir)}, {"dicom_bytes": dicom_bytes}]:
+        with profiling.profile() as profile:
+            chunks = list(iter_dicom_session(chunk_size=3, **kwargs))
+        assert profile.counters["files read"] == 7
+        assert sorted(chunk["Acquisition"].unique()[0] for chunk in chunks) == ["acq-flair", "acq-t1", "acq-t2"]
+        for chunk in chunks:
+            assert chunk["Acquisition"].nunique() == 1
+            acquisition = full[full["Acquisition"] == chunk["Acquisition"].iloc[0]]
+            pd.testing.assert_frame_equal(chunk, acquisition)
+
+# Test for `load_dicom_files` and `build_session_frame`
+def test_load_dicom_files(t1: Dataset, tmp_path):
+    paths = []
+    for i in range(4):
+        t1.ProtocolName = ["T1", "T2"][i % 2]
+        t1.InstanceNumber = str(i + 1)
+        paths.append(str(tmp_path / f"slice_{i}.dcm"))
+        t1.save_as(paths[-1], enforce_file_format=True)
+
+    # Rows loaded in several batches give the same DataFrame as a whole-session load
+    rows = load_dicom_files(paths[:1]) + load_dicom_files(paths[1:])
+    assert [row["DICOM_Path"] for row in rows] == paths
+    pd.testing.assert_frame_equal(
+        build_session_frame(rows, ["ProtocolName"]),
+        load_dicom_session(session_dir=str(tmp_path)),
+    )
+
+# Test for `assign_series`
+def test_assign_series():
+    session_df = pd.DataFrame({
+        "Acquisition": ["acq-b", "acq-a", "acq-b", "acq-a", "acq-b"],
+        "ProtocolName": ["b", "a", "b", "a", "b"],
+        "EchoTime": [20.0, 5.0, 10.0, float("nan"), 20.0],
+        "ImageType": [("M",), ("P",), ("M",), ("P",), ("P",)],
+    })
+
+    result = assign_series(session_df, ["ProtocolName"], ["EchoTime", "ImageType"])
+    assert result.index.tolist() == [1, 3, 2, 0, 4]
+    assert list(zip(result["Acquisition"], result["Series"])) == [
+        ("acq-a", "Series 1"),
+        ("acq-a", "Series 2"),
+        ("acq-b", "Series 1"),
+        ("acq-b", "Series 2"),
+        ("acq-b", "Series 3"),
+    ]
+    assert "Series" not in session_df.columns
+
+# Test for dotted field paths in `load_dicom_session` and JSON references
+def test_read_dicom_session_field_paths(enhanced_mr: Dataset, tmp_path, temp_json):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+    enhanced_mr.save_as(dicom_dir / "enhanced.dcm", enforce_file_format=True)
+
+    repetition_time = "SharedFunctionalGroupsSequence.MRTimingAndRelatedParametersSequence.RepetitionTime"
+    echo_times = "PerFrameFunctionalGroupsSequence.MREchoSequence.EffectiveEchoTime"
+    json_path = temp_json({
+        "acquisitions": {
+            "acq-T1": {
+                "fields": [{"field": "ProtocolName", "value": "T1"}],
+                "series": [{"name": "Series 1", "fields": [
+                    {"field": repetition_time, "value": 8.0},
+                    {"field": echo_times, "value": [3.0, 6.0, 12.0]},
+                ]}],
+            }
+        }
+    })
+    reference_fields, ref_session = load_json_session(json_path)
+    assert repetition_time in reference_fields
+
+    session_df = load_dicom_session(session_dir=str(dicom_dir), fields=reference_fields, sequences="lazy")
+    assert session_df[repetition_time].iloc[0] == 8.0
+    assert session_df[echo_times].iloc[0] == (3.0, 6.0, 9.0)
+    assert "PerFrameFunctionalGroupsSequence" not in session_df.columns
+    assert "SharedFunctionalGroupsSequence" not in session_df.columns
+
+    session_df = assign_series(session_df, ["ProtocolName"], reference_fields)
+    compliance = check_session_compliance_with_json_reference(
+        in_session=session_df,
+        ref_session=ref_session,
+        session_map={("acq-t1", "Series 1"): ("acq-T1", "Series 1")},
+    )
+    assert [entry["field"] for entry in compliance] == [echo_times]
+
+# Test for `load_dicom_session` with enhanced multi-frame expansion
+def test_read_dicom_session_frames(enhanced_mr: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+    enhanced_mr.save_as(dicom_dir / "enhanced.dcm", enforce_file_format=True)
+
+    session_df = load_dicom_session(session_dir=str(dicom_dir), frames="expand")
+    assert list(session_df["FrameNumber"]) == [1, 2, 3]
+    assert list(session_df["EchoTime"]) == [3.0, 6.0, 9.0]
+    assert list(session_df["EffectiveEchoTime"]) == [3.0, 6.0, 9.0]
+    assert [image_type[2] for image_type in session_df["ImageType"]] == ["M", "P", "M"]
+    assert list(session_df["RepetitionTime"]) == [8.0, 8.0, 8.0]
+    assert session_df["DICOM_Path"].nunique() == 1
+    assert "PerFrameFunctionalGroupsSequence" not in session_df.columns
+
+    fields = ["EchoTime", "ImageType", "RepetitionTime"]
+    whitelisted = load_dicom_session(session_dir=str(dicom_dir), fields=fields, frames="expand")
+    pd.testing.assert_frame_equal(whitelisted[fields].reset_index(drop=True), session_df[fields].reset_index(drop=True))
+    assert "PlanePositionSequence" not in whitelisted.columns and "ImagePositionPatient" not in whitelisted.columns
+
+    # Without expansion, the file is a single row
+    assert len(load_dicom_session(session_dir=str(dicom_dir), fields=fields)) == 1
+
+def test_read_dicom_session_frame_runs(enhanced_mr: Dataset, tmp_path):
+    dicom_dir = tmp_path / "dicom_dir"
+    dicom_dir.mkdir()
+    for frame, echo_time in zip(enhanced_mr.PerFrameFunctionalGroupsSequence, [3.0, 3.0, 6.0]):
+        frame.MREchoSequence[0].EffectiveEchoTime = echo_time
+        frame.MRImageFrameTypeSequence[0].FrameType = ["ORIGINAL", "PRIMARY", "M", "NONE"]
+    enhanced_mr.save_as(dicom_dir / "enhanced.dcm", enforce_file_format=True)
+
+    session_df = load_dicom_session(session_dir=str(dicom_dir), frames="runs")
+    assert list(session_df["EchoTime"]) == [3.0, 6.0]
+    assert list(session_df["FrameNumber"]) == [1, 3]
+    assert list(session_df["FrameCount"]) == [2, 1]
+    # Per-slice values are dropped from runs; the file-level value is kept
+    assert list(session_df["ImagePositionPatient"]) == [(-128, -128, 0)] * 2
+
+    with pytest.raises(ValueError):
+        load_dicom_session(session_dir=str(dicom_dir), frames="frames")
+
+# Test for `load_dicom` with header prefixes
+def test_load_dicom_header_prefix(t1: Dataset):
+    t1.ImageComments = "x" * 5000
+    t1.Rows, t1.Columns = 100, 100
+    t1.PixelData = bytes(2 * 100 * 100)
+    buffer = BytesIO()
+    t1.save_as(buffer, enforce_file_format=True)
+    dicom_bytes = buffer.getvalue()
+    full = load_dicom(dicom_bytes)
+
+    with pytest.raises(TruncatedHeaderError) as e:
+        load_dicom(dicom_bytes[:1024], file_size=len(dicom_bytes))
+    assert 1024 < e.value.bytes_needed <= len(dicom_bytes)
+
+    # Longer prefixes are requested until the header is complete, without reading the pixel data
+    prefix = dicom_bytes[:1024]
+    while (needed := find_truncated_headers({"t1.dcm": prefix}, {"t1.dcm": len(dicom_bytes)})):
+        prefix = dicom_bytes[:needed["t1.dcm"]]
+    assert len(prefix) < len(dicom_bytes)
+    assert load_dicom(prefix, file_size=len(dicom_bytes)) == full
+
+    # Elements before the truncated one are enough for a whitelisted read
+    assert load_dicom(dicom_bytes[:1024], fields=["PatientID"], file_size=len(dicom_bytes))["PatientID"] == "123456"
+
+def test_read_dicom_session_header_prefix(t1: Dataset):
+    t1.ImageComments = "x" * 5000
+    buffer = BytesIO()
+    t1.save_as(buffer, enforce_file_format=True)
+    dicom_bytes = buffer.getvalue()
+
+    file_sizes = {"a.dcm": len(dicom_bytes), "b.dcm": len(dicom_bytes)}
+    with pytest.raises(TruncatedHeaderError) as e:
+        load_dicom_session(dicom_bytes={"a.dcm": dicom_bytes[:1024], "b.dcm": dicom_bytes}, file_sizes=file_sizes)
+    assert list(e.value.files) == ["a.dcm"]
@@ -0,0 +1,80 @@
+import pandas as pd
+
+from dicompare import map_to_json_reference, map_to_python_reference, compile_json_reference
+from dicompare.mapping import calculate_field_score, levenshtein_distance, capped_levenshtein_distance, MAX_DIFF_SCORE
+
+def test_levenshtein_distance():
+    assert levenshtein_distance("kitten", "sitting") == 3
+    assert levenshtein_distance("", "abc") == 3
+    assert levenshtein_distance("flaw", "lawn") == 2
+    assert levenshtein_distance("x" * 100, "y" * 100) == 100
+    assert capped_levenshtein_distance("x" * 100, "y" * 100) == MAX_DIFF_SCORE
+    assert capped_levenshtein_distance("T1_mprage", "T1_MPRAGE") == 6
+
+def test_calculate_field_score():
+    assert calculate_field_score(3.0, 3.05, tolerance=0.1) == 0
+    assert calculate_field_score(3.0, 5.0) == 2.0
+    assert calculate_field_score(3.0, 500.0) == MAX_DIFF_SCORE
+    assert calculate_field_score("*T1*", "MPRAGE_T1") == 0
+    assert calculate_field_score("*T1*", "FLAIR") == 5
+    assert calculate_field_score(None, ("M", "ND"), contains="M") == 0
+    assert calculate_field_score("T1w", "T2w") == 1
+    assert calculate_field_score(3.0, None) == MAX_DIFF_SCORE
+    assert calculate_field_score(("ORIGINAL", "M"), ("DERIVED", "P")) == 8
+    assert calculate_field_score(("ORIGINAL", "M", "ND"), ("DERIVED", "P")) == MAX_DIFF_SCORE
+
+def test_map_to_json_reference():
+    in_session = pd.DataFrame({
+        "Acquisition": ["acq-a", "acq-a", "acq-b", "acq-b"],
+        "Series": ["Series 1", "Series 2", "Series 1", "Series 1"],
+        "EchoTime": [5.0, 10.0, 90.0, 90.0],
+        "SeriesDescription": ["qsm_mag", "qsm_phase", "flair", "flair"],
+    })
+    ref_session = {
+        "acquisitions": {
+            "flair": {"fields": [], "series": [
+                {"name": "Series 1", "fields": [{"field": "EchoTime", "value": 89.0, "tolerance": 2.0}]},
+            ]},
+            "qsm": {"fields": [], "series": [
+                {"name": "Series 1", "fields": [{"field": "SeriesDescription", "value": "*phase*"}]},
+                {"name": "Series 2", "fields": [{"field": "SeriesDescription", "value": "*mag*"}]},
+            ]},
+        }
+    }
+
+    expected = {
+        ("acq-a", "Series 1"): ("qsm", "Series 2"),
+        ("acq-a", "Series 2"): ("qsm", "Series 1"),
+        ("acq-b", "Series 1"): ("flair", "Series 1"),
+    }
+    assert map_to_json_reference(in_session, ref_session) == expected
+    assert map_to_json_reference(in_session, compile_json_reference(ref_session)) == expected
+
+def test_map_to_python_reference():
+    in_session = pd.DataFrame({"Acquisition": ["acq-t1mprage", "acq-qsm", "acq-qsm"]})
+    ref_models = {"QSM": object, "T1 MPRAGE": object}
+
+    assert map_to_python_reference(in_session, ref_models) == {"QSM": "acq-qsm", "T1 MPRAGE": "acq-t1mprage"}
+    assert map_to_python_reference(in_session.iloc[:0], ref_models) == {}
+
+def test_map_to_json_reference_ambiguous_values():
+    # SliceLocation varies within a series and is scored as missing; the series is told apart by EchoTime
+    in_session = pd.DataFrame({
+        "Acquisition": ["acq-a"] * 4,
+        "Series": ["Series 1", "Series 1", "Series 2", "Series 2"],
+        "EchoTime": [10.0, 10.0, 20.0, 20.0],
+        "SliceLocation": [0.0, 1.0, 0.0, 1.0],
+    })
+    ref_session = {
+        "acquisitions": {
+            "a": {"fields": [], "series": [
+                {"name": "echo1", "fields": [{"field": "SliceLocation", "value": 0.0}, {"field": "EchoTime", "value": 21.0, "tolerance": 0.5}]},
+                {"name": "echo2", "fields": [{"field": "SliceLocation", "value": 0.0}, {"field": "EchoTime", "value": 9.0}]},
+            ]},
+        }
+    }
+
+    assert map_to_json_reference(in_session, ref_session) == {
+        ("acq-a", "Series 1"): ("a", "echo2"),
+        ("acq-a", "Series 2"): ("a", "echo1"),
+    }
@@ -0,0 +1,42 @@
+import json
+from pydicom.dataset import Dataset
+from .fixtures.fixtures import t1
+
+from dicompare import profiling
+from dicompare import load_dicom_session, check_session_compliance_with_python_module
+from .test_compliance import EchoModel
+
+# Test for `profile`
+def test_profile(t1: Dataset, tmp_path):
+    for i in range(3):
+        t1.InstanceNumber = i + 1
+        t1.save_as(tmp_path / f"{i}.dcm", enforce_file_format=True)
+
+    with profiling.profile() as profile:
+        with profiling.span("load session"):
+            session_df = load_dicom_session(session_dir=str(tmp_path))
+        check_session_compliance_with_python_module(session_df, {"t1": EchoModel}, {"t1": "acq-t1"})
+
+    assert profile.spans[("load session", "dcmread")][0] == 3
+    assert profile.spans[("load session", "get_dicom_values")][0] == 3
+    assert ("load session", "acquisition grouping") in profile.spans
+    assert ("validation",) in profile.spans
+    assert profile.counters["files read"] == 3
+    assert profile.counters["bytes read"] > 0
+    assert profile.counters["groupbys"] > 0
+
+    summary = profile.summary()
+    assert summary["counters"]["elements converted"] == sum(stats["count"] for stats in summary["vr"].values())
+    assert [stats["field"] for stats in summary["validators"]] == ["EchoTime"]
+    assert [span["path"] for span in summary["spans"]][:2] == [["load session"], ["load session", "discover files"]]
+    assert "dcmread" in profile.format()
+
+    out_json = tmp_path / "profile.json"
+    profiling.write_profile(profile, str(out_json))
+    assert json.loads(out_json.read_text())["counters"]["files read"] == 3
+
+    # Nothing is recorded while profiling is disabled
+    with profiling.span("load session"):
+        load_dicom_session(session_dir=str(tmp_path))
+    assert profile.counters["files read"] == 3
+    assert profiling.vr_stats() is None and profiling.validator_timings() is None
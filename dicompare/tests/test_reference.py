@@ -0,0 +1,56 @@
+import numpy as np
+
+from dicompare import compile_json_reference, CompiledReference
+
+REF_SESSION = {
+    "acquisitions": {
+        "t1": {
+            "fields": [],
+            "series": [
+                {"name": "Series 1", "fields": [
+                    {"field": "EchoTime", "value": 3.0, "tolerance": 0.1},
+                    {"field": "SeriesDescription", "value": "*T1*"},
+                    {"field": "ImageType", "contains": "M"},
+                ]},
+                {"name": "Series 2", "fields": [
+                    {"field": "RepetitionTime", "value": 8.0},
+                ]},
+            ],
+        },
+        "flair": {
+            "fields": [],
+            "series": [{"name": "Series 1", "fields": [{"field": "EchoTime", "value": 90.0}]}],
+        },
+    }
+}
+
+def test_compile_json_reference_index():
+    reference = compile_json_reference(REF_SESSION)
+
+    assert isinstance(reference, CompiledReference)
+    assert compile_json_reference(reference) is reference
+    assert reference.series_keys == [("flair", "Series 1"), ("t1", "Series 1"), ("t1", "Series 2")]
+    assert sorted(reference.series_fields) == ["EchoTime", "ImageType", "RepetitionTime", "SeriesDescription"]
+    assert reference.get_rules("t1", "Series 3") is None
+    assert [rule.field for rule in reference.get_rules("t1", "Series 2")] == ["RepetitionTime"]
+
+def test_compile_json_reference_rules():
+    reference = compile_json_reference(REF_SESSION)
+
+    echo_time, description, image_type = reference.get_rules("t1", "Series 1")
+    assert echo_time.kind == "tolerance"
+    assert (echo_time.lower, echo_time.upper) == (2.9, 3.1)
+    assert description.kind == "wildcard"
+    assert description.pattern.match("MPRAGE_T1_SAG")
+    assert not description.pattern.match("FLAIR")
+    assert image_type.kind == "contains"
+    assert reference.get_rules("t1", "Series 2")[0].kind == "exact"
+
+    # Rules on a field are collected across series, in `series_keys` order
+    assert [(col, position) for col, position, _ in reference.field_rules["EchoTime"]] == [(0, 0), (1, 0)]
+    assert echo_time.index == 1
+    bounds = reference.field_bounds["EchoTime"]
+    np.testing.assert_array_equal(bounds["value"], [90.0, 3.0])
+    np.testing.assert_array_equal(bounds["lower"], [np.nan, 2.9])
+    np.testing.assert_array_equal(bounds["numeric"], [True, True])
+    np.testing.assert_array_equal(reference.field_bounds["SeriesDescription"]["numeric"], [False])
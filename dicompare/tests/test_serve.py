@@ -0,0 +1,119 @@
+import json
+import base64
+import threading
+import urllib.request
+import urllib.error
+import pytest
+from io import BytesIO
+from pydicom.dataset import Dataset
+from .fixtures.fixtures import t1
+
+from dicompare.cli import serve
+
+@pytest.fixture
+def json_ref(tmp_path):
+    json_ref = tmp_path / "ref.json"
+    json_ref.write_text(json.dumps({"acquisitions": {"T1": {"fields": [], "series": [
+        {"name": "Series 1", "fields": [{"field": "EchoTime", "value": 3.0}]},
+    ]}}}))
+    return json_ref
+
+@pytest.fixture
+def server(tmp_path):
+    server = serve.make_server(port=0, root=str(tmp_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    server.executor.shutdown()
+
+def post(url, request, headers={}):
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url + "/check", data=json.dumps(request).encode(), headers=headers)) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+# Test for `get_reference`
+def test_get_reference(json_ref, tmp_path):
+    serve.init_worker(reference_cache_size=1)
+    reference = serve.get_reference(json_ref=str(json_ref))
+    assert serve.get_reference(json_ref=str(json_ref)) is reference
+    assert reference["fields"] == ["EchoTime"]
+
+    other_ref = tmp_path / "other.json"
+    other_ref.write_text(json_ref.read_text())
+    serve.get_reference(json_ref=str(other_ref))
+    assert len(serve._references) == 1
+    assert serve.get_reference(json_ref=str(json_ref)) is not reference
+
+# Test for `ComplianceRequestHandler`
+def test_serve_check(t1: Dataset, json_ref, server, tmp_path):
+    with urllib.request.urlopen(server + "/health") as response:
+        assert json.loads(response.read()) == {"status": "ok"}
+        assert "Access-Control-Allow-Origin" not in response.headers
+
+    session_dir = tmp_path / "sub-01"
+    session_dir.mkdir()
+    t1.EchoTime = "4.0"
+    t1.save_as(session_dir / "1.dcm", enforce_file_format=True)
+    status, body = post(server, {"json_ref": str(json_ref), "session_dir": str(session_dir)})
+    assert status == 200
+    assert body["summary"]["session"] == "sub-01"
+    assert [issue["field"] for issue in body["issues"]] == ["EchoTime"]
+
+    buffer = BytesIO()
+    t1.EchoTime = "3.0"
+    t1.save_as(buffer, enforce_file_format=True)
+    dicom_content = buffer.getvalue()
+    files = {"1.dcm": base64.b64encode(dicom_content).decode()}
+    status, body = post(server, {"json_ref": str(json_ref), "files": files, "session": "upload-01"})
+    assert status == 200
+    assert body["summary"]["passed"] and body["summary"]["session"] == "upload-01"
+
+    files = {"1.dcm": base64.b64encode(dicom_content[:200]).decode()}
+    status, body = post(server, {"json_ref": str(json_ref), "files": files, "file_sizes": {"1.dcm": len(dicom_content)}})
+    assert status == 422
+    assert body["bytes_needed"]["1.dcm"] > 200
+
+    assert post(server, {"session_dir": str(session_dir)})[0] == 400
+    assert post(server, {"json_ref": str(json_ref), "session_dir": str(session_dir)}, headers={"Origin": "http://evil.example"})[0] == 403
+    assert post(server, {"json_ref": str(tmp_path / "missing.json"), "session_dir": str(session_dir)})[0] == 400
+
+# Test for `run_check`
+def test_run_check_paths(t1: Dataset, json_ref, tmp_path):
+    serve.init_worker()
+    root = tmp_path / "root"
+    session_dir = root / "sub-01"
+    session_dir.mkdir(parents=True)
+    t1.save_as(session_dir / "1.dcm", enforce_file_format=True)
+    (root / "ref.json").write_text(json_ref.read_text())
+
+    assert serve.run_check({"json_ref": "ref.json", "session_dir": "sub-01"}, root=str(root))[0] == 200
+    assert serve.run_check({"json_ref": str(json_ref), "session_dir": "sub-01"}, root=str(root))[0] == 403
+    assert serve.run_check({"json_ref": "ref.json", "session_dir": "../root/sub-01/../.."}, root=str(root))[0] == 403
+    (root / "link").symlink_to(tmp_path)
+    assert serve.run_check({"json_ref": "link/ref.json", "session_dir": "sub-01"}, root=str(root))[0] == 403
+
+    status, body = serve.run_check({"json_ref": "ref.json", "files": {"1.dcm": "not base64!"}}, root=str(root))
+    assert status == 400 and "base64" in body["error"]
+
+# Test for `ComplianceRequestHandler` with cross-origin requests
+def test_serve_origin(json_ref, tmp_path):
+    server = serve.make_server(port=0, root=str(tmp_path), allow_origin="http://localhost:8080")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        request = urllib.request.Request(url + "/check", method="OPTIONS", headers={"Origin": "http://localhost:8080"})
+        with urllib.request.urlopen(request) as response:
+            assert response.status == 204
+            assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:8080"
+
+        request = {"json_ref": str(json_ref), "session_dir": str(tmp_path)}
+        assert post(url, request, headers={"Origin": "http://evil.example"})[0] == 403
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.executor.shutdown()
@@ -0,0 +1,95 @@
+import pandas as pd
+
+from dicompare import BaseValidationModel, ValidationError, validator
+from dicompare.validation import CombinationTables, get_unique_combinations, make_hashable
+
+def make_acquisition() -> pd.DataFrame:
+    return pd.DataFrame({
+        "Acquisition": ["acq-qsm"] * 6,
+        "EchoTime": [5.0, 5.0, 10.0, 10.0, 15.0, float("nan")],
+        "ImageType": [("M",), ("P",), ("M",), ("P",), ("M",), ("P",)],
+        "FlipAngle": [15.0] * 6,
+    })
+
+# Test for `CombinationTables`
+def test_combination_tables_projection():
+    data = make_acquisition()
+    tables = CombinationTables(data)
+    tables.prepare([("EchoTime",), ("ImageType", "EchoTime"), ("FlipAngle", "EchoTime")])
+
+    for field_names in [("EchoTime",), ("ImageType",), ("EchoTime", "ImageType")]:
+        expected = data.groupby(list(field_names), dropna=False).size().reset_index(name="Count")
+        pd.testing.assert_frame_equal(tables.get(field_names), expected)
+
+    assert tables.get(("EchoTime",)) is tables.get(["EchoTime"])
+    assert tables.get_dict(("EchoTime",)) is tables.get_dict(("EchoTime",))
+
+# Test that validators cannot modify the shared combination tables
+def test_validate_isolates_validators():
+
+    class EchoModel(BaseValidationModel):
+
+        @validator(["EchoTime"], rule_message="At least two echoes are required.")
+        def validate_echo_count(cls, value):
+            value.loc[0, "Count"] = 100
+            value.drop(index=1, inplace=True)
+            return value
+
+        @validator(["EchoTime"], rule_message="The first echo must be short.")
+        def validate_first_echo(cls, value):
+            assert value["Count"].tolist() == [2, 2, 1, 1]
+            if value["EchoTime"].min() > 1:
+                raise ValidationError("First echo is too long.")
+            return value
+
+    tables = {}
+    success, errors, passes = EchoModel().validate(make_acquisition(), tables=tables)
+    assert not success
+    assert errors[0]["value"] == passes[0]["value"] and errors[0]["value"] is not passes[0]["value"]
+    passes[0]["value"]["Count"][0] = 0
+    assert errors[0]["value"]["Count"] == [2, 2, 1, 1]
+    assert tables["acq-qsm"].get(("EchoTime",))["Count"].tolist() == [2, 2, 1, 1]
+
+def legacy_get_unique_combinations(data, fields):
+    """The per-column implementation of `get_unique_combinations`, kept as a reference."""
+    data = data.copy()
+    for col in data.columns:
+        data[col] = data[col].apply(make_hashable)
+    unique_combinations = data.groupby(fields, dropna=False).first().reset_index()
+    for col in data.columns:
+        if col not in fields:
+            if data.groupby(fields)[col].nunique(dropna=False).max() != 1:
+                unique_combinations[col] = None
+            else:
+                unique_combinations[col] = data.groupby(fields)[col].first().values
+    return unique_combinations
+
+# Test for `get_unique_combinations`
+def test_get_unique_combinations():
+    data = pd.DataFrame({
+        "EchoTime": [10.0, 5.0, 5.0, 10.0],
+        "ImageType": [["M", "ND"], ["P"], ["P"], ["M", "ND"]],
+        "FlipAngle": [15.0, 15.0, 15.0, 15.0],
+        "SliceLocation": [0.0, 1.0, 2.0, 3.0],
+        "Shim": [{"a": 1}, {"a": 2}, {"a": 2}, {"a": 1}],
+        "SeriesDescription": ["mag", None, None, "mag"],
+    })
+    original = data.copy()
+
+    result = get_unique_combinations(data, ["EchoTime"])
+    pd.testing.assert_frame_equal(result, legacy_get_unique_combinations(data, ["EchoTime"]))
+    assert result.columns.tolist() == data.columns.tolist()
+    assert result["ImageType"].tolist() == [("P",), ("M", "ND")]
+    assert result["SliceLocation"].tolist() == [None, None]
+    assert result["Shim"].tolist() == [(("a", 2),), (("a", 1),)]
+    pd.testing.assert_frame_equal(data, original)
+
+    for fields in (["ImageType"], ["EchoTime", "FlipAngle"], ["SliceLocation"], ["Shim"]):
+        pd.testing.assert_frame_equal(
+            get_unique_combinations(data, fields), legacy_get_unique_combinations(data, fields)
+        )
+
+    # Missing values form their own combination
+    result = get_unique_combinations(data, ["SeriesDescription"])
+    assert result["SeriesDescription"].tolist()[0] == "mag"
+    assert result["EchoTime"].tolist() == [10.0, 5.0]
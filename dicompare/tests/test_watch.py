@@ -0,0 +1,78 @@
+import pytest
+from pydicom.dataset import Dataset
+from .fixtures.fixtures import t1
+
+from dicompare.io import load_dicom_session, assign_series
+from dicompare.mapping import map_to_json_reference
+from dicompare.compliance import check_session_compliance_with_json_reference
+from dicompare.watch import SessionWatcher
+
+REF_SESSION = {"acquisitions": {
+    "T1": {"fields": [], "series": [{"name": "Series 1", "fields": [{"field": "EchoTime", "value": 3.0}]}]},
+    "T2": {"fields": [], "series": [{"name": "Series 1", "fields": [{"field": "EchoTime", "value": 80.0}]}]},
+}}
+
+def write_files(t1: Dataset, session_dir, protocol_name, echo_times, start):
+    t1.ProtocolName = protocol_name
+    for i, echo_time in enumerate(echo_times, start):
+        t1.EchoTime = echo_time
+        t1.InstanceNumber = i
+        t1.save_as(session_dir / f"{i}.dcm", enforce_file_format=True)
+
+def full_check(session_dir):
+    in_session = load_dicom_session(session_dir=str(session_dir), fields=["EchoTime"])
+    in_session = assign_series(in_session, ["ProtocolName"], ["EchoTime"])
+    session_map = map_to_json_reference(in_session, REF_SESSION)
+    return session_map, check_session_compliance_with_json_reference(in_session, REF_SESSION, session_map)
+
+# Test for `SessionWatcher.poll`
+def test_session_watcher(t1: Dataset, tmp_path):
+    watcher = SessionWatcher(
+        str(tmp_path), ["ProtocolName"], ref_session=REF_SESSION, reference_fields=["EchoTime"], fields=["EchoTime"],
+    )
+
+    write_files(t1, tmp_path, "T1", ["3.0", "3.0"], 1)
+    assert watcher.poll() == set()  # files are loaded once they are unchanged between polls
+    assert watcher.poll() == {"acq-t1"}
+    assert watcher.n_files == 2
+    assert (watcher.session_map, watcher.compliance_summary) == full_check(tmp_path)
+    assert watcher.compliance_summary == []
+
+    write_files(t1, tmp_path, "T2", ["90.0", "90.0"], 3)
+    watcher.poll()
+    assert watcher.poll() == {"acq-t2"}
+    assert watcher.n_files == 4
+    assert (watcher.session_map, watcher.compliance_summary) == full_check(tmp_path)
+    assert len(watcher.compliance_summary) == 1
+
+    write_files(t1, tmp_path, "T1", ["4.0"], 5)
+    watcher.poll()
+    assert watcher.poll() == {"acq-t1"}
+    assert (watcher.session_map, watcher.compliance_summary) == full_check(tmp_path)
+    assert len(watcher.session_df) == 5
+    assert watcher.poll() == set()
+
+    with pytest.raises(ValueError):
+        SessionWatcher(str(tmp_path), ["ProtocolName"])
+
+# Test for `SessionWatcher.poll` with unreadable files
+def test_session_watcher_bad_file(t1: Dataset, tmp_path):
+    watcher = SessionWatcher(
+        str(tmp_path), ["ProtocolName"], ref_session=REF_SESSION, reference_fields=["EchoTime"], fields=["EchoTime"],
+    )
+
+    write_files(t1, tmp_path, "T1", ["3.0"], 1)
+    (tmp_path / "junk.dcm").write_bytes(b"not a DICOM file")
+    watcher.poll()
+    with pytest.warns(UserWarning, match="junk.dcm"):
+        assert watcher.poll() == {"acq-t1"}
+    assert watcher.n_files == 1
+    assert watcher.poll() == set()  # the unreadable file is not retried until it changes
+    assert watcher.poll() == set()
+
+    write_files(t1, tmp_path, "T1", ["3.0"], 2)
+    (tmp_path / "2.dcm").rename(tmp_path / "junk.dcm")
+    watcher.poll()
+    assert watcher.poll() == {"acq-t1"}
+    assert watcher.n_files == 2
+    assert (watcher.session_map, watcher.compliance_summary) == full_check(tmp_path)
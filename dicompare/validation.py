@@ -4,9 +4,14 @@ used in DICOM compliance checks.
 
 """
 
-from typing import Callable, List, Dict, Any, Tuple
+import time
+
+from concurrent.futures import Executor, Future
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import pandas as pd
 
+from . import profiling
+
 def make_hashable(value):
     """
     Convert a value into a hashable format for use in dictionaries or sets.
@@ -36,13 +41,47 @@ def make_hashable(value):
     else:
         return value  # Assume the value is already hashable
     
+def _is_hashable_column(values: pd.Series) -> bool:
+    """
+    Check whether all values of a column are hashable, using the hash table of `pd.unique`.
+
+    Args:
+        values (pd.Series): The column to check.
+
+    Returns:
+        bool: True if every value is hashable.
+    """
+
+    try:
+        pd.unique(values)
+    except TypeError:
+        return False
+    return True
+
+def _make_value_hashable(value):
+    """
+    `make_hashable`, with a fast path for flat lists of hashable values.
+    """
+
+    if type(value) is list:
+        converted = tuple(value)
+        try:
+            hash(converted)
+            return converted
+        except TypeError:
+            pass
+    return make_hashable(value)
+
 def get_unique_combinations(data: pd.DataFrame, fields: List[str]) -> pd.DataFrame:
     """
     Filter a DataFrame to unique combinations of specified fields, filling varying values 
     in other fields with `None`.
 
     Notes:
-        - Ensures all values are hashable to avoid grouping issues.
+        - Ensures all values are hashable to avoid grouping issues; only object columns holding
+          unhashable values (e.g., lists) are converted, on a copy of `data`.
+        - A field is set to `None` for all combinations if it varies within any of them.
+        - Uses a single grouping for all columns.
         - Useful for simplifying validation by grouping related data.
 
     Args:
@@ -57,24 +96,110 @@ def get_unique_combinations(data: pd.DataFrame, fields: List[str]) -> pd.DataFra
     # Ensure fields are strings and drop duplicates
     fields = [str(field) for field in fields]
 
-    # Flatten all values in the DataFrame to ensure they are hashable
-    for col in data.columns:
-        data[col] = data[col].apply(make_hashable)
+    # Make values hashable, only in the object columns that hold unhashable values
+    unhashable_columns = [col for col in data.columns if data[col].dtype == object and not _is_hashable_column(data[col])]
+    if unhashable_columns:
+        data = data.assign(**{col: data[col].map(_make_value_hashable) for col in unhashable_columns})
+
+    # Get unique combinations of specified fields, with the first value and the number of distinct
+    # values of every other field
+    other_fields = [col for col in data.columns if col not in fields]
+    profiling.count("groupbys")
+    grouped = data.groupby(fields, dropna=False)[other_fields]
+    unique_combinations = grouped.first()
+    is_unique_per_group = grouped.nunique(dropna=False).max() == 1
+
+    # Set all other fields to None if they vary within any combination
+    for col in other_fields:
+        if not is_unique_per_group[col]:
+            unique_combinations[col] = None
+
+    return unique_combinations.reset_index()
+
+class CombinationTables:
+    """
+    Unique combinations of fields (with counts) of a single acquisition, computed once per field
+    tuple and shared between validators and validation models.
+
+    Notes:
+        - Tables are computed once and shared between validators and models; each validator is given
+          its own copy (see `_run_validator`), and each result its own copy of the dictionary form.
+        - A table for a subset of the fields of an existing table is projected from the smallest
+          such table rather than recomputed from the acquisition rows.
+        - The dictionary form of each table (as reported in validation results) is built once and
+          shared by all results that refer to it.
+
+    Args:
+        data (pd.DataFrame): The rows of the acquisition.
+
+    Attributes:
+        data (pd.DataFrame): The rows of the acquisition.
+    """
 
-    # Get unique combinations of specified fields
-    unique_combinations = data.groupby(fields, dropna=False).first().reset_index()
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._tables = {}
+        self._dicts = {}
 
-    # Set all other fields to None if they vary across the combinations
-    for col in data.columns:
-        if col not in fields:
-            # Check if the column has varying values within each group
-            is_unique_per_group = data.groupby(fields)[col].nunique(dropna=False).max() == 1
-            if not is_unique_per_group:
-                unique_combinations[col] = None
+    def get(self, field_names: Tuple[str, ...]) -> pd.DataFrame:
+        """
+        Get the unique combinations of `field_names` with a `Count` column.
+
+        Args:
+            field_names (Tuple[str, ...]): The fields to combine.
+
+        Returns:
+            pd.DataFrame: One row per unique combination of the fields, with its number of rows in `Count`.
+        """
+
+        field_names = tuple(field_names)
+        table = self._tables.get(field_names)
+        if table is None:
+            profiling.count("groupbys")
+            supersets = [
+                (len(table), table) for fields, table in self._tables.items() if set(field_names) <= set(fields)
+            ]
+            if supersets:
+                # Merge the rows of the smallest table that differ only in the other fields
+                _, superset = min(supersets, key=lambda item: item[0])
+                table = superset.groupby(list(field_names), dropna=False)["Count"].sum().reset_index()
             else:
-                unique_combinations[col] = data.groupby(fields)[col].first().values
+                table = (
+                    self.data.groupby(list(field_names), dropna=False)
+                    .size()
+                    .reset_index(name="Count")
+                )
+            self._tables[field_names] = table
+        return table
 
-    return unique_combinations
+    def get_dict(self, field_names: Tuple[str, ...]) -> Dict[str, List[Any]]:
+        """
+        Get the unique combinations of `field_names` as a dictionary of columns.
+
+        Args:
+            field_names (Tuple[str, ...]): The fields to combine.
+
+        Returns:
+            Dict[str, List[Any]]: `get(field_names).to_dict(orient="list")`, cached and shared between
+                callers, which must copy it before handing it out.
+        """
+
+        field_names = tuple(field_names)
+        table_dict = self._dicts.get(field_names)
+        if table_dict is None:
+            table_dict = self._dicts[field_names] = self.get(field_names).to_dict(orient="list")
+        return table_dict
+
+    def prepare(self, field_tuples: List[Tuple[str, ...]]):
+        """
+        Compute the tables of several field tuples, largest first so that smaller ones can be projected.
+
+        Args:
+            field_tuples (List[Tuple[str, ...]]): The field tuples to compute tables for.
+        """
+
+        for field_names in sorted(field_tuples, key=len, reverse=True):
+            self.get(field_names)
 
 class ValidationError(Exception):
     """
@@ -97,7 +222,9 @@ def validator(field_names: List[str], rule_message: str = "Validation rule appli
 
     Notes:
         - Decorated functions are automatically registered in `BaseValidationModel`.
-        - The rule will be applied to unique combinations of the specified fields.
+        - The rule will be applied to unique combinations of the specified fields, passed as a DataFrame
+          with a `Count` column. Each call receives its own copy, so the function may modify it, but
+          changes are not seen by other validators.
 
     Args:
         field_names (List[str]): The list of field names the rule applies to.
@@ -114,6 +241,28 @@ def validator(field_names: List[str], rule_message: str = "Validation rule appli
         return func
     return decorator
 
+def _run_validator(model: Any, validator_func: Callable, unique_combinations: pd.DataFrame) -> Tuple[bool, Optional[str], float]:
+    """
+    Run a single field validator on its own copy of the shared combination table, timing it.
+
+    Args:
+        model (BaseValidationModel): The model the validator belongs to.
+        validator_func (Callable): The validator function.
+        unique_combinations (pd.DataFrame): The unique combinations of the validator's fields.
+
+    Returns:
+        Tuple[bool, Optional[str], float]: Whether the validator passed, its error message, and its wall time in seconds.
+    """
+
+    start = time.perf_counter()
+    try:
+        # Pass a copy of the unique combinations with counts, so that the shared table cannot be modified
+        validator_func(model, unique_combinations.copy())
+        passed, message = True, None
+    except ValidationError as e:
+        passed, message = False, e.message
+    return passed, message, time.perf_counter() - start
+
 class BaseValidationModel:
     """
     Base class for defining and applying validation rules to DICOM sessions.
@@ -152,7 +301,13 @@ class BaseValidationModel:
             elif hasattr(attr_value, "_is_model_validator"):
                 cls._model_validators.append(attr_value)
 
-    def validate(self, data: pd.DataFrame) -> Tuple[bool, List[Dict[str, Any]], List[Dict[str, Any]]]:
+    def validate(
+        self,
+        data: pd.DataFrame,
+        tables: Optional[Dict[Any, CombinationTables]] = None,
+        executor: Optional[Executor] = None,
+        timings: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[bool, List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Validate the input DataFrame against the registered rules.
 
@@ -160,9 +315,20 @@ class BaseValidationModel:
             - Validations are performed for each unique acquisition in the DataFrame.
             - Field-level validations check unique combinations of specified fields.
             - Model-level validations apply to the entire dataset.
+            - Unique combination tables are computed once per acquisition and field tuple. Passing the
+              same `tables` to several calls shares them between validation models.
+            - With an `executor`, each (acquisition, validator) task is submitted to it; results are
+              still reported in rule order. A `ProcessPoolExecutor` requires the model class to be
+              importable by the worker processes.
 
         Args:
             data (pd.DataFrame): The input DataFrame containing DICOM session data.
+            tables (Optional[Dict[Any, CombinationTables]]): Combination tables keyed by acquisition,
+                reused and filled in by this call.
+            executor (Optional[Executor]): Executor to run validators on. Defaults to running them
+                in the calling thread.
+            timings (Optional[List[Dict[str, Any]]]): If given, the wall time of each validator is
+                appended to it as a dictionary with `acquisition`, `field`, `rule` and `seconds`.
 
         Returns:
             Tuple[bool, List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -182,58 +348,101 @@ class BaseValidationModel:
                     - message: None (indicating success).
                     - passed: True (indicating success).
         """
-        errors = []
-        passes = []
+        pending = self._submit_validation(data, tables=tables, executor=executor)
+        return self._collect_validation(pending, timings=timings)
+
+    def _submit_validation(
+        self,
+        data: pd.DataFrame,
+        tables: Optional[Dict[Any, CombinationTables]] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Start the validators of `validate`, without waiting for them when an executor is used.
+
+        Returns:
+            List[Tuple[Dict[str, Any], Any]]: In rule order, each result record with either a finished
+            `(passed, message, seconds)` tuple, a future for it, or None for a record that is already
+            complete.
+        """
+        pending = []
 
         # Field-level validation
-        for acquisition in data["Acquisition"].unique():
-            acquisition_data = data[data["Acquisition"] == acquisition]
+        profiling.count("groupbys")
+        for acquisition, acquisition_data in data.groupby("Acquisition", sort=False):
+            acquisition_tables = tables.get(acquisition) if tables is not None else None
+            if acquisition_tables is None:
+                acquisition_tables = CombinationTables(acquisition_data)
+                if tables is not None:
+                    tables[acquisition] = acquisition_tables
+
+            acquisition_tables.prepare([
+                field_names for field_names in self._field_validators
+                if all(field in acquisition_data.columns for field in field_names)
+            ])
+
             for field_names, validator_list in self._field_validators.items():
                 # Check for missing fields
                 missing_fields = [field for field in field_names if field not in acquisition_data.columns]
                 if missing_fields:
-                    errors.append({
+                    pending.append(({
                         "acquisition": acquisition,
                         "field": ", ".join(field_names),
                         "rule": validator_list[0]._rule_message,
                         "value": None,
                         "message": f"Missing fields: {', '.join(missing_fields)}.",
                         "passed": False,
-                    })
+                    }, None))
                     continue
 
-                # Filter the data to include only the requested fields
-                filtered_data = acquisition_data[list(field_names)].copy()
-
                 # Get unique combinations of requested fields with counts
-                unique_combinations = (
-                    filtered_data.groupby(list(field_names), dropna=False)
-                    .size()
-                    .reset_index(name="Count")
-                )
+                unique_combinations = acquisition_tables.get(field_names)
+                # The value payload is built once per field group; each result gets its own copy of the columns
+                value = acquisition_tables.get_dict(field_names)
 
-                # Iterate over all validators for the field group
+                # Start all validators for the field group
                 for validator_func in validator_list:
-                    try:
-                        # Pass the unique combinations with counts to the validator
-                        validator_func(self, unique_combinations)
-                        passes.append({
-                            "acquisition": acquisition,
-                            "field": ", ".join(field_names),
-                            "rule": validator_func._rule_message,
-                            "value": unique_combinations.to_dict(orient="list"),
-                            "message": None,
-                            "passed": True,
-                        })
-                    except ValidationError as e:
-                        errors.append({
-                            "acquisition": acquisition,
-                            "field": ", ".join(field_names),
-                            "rule": validator_func._rule_message,
-                            "value": unique_combinations.to_dict(orient="list"),
-                            "message": e.message,
-                            "passed": False,
-                        })
+                    record = {
+                        "acquisition": acquisition,
+                        "field": ", ".join(field_names),
+                        "rule": validator_func._rule_message,
+                        "value": {field: list(values) for field, values in value.items()},
+                    }
+                    if executor is None:
+                        pending.append((record, _run_validator(self, validator_func, unique_combinations)))
+                    else:
+                        pending.append((record, executor.submit(_run_validator, self, validator_func, unique_combinations)))
+
+        return pending
+
+    @staticmethod
+    def _collect_validation(
+        pending: List[Tuple[Dict[str, Any], Any]],
+        timings: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[bool, List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Wait for the validators started by `_submit_validation` and assemble the results of `validate`.
+        """
+        errors = []
+        passes = []
+
+        for record, result in pending:
+            if result is None:
+                errors.append(record)
+                continue
+            if isinstance(result, Future):
+                result = result.result()
+            passed, message, seconds = result
+
+            if timings is not None:
+                timings.append({
+                    "acquisition": record["acquisition"],
+                    "field": record["field"],
+                    "rule": record["rule"],
+                    "seconds": seconds,
+                })
+            record.update(message=message, passed=passed)
+            (passes if passed else errors).append(record)
 
         overall_success = len(errors) == 0
         return overall_success, errors, passes
@@ -0,0 +1,255 @@
+"""
+This module provides incremental compliance checks of a session directory that is still being
+written, such as an incoming directory that a scanner pushes slices into.
+
+"""
+
+import os
+import time
+import warnings
+import pandas as pd
+
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterator, Union
+
+from .cache import DicomHeaderCache
+from .io import assign_series, build_session_frame, load_dicom_files
+from .mapping import map_to_json_reference, map_to_python_reference
+from .compliance import check_session_compliance_with_json_reference, check_session_compliance_with_python_module
+from .reference import CompiledReference, compile_json_reference
+from .utils import clean_string, make_hashable
+from .validation import BaseValidationModel
+
+class SessionWatcher:
+    """
+    Incrementally load a session directory and re-check only the acquisitions that changed.
+
+    Notes:
+        - Each `poll` lists the directory (file metadata only) and parses only new files, once their
+          size and modification time are unchanged since the previous poll, so files that are still
+          being written are not read. Files are not re-read after they have been loaded.
+        - Files that cannot be loaded (e.g., a stray non-DICOM file) are skipped with a warning, and
+          retried only once their size or modification time changes.
+        - Rows are kept per acquisition. The acquisition label of each new file is computed as it
+          is loaded, and only acquisitions that received files are relabelled and have their series
+          reassigned.
+        - The automatic mapping is recomputed from one row per input series, and compliance is
+          re-checked only for the input acquisitions that changed or were mapped differently; the
+          issues of other acquisitions are reused. `compliance_summary` matches a full run of
+          `dcm-check-session --auto_yes` over the same files.
+
+    Args:
+        session_dir (str): Directory that DICOM files are written into.
+        acquisition_fields (List[str]): Fields used to uniquely identify each acquisition.
+        ref_session (Optional[Union[Dict[str, Any], CompiledReference]]): JSON reference session.
+        reference_fields (Optional[List[str]]): Fields of the JSON reference, used to assign series.
+        ref_models (Optional[Dict[str, BaseValidationModel]]): Python reference models, used instead
+            of a JSON reference.
+        fields (Optional[List[str]]): DICOM keywords to read from each file. Defaults to all elements.
+        cache (Optional[DicomHeaderCache]): Persistent header cache.
+
+    Attributes:
+        session_map (Dict): The current automatic mapping.
+        compliance_summary (List[Dict[str, Any]]): The current compliance issues, in mapping order.
+        n_files (int): The number of files loaded so far.
+    """
+
+    def __init__(
+        self,
+        session_dir: str,
+        acquisition_fields: List[str],
+        ref_session: Optional[Union[Dict[str, Any], CompiledReference]] = None,
+        reference_fields: Optional[List[str]] = None,
+        ref_models: Optional[Dict[str, BaseValidationModel]] = None,
+        fields: Optional[List[str]] = None,
+        cache: Optional[DicomHeaderCache] = None,
+    ):
+        if (ref_session is None) == (ref_models is None):
+            raise ValueError("Exactly one of ref_session or ref_models must be provided.")
+
+        self.session_dir = session_dir
+        self.acquisition_fields = list(acquisition_fields)
+        self.ref_session = None if ref_session is None else compile_json_reference(ref_session)
+        self.reference_fields = list(reference_fields or [])
+        self.ref_models = ref_models
+        self.fields = None if fields is None else sorted(set(fields) | set(self.acquisition_fields) | {"InstanceNumber"})
+        self.cache = cache
+
+        self.session_map = {}
+        self.compliance_summary = []
+        self.n_files = 0
+
+        self._pending: Dict[str, Tuple[int, int]] = {}
+        self._loaded: Set[str] = set()
+        self._failed: Dict[str, Tuple[int, int]] = {}
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._acquisitions: Dict[str, pd.DataFrame] = {}
+        self._series: Dict[str, pd.DataFrame] = {}
+        self._issues: Dict[Any, Tuple[Any, List[Dict[str, Any]]]] = {}
+
+    def scan(self) -> List[str]:
+        """
+        List the new files that are ready to be loaded.
+
+        Returns:
+            List[str]: Sorted paths of new files whose size and modification time did not change
+                since the previous scan, excluding files that failed to load and have not changed since.
+        """
+
+        ready = []
+        seen = {}
+        for root, _, files in os.walk(self.session_dir):
+            for file in files:
+                if not file.endswith((".dcm", ".IMA")):
+                    continue
+                path = os.path.join(root, file)
+                if path in self._loaded:
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                state = (stat.st_size, stat.st_mtime_ns)
+                if self._failed.get(path) == state:
+                    continue
+                self._failed.pop(path, None)
+                seen[path] = state
+                if self._pending.get(path) == seen[path]:
+                    ready.append(path)
+        self._pending = {path: state for path, state in seen.items() if path not in ready}
+        return sorted(ready)
+
+    def _acquisition_label(self, dicom_values: Dict[str, Any]) -> Optional[str]:
+        """
+        Compute the `Acquisition` label of a file as `load_dicom_session` does; None if a key value is missing.
+        """
+
+        values = []
+        for field in self.acquisition_fields:
+            value = make_hashable(dicom_values.get(field))
+            if value is None or (isinstance(value, float) and value != value):
+                return None
+            values.append(value)
+        return "acq-" + clean_string("-".join(str(value) for value in values))
+
+    def poll(self) -> Set[str]:
+        """
+        Load new files and update the mapping and compliance of the acquisitions they belong to.
+
+        Returns:
+            Set[str]: The labels of the acquisitions that received new files.
+        """
+
+        paths = self.scan()
+        if not paths:
+            return set()
+
+        changed = set()
+        for path in paths:
+            # Load files one at a time, so that one unreadable file does not stop the others
+            try:
+                dicom_values, = load_dicom_files([path], fields=self.fields, cache=self.cache)
+            except Exception as e:
+                warnings.warn(f"Skipping {path} until it changes; it could not be loaded: {e}")
+                try:
+                    stat = os.stat(path)
+                    self._failed[path] = (stat.st_size, stat.st_mtime_ns)
+                except FileNotFoundError:
+                    pass
+                continue
+            self._loaded.add(path)
+            self.n_files += 1
+            label = self._acquisition_label(dicom_values)
+            if label is None:
+                continue  # rows with missing acquisition fields are dropped, as in `load_dicom_session`
+            self._rows.setdefault(label, []).append(dicom_values)
+            changed.add(label)
+        if not changed:
+            return changed
+
+        for label in changed:
+            acquisition_df = build_session_frame(self._rows[label], self.acquisition_fields)
+            if self.ref_session is not None:
+                acquisition_df = assign_series(acquisition_df, self.acquisition_fields, self.reference_fields)
+                self._series[label] = acquisition_df.drop_duplicates(["Acquisition", "Series"])
+            else:
+                self._series[label] = acquisition_df.iloc[:1]
+            self._acquisitions[label] = acquisition_df
+
+        self._update_compliance(changed)
+        return changed
+
+    def _update_compliance(self, changed: Set[str]):
+        """
+        Recompute the mapping and re-check the input acquisitions that changed or were remapped.
+        """
+
+        series_df = pd.concat(list(self._series.values()), ignore_index=True)
+        if self.ref_session is not None:
+            session_map = map_to_json_reference(series_df, self.ref_session)
+        else:
+            session_map = map_to_python_reference(series_df, self.ref_models)
+
+        def input_acquisition(key, value):
+            return key[0] if self.ref_session is not None else value
+
+        stale = {
+            key: value for key, value in session_map.items()
+            if input_acquisition(key, value) in changed or self._issues.get(key, (None,))[0] != value
+        }
+
+        if stale and self.ref_session is not None:
+            labels = sorted({key[0] for key in stale})
+            issues = check_session_compliance_with_json_reference(
+                in_session=[self._acquisitions[label] for label in labels],
+                ref_session=self.ref_session,
+                session_map=stale,
+            )
+            grouped = {key: [] for key in stale}
+            for issue in issues:
+                grouped[tuple(issue["input acquisition"])].append(issue)
+            for key, value in stale.items():
+                self._issues[key] = (value, grouped[key])
+        elif stale:
+            for ref_acq_name, in_acq_name in stale.items():
+                issues = check_session_compliance_with_python_module(
+                    in_session=self._acquisitions[in_acq_name],
+                    ref_models=self.ref_models,
+                    session_map={ref_acq_name: in_acq_name},
+                )
+                self._issues[ref_acq_name] = (in_acq_name, issues)
+
+        self._issues = {key: self._issues[key] for key in session_map}
+        self.session_map = session_map
+        self.compliance_summary = [issue for key in session_map for issue in self._issues[key][1]]
+
+    @property
+    def session_df(self) -> pd.DataFrame:
+        """
+        The rows of all acquisitions loaded so far.
+        """
+
+        return pd.concat(list(self._acquisitions.values())) if self._acquisitions else pd.DataFrame()
+
+    def watch(self, poll_interval: float = 2.0, idle_timeout: Optional[float] = None) -> Iterator[Set[str]]:
+        """
+        Poll the directory until no new files arrive for `idle_timeout` seconds.
+
+        Args:
+            poll_interval (float): Seconds between polls.
+            idle_timeout (Optional[float]): Stop after this many seconds without new files.
+                Defaults to polling forever.
+
+        Yields:
+            Set[str]: The labels of the acquisitions that changed, after each poll that loaded files.
+        """
+
+        last_change = time.monotonic()
+        while True:
+            changed = self.poll()
+            if changed or self._pending:
+                last_change = time.monotonic()
+            if changed:
+                yield changed
+            elif idle_timeout is not None and time.monotonic() - last_change >= idle_timeout:
+                return
+            time.sleep(poll_interval)
@@ -61,20 +61,63 @@ async function initPyodide() {
     return pyodideInstance;
 }
 
-async function loadDICOMs(inputId) {
+async function readPrefix(file, length) {
+    const slice = file.slice(0, length);
+    return new Uint8Array(await slice.arrayBuffer());
+}
+
+async function loadDICOMSession(inputId, acquisitionFields) {
     const inputElement = document.getElementById(inputId);
     const files = inputElement.files;
     const dicomFiles = {};
+    const dicomHandles = {};
+    const fileSizes = {};
 
     for (let file of files) {
         if (file.name.endsWith(".dcm") || file.name.endsWith(".IMA")) {
-            const slice = file.slice(0, 4096);
-            const fileContent = new Uint8Array(await slice.arrayBuffer());
-            dicomFiles[file.webkitRelativePath] = fileContent;
+            dicomFiles[file.webkitRelativePath] = await readPrefix(file, 4096);
+            dicomHandles[file.webkitRelativePath] = file;
+            fileSizes[file.webkitRelativePath] = file.size;
         }
     }
 
-    return dicomFiles;
+    // Load the session into the Python global `in_session`, reading longer prefixes of the files
+    // whose headers do not fit in the first bytes and retrying until none remain
+    pyodide.globals.set("file_sizes", fileSizes);
+    pyodide.globals.set("acquisition_fields", acquisitionFields);
+    while (true) {
+        pyodide.globals.set("dicom_files", dicomFiles);
+        const bytesNeeded = JSON.parse(await pyodide.runPythonAsync(`
+            import json
+            from dicompare.io import load_dicom_session
+            try:
+                from dicompare.io import TruncatedHeaderError
+            except ImportError:
+                # Releases without truncation detection read the prefixes as they are
+                TruncatedHeaderError = None
+
+            bytes_needed = {}
+            if TruncatedHeaderError is None:
+                in_session = load_dicom_session(dicom_bytes=dicom_files, acquisition_fields=list(acquisition_fields))
+            else:
+                try:
+                    in_session = load_dicom_session(
+                        dicom_bytes=dicom_files,
+                        acquisition_fields=list(acquisition_fields),
+                        file_sizes=file_sizes,
+                    )
+                except TruncatedHeaderError as error:
+                    bytes_needed = error.files
+            json.dumps(bytes_needed)
+        `));
+
+        if (Object.keys(bytesNeeded).length === 0) {
+            return;
+        }
+        for (const [path, length] of Object.entries(bytesNeeded)) {
+            dicomFiles[path] = await readPrefix(dicomHandles[path], length);
+        }
+    }
 }
 
 tippy('.info-icon');
@@ -55,20 +55,30 @@ async function fmCheck_generateComplianceReport() {
     }
     pyodide.FS.writeFile(referenceFilePath.name, referenceFilePath.content);
 
-    fmCheck_btnGenCompliance.textContent = "Loading DICOMs...";
-    const dicomFiles = await loadDICOMs("fmCheck_selectDICOMs");
-
-    fmCheck_btnGenCompliance.textContent = "Generating initial mapping...";
-
-    pyodide.globals.set("dicom_files", dicomFiles);
     pyodide.globals.set("is_json", referenceFilePath.name.endsWith(".json"));
     pyodide.globals.set("ref_path", referenceFilePath.name);
 
     try {
+        fmCheck_btnGenCompliance.textContent = "Loading DICOMs...";
+        await loadDICOMSession("fmCheck_selectDICOMs", ["ProtocolName"]);
+
+        fmCheck_btnGenCompliance.textContent = "Generating initial mapping...";
         const mappingOutput = await pyodide.runPythonAsync(`
             import json
-            from dicompare.io import load_json_session, load_python_session, load_dicom_session
+            from dicompare.io import load_json_session, load_python_session
             from dicompare.mapping import map_to_json_reference
+            try:
+                from dicompare.io import assign_series
+            except ImportError:
+                # Releases without assign_series: number the series of each acquisition from 1 using the
+                # sorted group number of each (acquisition, reference values) combination
+                def assign_series(in_session, acquisition_fields, reference_fields):
+                    in_session = in_session.reset_index(drop=True)
+                    group_ids = in_session.groupby(acquisition_fields + reference_fields, dropna=False).ngroup()
+                    first_ids = group_ids.groupby([in_session[field] for field in acquisition_fields]).transform("min")
+                    in_session["Series"] = (group_ids - first_ids + 1).apply(lambda x: f"Series {x}")
+                    in_session.sort_values(by=["Acquisition", "Series"] + acquisition_fields + reference_fields, inplace=True)
+                    return in_session
         
             # Load the reference and input sessions
             if is_json:
@@ -77,11 +87,7 @@ async function fmCheck_generateComplianceReport() {
                 ref_models = load_python_session(module_path=ref_path)
                 ref_session = {"acquisitions": {k: {} for k in ref_models.keys()}}
             acquisition_fields = ["ProtocolName"]
-            
-            in_session = load_dicom_session(
-                dicom_bytes=dicom_files,
-                acquisition_fields=acquisition_fields
-            )
+
             if in_session is None:
                 raise ValueError("Failed to load the DICOM session. Ensure the input data is valid.")
             if in_session.empty:
@@ -91,19 +97,12 @@ async function fmCheck_generateComplianceReport() {
             input_acquisitions = list(in_session['Acquisition'].unique())
         
             if is_json:
-                in_session = in_session.reset_index(drop=True)  # Drop the index entirely
-
-                in_session["Series"] = (
-                    in_session.groupby(acquisition_fields).apply(
-                        lambda group: group.groupby(reference_fields, dropna=False).ngroup().add(1)
-                    ).reset_index(level=0, drop=True)  # Reset multi-index back to DataFrame
-                ).apply(lambda x: f"Series {x}")
-                in_session.sort_values(by=["Acquisition", "Series"] + acquisition_fields + reference_fields, inplace=True)
-
                 missing_fields = [field for field in reference_fields if field not in in_session.columns]
                 if missing_fields:
                     raise ValueError(f"Input session is missing required reference fields: {missing_fields}")
-                
+
+                in_session = assign_series(in_session, acquisition_fields, reference_fields)
+
                 session_map = map_to_json_reference(in_session, ref_session)
                 session_map_serializable = {
                     f"{key[0]}::{key[1]}": f"{value[0]}::{value[1]}"
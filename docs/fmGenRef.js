@@ -41,31 +41,23 @@ async function fmGenRef_genRef() {
     }
   }
 
-  btnGenJSON.textContent = "Loading DICOMs...";
-  const dicomFiles = await loadDICOMs("fmGenRef_DICOMs");
   const fmGenRef_acquisitionFields = tagInputfmGenRef_acquisitionFields.value.map(tag => tag.value);
   const fmGenRef_referenceFields = tagInputfmGenRef_referenceFields.value.map(tag => tag.value);
 
-  pyodide.globals.set("dicom_files", dicomFiles);
-  pyodide.globals.set("acquisition_fields", fmGenRef_acquisitionFields);
   pyodide.globals.set("reference_fields", fmGenRef_referenceFields);
 
-  btnGenJSON.textContent = "Generating JSON...";
-
   try {
+    btnGenJSON.textContent = "Loading DICOMs...";
+    await loadDICOMSession("fmGenRef_DICOMs", fmGenRef_acquisitionFields);
+
+    btnGenJSON.textContent = "Generating JSON...";
     const output = await pyodide.runPythonAsync(`
       import json
-      from dicompare import load_dicom_session
       from dicompare.cli.gen_session import create_json_reference
 
       acquisition_fields = list(acquisition_fields)
       reference_fields = list(reference_fields)
 
-      in_session = load_dicom_session(
-        dicom_bytes=dicom_files,
-        acquisition_fields=acquisition_fields,
-      )
-
       # Filter fields in DataFrame
       relevant_fields = set(acquisition_fields + reference_fields)
       in_session = in_session[list(relevant_fields.intersection(in_session.columns)) + ["Acquisition"]]
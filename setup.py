@@ -21,6 +21,8 @@ setup(
         "console_scripts": [
             "dcm-gen-session=dicompare.cli.gen_session:main",
             "dcm-check-session=dicompare.cli.check_session:main",
+            "dcm-check-batch=dicompare.cli.check_batch:main",
+            "dcm-serve=dicompare.cli.serve:main",
             "dicompare=dicompare.cli.start_web:main",
         ]
     },
@@ -31,7 +33,8 @@ setup(
         "scipy"
     ],
     extras_require={
-        "interactive": ["curses"]
+        "interactive": ["curses"],
+        "benchmark": ["pytest-benchmark"]
     },
     python_requires=">=3.10",
     classifiers=[